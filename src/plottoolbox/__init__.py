@@ -1,41 +1,69 @@
-"""Define plottoolbox package."""
+"""Define plottoolbox package.
 
-from ._functions.autocorrelation import autocorrelation
-from ._functions.bar import bar
-from ._functions.bar_stacked import bar_stacked
-from ._functions.barh import barh
-from ._functions.barh_stacked import barh_stacked
-from ._functions.bootstrap import bootstrap
-from ._functions.boxplot import boxplot
-from ._functions.double_mass import double_mass
-from ._functions.handh import handh
-from ._functions.heatmap import heatmap
-from ._functions.hexbin import hexbin
-from ._functions.histogram import histogram
-from ._functions.kde import kde
-from ._functions.kde_time import kde_time
-from ._functions.lag_plot import lag_plot
-from ._functions.lognorm_xaxis import lognorm_xaxis
-from ._functions.lognorm_yaxis import lognorm_yaxis
-from ._functions.norm_xaxis import norm_xaxis
-from ._functions.norm_yaxis import norm_yaxis
-from ._functions.probability_density import probability_density
-from ._functions.scatter_matrix import scatter_matrix
-from ._functions.target import target
-from ._functions.taylor import taylor
-from ._functions.time import time
-from ._functions.waterfall import waterfall
-from ._functions.weibull_xaxis import weibull_xaxis
-from ._functions.weibull_yaxis import weibull_yaxis
-from ._functions.xy import xy
-from .toolbox_utils.src.toolbox_utils.tsutils import about as _about
+The plot functions are loaded on first use so that `import plottoolbox` does
+not import matplotlib, pandas, scipy, and the other heavy dependencies of all
+of the plot types.
+"""
+
+import importlib
+
+# Name of each public function and the module it is defined in.
+_LAZY_FUNCTIONS = {
+    "autocorrelation": "._functions.autocorrelation",
+    "bar": "._functions.bar",
+    "bar_stacked": "._functions.bar_stacked",
+    "barh": "._functions.barh",
+    "barh_stacked": "._functions.barh_stacked",
+    "batch": "._functions.batch",
+    "bootstrap": "._functions.bootstrap",
+    "boxplot": "._functions.boxplot",
+    "double_mass": "._functions.double_mass",
+    "handh": "._functions.handh",
+    "heatmap": "._functions.heatmap",
+    "hexbin": "._functions.hexbin",
+    "histogram": "._functions.histogram",
+    "kde": "._functions.kde",
+    "kde_time": "._functions.kde_time",
+    "lag_plot": "._functions.lag_plot",
+    "lognorm_xaxis": "._functions.lognorm_xaxis",
+    "lognorm_yaxis": "._functions.lognorm_yaxis",
+    "norm_xaxis": "._functions.norm_xaxis",
+    "norm_yaxis": "._functions.norm_yaxis",
+    "probability_density": "._functions.probability_density",
+    "render_many": "._functions.batch",
+    "scatter_matrix": "._functions.scatter_matrix",
+    "target": "._functions.target",
+    "taylor": "._functions.taylor",
+    "time": "._functions.time",
+    "waterfall": "._functions.waterfall",
+    "weibull_xaxis": "._functions.weibull_xaxis",
+    "weibull_yaxis": "._functions.weibull_yaxis",
+    "xy": "._functions.xy",
+}
 
 
 def about():
     """Display version number and system information."""
+    from .toolbox_utils.src.toolbox_utils.tsutils import about as _about
+
     _about(__name__)
 
 
+def __getattr__(name):
+    """Import the module of a plot function the first time it is used."""
+    try:
+        module = _LAZY_FUNCTIONS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    function = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = function
+    return function
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_FUNCTIONS))
+
+
 __all__ = [
     "about",
     "autocorrelation",
@@ -43,6 +71,7 @@ __all__ = [
     "bar_stacked",
     "barh",
     "barh_stacked",
+    "batch",
     "bootstrap",
     "boxplot",
     "double_mass",
@@ -58,6 +87,7 @@ __all__ = [
     "norm_xaxis",
     "norm_yaxis",
     "probability_density",
+    "render_many",
     "scatter_matrix",
     "target",
     "taylor",
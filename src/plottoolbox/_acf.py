@@ -0,0 +1,54 @@
+"""Autocorrelation of a series using the FFT."""
+
+import numpy as np
+
+# Standard normal quantiles of the 95% and 99% confidence bands.
+Z95 = 1.959963984540054
+Z99 = 2.5758293035489004
+
+
+def acf(values, max_lag=None):
+    """Autocorrelation of `values` at lags 1 to `max_lag`.
+
+    The same estimate as pandas.plotting.autocorrelation_plot, the sum of the
+    products of the deviations from the mean at each lag divided by the sum
+    of the squared deviations, computed with a zero padded FFT.  Missing
+    values are left out of the mean and of the sums.  The default `max_lag`
+    of None is the number of values.
+    """
+    from scipy.fft import irfft, next_fast_len, rfft
+
+    values = np.asarray(values, dtype="float64")
+    nvalues = len(values)
+    max_lag = nvalues if max_lag is None else min(int(max_lag), nvalues)
+    valid = np.isfinite(values)
+    if not valid.any():
+        return np.full(max_lag, np.nan)
+    deviations = np.where(valid, values - values[valid].mean(), 0.0)
+    size = next_fast_len(2 * nvalues - 1, real=True)
+    spectrum = rfft(deviations, size)
+    sums = irfft(spectrum * np.conj(spectrum), size)[: max_lag + 1]
+    result = np.zeros(max_lag)
+    result[: nvalues - 1] = (sums[1:] / sums[0])[: nvalues - 1]
+    return result
+
+
+def autocorrelation_plot(values, ax, max_lag=None):
+    """Draw the autocorrelation of `values` and its confidence bands on `ax`.
+
+    Draws the same lines as pandas.plotting.autocorrelation_plot but only for
+    lags 1 to `max_lag`.  The bands use the number of values that are not
+    missing.
+    """
+    correlation = acf(values, max_lag=max_lag)
+    nvalid = np.isfinite(np.asarray(values, dtype="float64")).sum()
+    band = 1 / np.sqrt(max(nvalid, 1))
+    ax.axhline(y=Z99 * band, linestyle="--", color="grey")
+    ax.axhline(y=Z95 * band, color="grey")
+    ax.axhline(y=0.0, color="black")
+    ax.axhline(y=-Z95 * band, color="grey")
+    ax.axhline(y=-Z99 * band, linestyle="--", color="grey")
+    ax.set_xlabel("Lag")
+    ax.set_ylabel("Autocorrelation")
+    ax.plot(np.arange(1, len(correlation) + 1), correlation)
+    return ax
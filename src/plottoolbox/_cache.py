@@ -0,0 +1,505 @@
+"""Caches used to avoid repeated work when making plots."""
+
+import functools
+import glob
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import struct
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict
+
+from . import _plotutils
+
+RENDER_CACHE_KEY = "plottoolbox-cache-key"
+
+# Default maximum size of the on-disk render cache in bytes.
+RENDER_CACHE_MAXSIZE = 1024**3
+
+_render_cache_config = {
+    "directory": os.environ.get("PLOTTOOLBOX_RENDER_CACHE"),
+    "maxsize": int(
+        os.environ.get("PLOTTOOLBOX_RENDER_CACHE_MAXSIZE", RENDER_CACHE_MAXSIZE)
+    ),
+}
+
+# Default memory budget of the in-process parsed input cache in bytes.
+INPUT_CACHE_MAXSIZE = 256 * 1024**2
+
+_input_cache = OrderedDict()
+_input_cache_lock = threading.Lock()
+_input_cache_config = {
+    "maxsize": int(
+        os.environ.get("PLOTTOOLBOX_INPUT_CACHE_MAXSIZE", INPUT_CACHE_MAXSIZE)
+    ),
+}
+
+_sidecar_cache_config = {
+    "directory": os.environ.get("PLOTTOOLBOX_SIDECAR_CACHE"),
+    "verify": os.environ.get("PLOTTOOLBOX_SIDECAR_CACHE_VERIFY", "stat"),
+}
+
+
+def configure_render_cache(directory=None, maxsize=RENDER_CACHE_MAXSIZE):
+    """Turn on, change, or turn off (directory=None) the render cache.
+
+    The render cache can also be turned on with the PLOTTOOLBOX_RENDER_CACHE
+    environment variable set to the cache directory, with an optional size
+    limit in bytes in PLOTTOOLBOX_RENDER_CACHE_MAXSIZE.
+    """
+    _render_cache_config["directory"] = directory
+    _render_cache_config["maxsize"] = int(maxsize)
+
+
+def _hash_file(hasher, filename):
+    with open(filename, "rb") as fpi:
+        for block in iter(functools.partial(fpi.read, 1024 * 1024), b""):
+            hasher.update(block)
+
+
+def _hash_input(hasher, input_ts):
+    """Add the contents of `input_ts` to hasher.
+
+    Returns False if the input cannot be hashed, for example stdin, in which
+    case the plot is not cached.
+    """
+    if isinstance(input_ts, (list, tuple)):
+        return all(_hash_input(hasher, i) for i in input_ts)
+    if isinstance(input_ts, (str, os.PathLike)):
+        input_ts = os.fspath(input_ts)
+        if input_ts == "-" or not os.path.isfile(input_ts):
+            return False
+        hasher.update(input_ts.encode())
+        _hash_file(hasher, input_ts)
+        return True
+    try:
+        import pandas as pd
+    except ImportError:
+        return False
+    if isinstance(input_ts, (pd.DataFrame, pd.Series)):
+        hasher.update(repr(input_ts.dtypes).encode())
+        if isinstance(input_ts, pd.DataFrame):
+            hasher.update(repr(list(input_ts.columns)).encode())
+        else:
+            hasher.update(repr(input_ts.name).encode())
+        hasher.update(
+            pd.util.hash_pandas_object(input_ts, index=True).to_numpy().tobytes()
+        )
+        return True
+    return False
+
+
+def _hash_styles(hasher, plot_styles):
+    """Add the content of the matplotlib style sheets to hasher."""
+    import matplotlib.style
+
+    if isinstance(plot_styles, str):
+        plot_styles = plot_styles.split(",")
+    for style in list(plot_styles or []) + ["no-latex"]:
+        if style in matplotlib.style.library:
+            hasher.update(
+                repr(sorted(matplotlib.style.library[style].items())).encode()
+            )
+        elif os.path.isfile(str(style)):
+            _hash_file(hasher, style)
+        else:
+            hasher.update(str(style).encode())
+
+
+def _versions():
+    from importlib import metadata
+
+    versions = {}
+    for package in ("plottoolbox", "matplotlib", "pandas", "numpy"):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def _callable_name(value):
+    """Dotted name of a module level callable, None for lambdas and locals."""
+    module = getattr(value, "__module__", None)
+    name = getattr(value, "__qualname__", getattr(value, "__name__", None))
+    if module is None or name is None or "<" in name:
+        return None
+    return f"{module}.{name}"
+
+
+def render_key(func, args, kwds):
+    """Return the render cache key for func(*args, **kwds) or None.
+
+    The key is a hash of the input data, the normalized keyword arguments, the
+    style sheets and the library versions.  Callables are keyed by their
+    dotted name.  None is returned if any part cannot be hashed reliably.
+    """
+    bound = inspect.signature(func).bind(*args, **kwds)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    for name, param in inspect.signature(func).parameters.items():
+        if param.kind == param.VAR_KEYWORD:
+            arguments.update(arguments.pop(name, {}))
+    arguments.pop("ofilename", None)
+    arguments.pop("close", None)
+    for name, value in arguments.items():
+        if callable(value):
+            arguments[name] = _callable_name(value)
+            if arguments[name] is None:
+                return None
+
+    hasher = hashlib.blake2b(digest_size=20)
+    if not _hash_input(hasher, arguments.pop("input_ts", "-")):
+        return None
+    _hash_styles(hasher, arguments.get("plot_styles"))
+    hasher.update(
+        json.dumps(
+            [func.__name__, arguments, _versions()], sort_keys=True, default=repr
+        ).encode()
+    )
+    return hasher.hexdigest()
+
+
+def _key_metadata(key, ofilename):
+    """Metadata that embeds the cache key in the supported output formats."""
+    ext = os.path.splitext(ofilename)[1].lower()
+    if ext == ".png":
+        return {RENDER_CACHE_KEY: key}
+    if ext == ".pdf":
+        return {"Keywords": f"{RENDER_CACHE_KEY}:{key}"}
+    if ext == ".svg":
+        return {"Identifier": f"{RENDER_CACHE_KEY}:{key}"}
+    return None
+
+
+def read_png_key(filename):
+    """Return the render cache key stored in a PNG file, or None."""
+    with open(filename, "rb") as fpi:
+        if fpi.read(8) != b"\x89PNG\r\n\x1a\n":
+            return None
+        while True:
+            header = fpi.read(8)
+            if len(header) < 8:
+                return None
+            length, ctype = struct.unpack(">I4s", header)
+            if ctype in (b"IDAT", b"IEND"):
+                return None
+            data = fpi.read(length)
+            fpi.read(4)
+            if ctype == b"tEXt":
+                keyword, _, text = data.partition(b"\x00")
+            elif ctype == b"zTXt":
+                keyword, _, text = data.partition(b"\x00")
+                text = zlib.decompress(text[1:])
+            elif ctype == b"iTXt":
+                keyword, _, text = data.partition(b"\x00")
+                text = text[2:].split(b"\x00", 2)[2]
+            else:
+                continue
+            if keyword.decode("latin-1") == RENDER_CACHE_KEY:
+                return text.decode("utf-8")
+
+
+def _evict(directory, maxsize):
+    """Remove least recently used entries until the cache fits in maxsize."""
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and not entry.name.startswith("."):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(i[1] for i in entries)
+    for _, size, path in sorted(entries):
+        if total <= maxsize:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def _store(directory, key, ofilename, maxsize):
+    ext = os.path.splitext(ofilename)[1].lower()
+    fd, tmpname = tempfile.mkstemp(dir=directory, prefix=".", suffix=ext)
+    os.close(fd)
+    shutil.copyfile(ofilename, tmpname)
+    os.replace(tmpname, os.path.join(directory, key + ext))
+    _evict(directory, maxsize)
+
+
+def render_cache(func):
+    """Decorator to reuse a previously rendered plot for identical calls.
+
+    Only active if a cache directory is configured, either with the
+    PLOTTOOLBOX_RENDER_CACHE environment variable or `configure_render_cache`,
+    and the call writes to an `ofilename` and does not keep the figure open.
+    On a cache hit the stored image is copied to `ofilename` and nothing is
+    rendered.  Calls that use the cache always return None, whether the plot
+    is rendered or copied.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwds):
+        directory = _render_cache_config["directory"]
+        if directory is None:
+            return func(*args, **kwds)
+
+        bound = inspect.signature(func).bind(*args, **kwds)
+        bound.apply_defaults()
+        ofilename = bound.arguments.get("ofilename")
+        close = bound.arguments.get("close")
+        if not isinstance(ofilename, (str, os.PathLike)) or _plotutils.keep_open(
+            ofilename, close
+        ):
+            return func(*args, **kwds)
+
+        key = render_key(func, args, kwds)
+        if key is None:
+            return func(*args, **kwds)
+
+        ext = os.path.splitext(ofilename)[1].lower()
+        cached = os.path.join(directory, key + ext)
+        if os.path.isfile(cached) and (ext != ".png" or read_png_key(cached) == key):
+            shutil.copyfile(cached, ofilename)
+            os.utime(cached)
+            return None
+
+        token = _plotutils.savefig_kwds.set({"metadata": _key_metadata(key, ofilename)})
+        try:
+            func(*args, **kwds)
+        finally:
+            _plotutils.savefig_kwds.reset(token)
+
+        os.makedirs(directory, exist_ok=True)
+        _store(directory, key, ofilename, _render_cache_config["maxsize"])
+        return None
+
+    return wrapper
+
+
+def configure_input_cache(maxsize=INPUT_CACHE_MAXSIZE):
+    """Set the memory budget in bytes of the parsed input cache.
+
+    A maxsize of 0 turns off the cache.  The budget can also be set with the
+    PLOTTOOLBOX_INPUT_CACHE_MAXSIZE environment variable.
+    """
+    with _input_cache_lock:
+        _input_cache_config["maxsize"] = int(maxsize)
+        _trim_input_cache()
+
+
+def clear_input_cache():
+    """Remove all parsed inputs from the in-process cache."""
+    with _input_cache_lock:
+        _input_cache.clear()
+
+
+def _trim_input_cache():
+    total = sum(nbytes for _, nbytes in _input_cache.values())
+    while _input_cache and total > _input_cache_config["maxsize"]:
+        _, (_, nbytes) = _input_cache.popitem(last=False)
+        total -= nbytes
+
+
+def configure_sidecar_cache(directory=None, verify="stat"):
+    """Turn on, change, or turn off (directory=None) the sidecar cache.
+
+    Parsed inputs are written as Feather files to `directory` and read back,
+    memory mapped, by later processes while the source file is unchanged.  If
+    `verify` is "stat" the source is unchanged if the modification time and
+    size are the same, if "hash" the contents have to be the same.
+
+    Can also be set with the PLOTTOOLBOX_SIDECAR_CACHE and
+    PLOTTOOLBOX_SIDECAR_CACHE_VERIFY environment variables.  Requires
+    pyarrow.
+    """
+    if verify not in ("stat", "hash"):
+        from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+        raise ValueError(
+            tsutils.error_wrapper(f"""
+                The `verify` argument must be "stat" or "hash".  You gave
+                {verify}.
+                """)
+        )
+    _sidecar_cache_config["directory"] = directory
+    _sidecar_cache_config["verify"] = verify
+
+
+def _sidecar_names(input_tsd, skiprows, names, index_type, clean):
+    """Return the prefix common to all sidecars of input_tsd and the sidecar."""
+    source = hashlib.blake2b(digest_size=16)
+    source.update(
+        json.dumps(
+            [os.path.abspath(input_tsd), skiprows, names, index_type, clean],
+            default=repr,
+        ).encode()
+    )
+    version = hashlib.blake2b(digest_size=16)
+    if _sidecar_cache_config["verify"] == "hash":
+        _hash_file(version, input_tsd)
+    else:
+        stat = os.stat(input_tsd)
+        version.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode())
+    prefix = os.path.join(_sidecar_cache_config["directory"], source.hexdigest())
+    return prefix, f"{prefix}-{version.hexdigest()}.feather"
+
+
+def _sidecar_read(sidecar):
+    import pandas as pd
+    from pyarrow import feather
+
+    table = feather.read_table(sidecar, memory_map=True)
+    tsd = table.to_pandas()
+    freq = (table.schema.metadata or {}).get(b"plottoolbox_freq")
+    if freq and isinstance(tsd.index, pd.DatetimeIndex):
+        try:
+            tsd.index.freq = freq.decode()
+        except ValueError:
+            pass
+    return tsd
+
+
+def _sidecar_write(tsd, prefix, sidecar):
+    import pyarrow as pa
+    from pyarrow import feather
+
+    if not all(isinstance(i, str) for i in tsd.columns):
+        return
+    table = pa.Table.from_pandas(tsd, preserve_index=True)
+    freq = getattr(tsd.index, "freqstr", None)
+    if freq:
+        table = table.replace_schema_metadata(
+            {**table.schema.metadata, b"plottoolbox_freq": freq.encode()}
+        )
+    os.makedirs(_sidecar_cache_config["directory"], exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(
+        dir=_sidecar_cache_config["directory"], prefix=".", suffix=".feather"
+    )
+    os.close(fd)
+    try:
+        feather.write_feather(table, tmpname)
+        os.replace(tmpname, sidecar)
+    finally:
+        if os.path.exists(tmpname):
+            os.remove(tmpname)
+    # Sidecars of older versions of the source can never be used again.
+    for stale in glob.glob(glob.escape(prefix) + "-*.feather"):
+        if stale != sidecar:
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass
+
+
+def _parse_input(input_tsd, skiprows, names, index_type, clean):
+    """Read and parse `input_tsd` without any selection of columns or dates.
+
+    If the sidecar cache is turned on, a previously parsed copy of an
+    unchanged `input_tsd` is read from the cache directory instead.
+    """
+    from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+    sidecar = None
+    if _sidecar_cache_config["directory"] is not None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            prefix, sidecar = _sidecar_names(
+                input_tsd, skiprows, names, index_type, clean
+            )
+            if os.path.isfile(sidecar):
+                try:
+                    return _sidecar_read(sidecar)
+                except (OSError, ValueError):
+                    pass
+
+    tsd = tsutils.common_kwds(
+        input_tsd,
+        skiprows=skiprows,
+        names=names,
+        index_type=index_type,
+        clean=clean,
+        dropna="no",
+    )
+
+    if sidecar is not None:
+        try:
+            _sidecar_write(tsd, prefix, sidecar)
+        except (OSError, ValueError, TypeError):
+            pass
+    return tsd
+
+
+def common_kwds(
+    input_tsd=None,
+    skiprows=None,
+    names=None,
+    index_type="datetime",
+    clean=False,
+    **kwds,
+):
+    """Cached replacement of tsutils.common_kwds for the plot functions.
+
+    Files are read and parsed once per (path, mtime, size, skiprows, names,
+    index_type, clean) and kept in an in-process LRU cache limited by memory
+    use, and if turned on, in the on-disk sidecar cache.  The column, date,
+    units, and missing value selection is then done on a copy of the parsed
+    DataFrame.  Any other input, for example stdin or a DataFrame, goes
+    straight to tsutils.common_kwds.
+    """
+    from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+    if (
+        not isinstance(input_tsd, (str, os.PathLike))
+        or os.fspath(input_tsd) == "-"
+        or not os.path.isfile(input_tsd)
+        or (
+            _input_cache_config["maxsize"] <= 0
+            and _sidecar_cache_config["directory"] is None
+        )
+    ):
+        return tsutils.common_kwds(
+            input_tsd,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            clean=clean,
+            **kwds,
+        )
+
+    if _input_cache_config["maxsize"] <= 0:
+        tsd = _parse_input(input_tsd, skiprows, names, index_type, clean)
+        return tsutils.common_kwds(tsd, index_type=index_type, **kwds)
+
+    stat = os.stat(input_tsd)
+    key = json.dumps(
+        [
+            os.path.abspath(input_tsd),
+            stat.st_mtime_ns,
+            stat.st_size,
+            skiprows,
+            names,
+            index_type,
+            clean,
+        ],
+        default=repr,
+    )
+    with _input_cache_lock:
+        cached = _input_cache.get(key)
+        if cached is not None:
+            _input_cache.move_to_end(key)
+    if cached is None:
+        tsd = _parse_input(input_tsd, skiprows, names, index_type, clean)
+        cached = (tsd, int(tsd.memory_usage(index=True, deep=True).sum()))
+        with _input_cache_lock:
+            _input_cache[key] = cached
+            _trim_input_cache()
+
+    return tsutils.common_kwds(cached[0].copy(), index_type=index_type, **kwds)
@@ -0,0 +1,273 @@
+"""Reduce the points of line traces to what the output resolution can show."""
+
+import numpy as np
+
+DECIMATE_METHODS = ("auto", "minmax", "lttb", None)
+
+
+def _pixel_size(ax):
+    """Width and height of the axes in pixels of the saved figure."""
+    import matplotlib
+
+    width, height = ax.bbox.width, ax.bbox.height
+    dpi = matplotlib.rcParams["savefig.dpi"]
+    if dpi != "figure":
+        width, height = width * dpi / ax.figure.dpi, height * dpi / ax.figure.dpi
+    return max(int(np.ceil(width)), 1), max(int(np.ceil(height)), 1)
+
+
+def _ends_in_bin(indices, bins):
+    """Return the first and last of `indices` within each run of `bins`."""
+    if len(indices) == 0:
+        return indices, indices
+    ibins = bins[indices]
+    change = ibins[1:] != ibins[:-1]
+    first = indices[np.concatenate(([True], change))]
+    last = indices[np.concatenate((change, [True]))]
+    return first, last
+
+
+def _bins(x, xlim, nbins):
+    """Pixel column of each x, with points outside `xlim` in two extra bins."""
+    lo, hi = min(xlim), max(xlim)
+    if not np.isfinite(lo) or not np.isfinite(hi) or hi <= lo:
+        lo, hi = np.nanmin(x), np.nanmax(x)
+    if hi <= lo:
+        return np.zeros(len(x), dtype=np.int64)
+    x = np.nan_to_num(x, nan=lo)
+    bins = np.floor((x - lo) / (hi - lo) * nbins).astype(np.int64) + 1
+    return np.clip(bins, 0, nbins + 1)
+
+
+def minmax_indices(x, y, nbins, xlim=None):
+    """Indices of the points to keep from a trace sorted by x.
+
+    In each of `nbins` pixel columns keeps the first, last, minimum, and
+    maximum point, and the first missing value after each valid value so that
+    gaps still break the line.
+    """
+    bins = _bins(x, xlim if xlim is not None else (np.nan, np.nan), nbins)
+    valid = np.isfinite(y)
+    vindex = np.flatnonzero(valid)
+    first, last = _ends_in_bin(vindex, bins)
+
+    keep = [first, last]
+    if len(vindex):
+        vbins = bins[vindex]
+        starts = np.flatnonzero(np.concatenate(([True], vbins[1:] != vbins[:-1])))
+        yvalid = y[vindex]
+        for reducer in (np.minimum, np.maximum):
+            extreme = reducer.reduceat(yvalid, starts)
+            counts = np.diff(np.append(starts, len(vindex)))
+            hits = vindex[yvalid == np.repeat(extreme, counts)]
+            keep.append(_ends_in_bin(hits, bins)[0])
+
+    gaps = np.flatnonzero(~valid & np.concatenate(([False], valid[:-1])))
+    keep.append(_ends_in_bin(gaps, bins)[0])
+    return np.unique(np.concatenate(keep))
+
+
+def _lttb_segment(x, y, npoints):
+    """Largest triangle three buckets selection of a trace without gaps."""
+    n = len(x)
+    if npoints >= n or npoints < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, npoints - 1).astype(np.int64)
+    keep = np.empty(npoints, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = n - 1
+    previous = 0
+    for bucket in range(npoints - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        nstart, nstop = stop, edges[bucket + 2] if bucket + 2 < len(edges) else n
+        nx = x[nstart:nstop].mean() if nstop > nstart else x[-1]
+        ny = y[nstart:nstop].mean() if nstop > nstart else y[-1]
+        px, py = x[previous], y[previous]
+        area = np.abs(
+            (px - nx) * (y[start:stop] - py) - (px - x[start:stop]) * (ny - py)
+        )
+        previous = start + int(np.argmax(area))
+        keep[bucket + 1] = previous
+    return keep
+
+
+def lttb_indices(x, y, npoints):
+    """Indices of the points to keep from a trace using LTTB.
+
+    Each run of valid values is reduced separately, with `npoints` shared
+    between runs by length, and the first missing value of each gap is kept so
+    that gaps still break the line.
+    """
+    valid = np.isfinite(x) & np.isfinite(y)
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], valid, [False]))))
+    starts, stops = edges[::2], edges[1::2]
+    total = valid.sum()
+    keep = [np.flatnonzero(~valid & np.concatenate(([False], valid[:-1])))]
+    for start, stop in zip(starts, stops):
+        share = int(np.ceil(npoints * (stop - start) / total))
+        keep.append(start + _lttb_segment(x[start:stop], y[start:stop], share))
+    return np.unique(np.concatenate(keep))
+
+
+def pixel_indices(x, y, xlim, ylim, size, consecutive=False):
+    """Indices of the points to keep so that each falls in its own pixel.
+
+    The pixel grid of `size` (width, height) spans `xlim` and `ylim` with
+    points outside in a border of extra pixels.  If `consecutive` only points
+    in the same pixel as the point before them are dropped, which keeps the
+    path of a line and its gaps, otherwise one point of each pixel is kept.
+    The first and last points are always kept.
+    """
+    valid = np.isfinite(x) & np.isfinite(y)
+    columns = _bins(np.where(valid, x, np.nan), xlim, size[0])
+    rows = _bins(np.where(valid, y, np.nan), ylim, size[1])
+    key = np.where(valid, rows * (size[0] + 2) + columns, -1)
+    if consecutive:
+        keep = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+    else:
+        vindex = np.flatnonzero(valid)
+        keep = vindex[np.unique(key[vindex], return_index=True)[1]]
+    return np.unique(np.concatenate((keep, [0, len(x) - 1])))
+
+
+def _check_method(method):
+    """Return the decimation method, None for no decimation."""
+    if method in (None, "None", "none", ""):
+        return None
+    if method not in DECIMATE_METHODS:
+        from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "decimate" keyword must be one of {DECIMATE_METHODS}.  You
+                gave {method}.
+                """
+            )
+        )
+    return method
+
+
+def _indices(method, x, y, nbins, xlim=None):
+    """Indices of the points of one trace to keep with `method`.
+
+    With `xlim` the points are reduced for that window of x.  "lttb" then
+    keeps the points in the window, with the one on each side, and the
+    first and last points.
+    """
+    if method == "lttb":
+        if xlim is None:
+            return lttb_indices(x, y, 2 * nbins)
+        start = max(np.searchsorted(x, min(xlim), side="left") - 1, 0)
+        stop = min(np.searchsorted(x, max(xlim), side="right") + 1, len(x))
+        keep = np.arange(start, stop)
+        if stop - start > 2:
+            keep = start + lttb_indices(x[start:stop], y[start:stop], 2 * nbins)
+        return np.union1d(keep, [0, len(x) - 1])
+    return minmax_indices(x, y, nbins, xlim=xlim)
+
+
+def _frame_xlim(index, x, xlim):
+    """Return `xlim` in the units of `x`, filling missing limits from `x`."""
+    import pandas as pd
+
+    if xlim is None:
+        xlim = [None, None]
+    limits = [x[0], x[-1]]
+    for side, value in enumerate(xlim):
+        if value is None:
+            continue
+        if isinstance(index, pd.DatetimeIndex):
+            value = pd.Timestamp(value)
+            if index.tz is not None and value.tz is None:
+                value = value.tz_localize(index.tz)
+            value = pd.DatetimeIndex([value]).astype(index.dtype).asi8[0]
+        limits[side] = float(value)
+    return limits
+
+
+def decimate_frame(tsd, ax, method="auto", logy=False, xlim=None):
+    """Return the rows of `tsd` needed to draw its columns as lines on `ax`.
+
+    The rows kept are the union of the points kept for each column, reduced
+    for the window `xlim` of the index if given.  A DatetimeIndex with a
+    frequency is returned as a PeriodIndex so that pandas still plots and
+    labels the x axis as a regular time series.
+    """
+    import pandas as pd
+
+    method = _check_method(method)
+    nbins = _pixel_size(ax)[0]
+    if method is None or len(tsd) <= 4 * nbins:
+        return tsd
+
+    index = tsd.index
+    if isinstance(index, pd.DatetimeIndex):
+        x = index.asi8.astype("float64")
+    elif pd.api.types.is_numeric_dtype(index.dtype):
+        x = index.to_numpy(dtype="float64")
+    else:
+        return tsd
+    if not index.is_monotonic_increasing:
+        return tsd
+
+    xlim = _frame_xlim(index, x, xlim)
+    keep = []
+    for column in range(len(tsd.columns)):
+        y = tsd.iloc[:, column].to_numpy(dtype="float64", na_value=np.nan)
+        if logy and method == "lttb":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                y = np.log10(y)
+        keep.append(_indices(method, x, y, nbins, xlim=xlim))
+    reduced = tsd.iloc[np.unique(np.concatenate(keep))]
+
+    if isinstance(index, pd.DatetimeIndex):
+        freq = index.freq or index.inferred_freq
+        if freq is not None:
+            try:
+                reduced.index = reduced.index.to_period(freq)
+            except (TypeError, ValueError):
+                pass
+    return reduced
+
+
+def decimate_lines(ax, method="auto"):
+    """Reduce the points of each line in `ax` to what its pixels can show.
+
+    Lines without markers that are sorted along x are reduced with `method`,
+    "minmax", "lttb", or "auto" for "minmax".  Other lines only drop points
+    that fall in the same pixel as the point before them, and markers without
+    a line keep one marker in each pixel.  The first and last points are
+    always kept.  Points are binned in the scaled space of the axes, for
+    example the logarithm of x for a log x axis.  With "auto" lines with an
+    alpha are not changed since overlapping points would show.
+    """
+    method = _check_method(method)
+    if method is None:
+        return ax
+
+    size = _pixel_size(ax)
+    xscale = ax.xaxis.get_transform()
+    yscale = ax.yaxis.get_transform()
+    xlim = xscale.transform(ax.get_xlim())
+    ylim = yscale.transform(ax.get_ylim())
+    for line in ax.get_lines():
+        xy = line.get_xydata()
+        if len(xy) <= 4 * size[0]:
+            continue
+        if method == "auto" and line.get_alpha() is not None:
+            continue
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = xscale.transform(xy[:, 0])
+            y = yscale.transform(xy[:, 1])
+        has_marker = line.get_marker() not in (None, "None", "", " ")
+        has_line = line.get_linestyle() not in (None, "None", "", " ")
+        fx = x[np.isfinite(x)]
+        if has_line and not has_marker and np.all(fx[1:] >= fx[:-1]):
+            y = np.where(np.isfinite(x), y, np.nan)
+            keep = _indices(method, x, y, size[0], xlim=xlim)
+            keep = np.union1d(keep, [0, len(x) - 1])
+        else:
+            keep = pixel_indices(x, y, xlim, ylim, size, consecutive=has_line)
+        line.set_data(xy[keep, 0], xy[keep, 1])
+    return ax
@@ -5,12 +5,10 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
-from pandas.plotting import autocorrelation_plot
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _acf, _cache, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -19,6 +17,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def autocorrelation(
     input_ts="-",
@@ -47,6 +47,8 @@ def autocorrelation(
     source_units=None,
     target_units=None,
     plot_styles="bright",
+    max_lag=None,
+    close=None,
 ):
     r"""[time index, 1 column] Autocorrelation plot.
 
@@ -89,10 +91,17 @@ def autocorrelation(
     ${source_units}
     ${target_units}
     ${plot_styles}
+    max_lag : int
+        [optional, default is None]
+
+        The largest lag to calculate and plot.  The default of None plots all
+        lags up to the length of the time-series.
+
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -115,12 +124,11 @@ def autocorrelation(
     lnames = tsutils.make_list(legend_names)
     tsd, lnames = _plotutils.check_column_legend(plottype, tsd, lnames)
 
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
-    autocorrelation_plot(tsd, ax=ax)
+    _acf.autocorrelation_plot(tsd.iloc[:, 0], ax, max_lag=max_lag)
     # This is to help pretty print the frequency
     try:
         tsd = tsutils.asbest_freq(tsd)
@@ -134,20 +142,17 @@ def autocorrelation(
         short_freq = ""
     xtitle = xtitle or f"Time Lag {short_freq}"
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
-    plt.xticks(rotation=xlabel_rotation)
-    plt.yticks(rotation=ylabel_rotation)
+    ax.tick_params(axis="x", labelrotation=xlabel_rotation)
+    ax.tick_params(axis="y", labelrotation=ylabel_rotation)
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
+    ax.set_title(title)
 
-    plt.xlim(xlim)
-    plt.ylim(ylim)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
 
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
@@ -6,11 +6,11 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
+from matplotlib.artist import setp
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -22,6 +22,8 @@ warnings.filterwarnings("ignore")
 _plotutils.HATCH_LIST = ["/", "\\", "|", "-", "+", "x", "o", "O", ".", "*"]
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def barh_stacked(
     input_ts="-",
@@ -70,6 +72,7 @@ def barh_stacked(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    close=None,
     **kwds,
 ):
     r"""[category index, N columns] Horizontal stacked bar plot.
@@ -124,10 +127,11 @@ def barh_stacked(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -175,11 +179,9 @@ def barh_stacked(
         bar_hatchstyles = tsutils.make_list(bar_hatchstyles)
     ibar_hatchstyles = itertools.cycle(bar_hatchstyles)
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
     stacked = True
     kind = "barh"
@@ -226,10 +228,10 @@ def barh_stacked(
             else:
                 nticklabels.append(i.get_text()[:endchar])
         taxis.set_ticklabels(nticklabels)
-        plt.setp(taxis.get_majorticklabels(), rotation=label_rotation)
+        setp(taxis.get_majorticklabels(), rotation=label_rotation)
 
     if legend:
-        plt.legend(loc="best")
+        ax.legend(loc="best")
 
     if hlines_y is not None:
         hlines_y = tsutils.make_list(hlines_y)
@@ -254,7 +256,7 @@ def barh_stacked(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
     if hlines_y is not None:
-        plt.hlines(
+        ax.hlines(
             hlines_y,
             hlines_xmin,
             hlines_xmax,
@@ -262,7 +264,7 @@ def barh_stacked(
             linestyles=hlines_linestyles,
         )
     if vlines_x is not None:
-        plt.vlines(
+        ax.vlines(
             vlines_x,
             vlines_ymin,
             vlines_ymax,
@@ -270,18 +272,15 @@ def barh_stacked(
             linestyles=vlines_linestyles,
         )
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
@@ -0,0 +1,344 @@
+"""Make many plots from a manifest in one process."""
+
+import csv
+import json
+import os
+import shutil
+import time as _time
+import traceback
+
+from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+PLOT_TYPES = [
+    "autocorrelation",
+    "bar",
+    "bar_stacked",
+    "barh",
+    "barh_stacked",
+    "bootstrap",
+    "boxplot",
+    "double_mass",
+    "handh",
+    "heatmap",
+    "hexbin",
+    "histogram",
+    "kde",
+    "kde_time",
+    "lag_plot",
+    "lognorm_xaxis",
+    "lognorm_yaxis",
+    "norm_xaxis",
+    "norm_yaxis",
+    "probability_density",
+    "scatter_matrix",
+    "target",
+    "taylor",
+    "time",
+    "waterfall",
+    "weibull_xaxis",
+    "weibull_yaxis",
+    "xy",
+]
+
+
+def _convert(value):
+    """Convert a string from a CSV manifest to a Python value."""
+    if value in ("True", "False", "None"):
+        return {"True": True, "False": False, "None": None}[value]
+    for converter in (int, float):
+        try:
+            return converter(value)
+        except ValueError:
+            pass
+    return value
+
+
+def read_manifest(manifest):
+    """Read a TOML, JSON, or CSV manifest and return a list of plot specs.
+
+    Each plot spec is a dictionary with the plot "type" and the keyword
+    arguments for that plot function.
+    """
+    ext = os.path.splitext(manifest)[1].lower()
+    if ext == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            import tomli as tomllib
+        with open(manifest, "rb") as fpi:
+            specs = tomllib.load(fpi)
+    elif ext == ".json":
+        with open(manifest, encoding="utf-8") as fpi:
+            specs = json.load(fpi)
+    elif ext == ".csv":
+        with open(manifest, newline="", encoding="utf-8") as fpi:
+            specs = [
+                {key: _convert(value) for key, value in row.items() if value != ""}
+                for row in csv.DictReader(fpi)
+            ]
+    else:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The manifest must be a TOML (.toml), JSON (.json), or CSV
+                (.csv) file.  You gave {manifest}.
+                """
+            )
+        )
+    if isinstance(specs, dict):
+        specs = specs.get("plot", specs.get("plots", []))
+    return [dict(spec) for spec in specs]
+
+
+def _spec_key(spec):
+    """Key identifying specs that write the same bytes.
+
+    The ofilename is left out except for its extension, which sets the
+    output format.
+    """
+    ext = os.path.splitext(str(spec.get("ofilename", "")))[1].lower()
+    spec = {key: value for key, value in spec.items() if key != "ofilename"}
+    return json.dumps([ext, spec], sort_keys=True, default=repr)
+
+
+def render_spec(spec):
+    """Make the plot described by spec and close its figure.
+
+    Returns a report dictionary with the "status", "seconds", and "error" of
+    the plot.  Other figures of the calling process are left open.
+    """
+    import plottoolbox
+
+    spec = dict(spec)
+    plottype = spec.pop("type", None)
+    start = _time.perf_counter()
+    report = {
+        "type": plottype,
+        "ofilename": spec.get("ofilename"),
+        "status": "ok",
+        "seconds": 0.0,
+        "error": "",
+    }
+    try:
+        if plottype not in PLOT_TYPES:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The plot type must be one of {PLOT_TYPES}.  You gave
+                    {plottype}.
+                    """
+                )
+            )
+        if spec.get("ofilename") is None:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    """
+                    Each plot in a batch needs an "ofilename".
+                    """
+                )
+            )
+        fig = getattr(plottoolbox, plottype)(**spec)
+        if fig is not None:
+            import matplotlib.pyplot as plt
+
+            plt.close(fig)
+    except Exception as exc:
+        report["status"] = "error"
+        report["error"] = " ".join(
+            "".join(traceback.format_exception_only(type(exc), exc)).split()
+        )
+    report["seconds"] = round(_time.perf_counter() - start, 4)
+    return report
+
+
+def group_specs(specs):
+    """Order and deduplicate plot specs.
+
+    Returns a list of (index, spec, duplicate_of) in rendering order.  Specs
+    are grouped by input so that each input is read once, and a spec that
+    makes the same plot as an earlier one has `duplicate_of` set to the index
+    of that earlier spec.
+    """
+    order = sorted(
+        range(len(specs)), key=lambda i: (str(specs[i].get("input_ts", "-")), i)
+    )
+    seen = {}
+    grouped = []
+    for index in order:
+        key = _spec_key(specs[index])
+        grouped.append((index, specs[index], seen.get(key)))
+        seen.setdefault(key, index)
+    return grouped
+
+
+def _init_worker(plottypes):
+    """Load pandas, matplotlib, styles, and fonts once per worker process.
+
+    Only the modules of `plottypes` are loaded.  A plot type that fails to
+    load is left for render_spec to report for its own specs.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    import pandas  # noqa: F401
+
+    import plottoolbox
+
+    for plottype in plottypes:
+        try:
+            getattr(plottoolbox, plottype)
+        except Exception:
+            pass
+    fig = plt.figure()
+    fig.text(0.5, 0.5, "warm up")
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _duplicate_report(index, spec, source):
+    """Report for a spec that makes the same plot as the `source` report."""
+    report = {
+        "index": index,
+        "type": spec.get("type"),
+        "ofilename": spec.get("ofilename"),
+        "status": "duplicate",
+        "seconds": 0.0,
+        "error": source["error"],
+    }
+    if source["status"] == "error":
+        report["status"] = "error"
+    elif source["ofilename"] != spec.get("ofilename"):
+        try:
+            shutil.copyfile(source["ofilename"], spec["ofilename"])
+        except (OSError, TypeError) as exc:
+            report["status"] = "error"
+            report["error"] = str(exc)
+    return report
+
+
+def render_many(specs, workers=None):
+    """Make many plots in parallel using a pool of worker processes.
+
+    Each spec is a dictionary with the plot "type", for example "time", an
+    "ofilename", and any other keyword arguments of that plot type.  Specs
+    that make the same plot are rendered once and the image is copied.
+
+    Parameters
+    ----------
+    specs : list
+        List of plot spec dictionaries.
+    workers : int
+        [optional, default is None]
+
+        Number of worker processes.  The default of None uses the number of
+        CPUs.  If 1 all plots are made in the calling process.
+
+    Yields
+    ------
+    dict
+        Report for each plot as it completes with keys "index" (position in
+        `specs`), "type", "ofilename", "status", "seconds", and "error".  The
+        "status" is "ok", "error", or "duplicate".
+    """
+    specs = [dict(spec) for spec in specs]
+    duplicates = {}
+    unique = []
+    for index, spec, duplicate_of in group_specs(specs):
+        if duplicate_of is None:
+            unique.append(index)
+        else:
+            duplicates.setdefault(duplicate_of, []).append(index)
+
+    def finish(index, report):
+        yield {"index": index, **report}
+        for dindex in duplicates.get(index, []):
+            yield _duplicate_report(dindex, specs[dindex], report)
+
+    if workers == 1:
+        for index in unique:
+            yield from finish(index, render_spec(specs[index]))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    plottypes = sorted({specs[index].get("type") for index in unique} & set(PLOT_TYPES))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(plottypes,)
+    ) as pool:
+        futures = {pool.submit(render_spec, specs[index]): index for index in unique}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                report = future.result()
+            except Exception as exc:
+                report = {
+                    "type": specs[index].get("type"),
+                    "ofilename": specs[index].get("ofilename"),
+                    "status": "error",
+                    "seconds": 0.0,
+                    "error": repr(exc),
+                }
+            yield from finish(index, report)
+
+
+def batch(manifest, report=None, workers=1):
+    """[manifest] Make many plots in one process.
+
+    Makes all of the plots listed in a manifest, reading each input file
+    once and rendering identical plots only once.  Avoids the start up time
+    of a separate `plottoolbox` process for every plot.
+
+    The manifest is a TOML, JSON, or CSV file.  Each plot is described by
+    the plot "type", for example "time" or "norm_yaxis", an "ofilename", and
+    any other keyword arguments of that plot type.
+
+    TOML manifests have a `[[plot]]` table for each plot::
+
+        [[plot]]
+        type = "time"
+        input_ts = "flow.csv"
+        ofilename = "flow_time.png"
+
+        [[plot]]
+        type = "norm_yaxis"
+        input_ts = "flow.csv"
+        ofilename = "flow_norm.png"
+
+    JSON manifests are a list of objects, or an object with a "plots" list.
+    CSV manifests have a header line with "type", "ofilename", and the other
+    keyword names, and one plot per row where empty cells use the default.
+
+    Parameters
+    ----------
+    manifest : str
+        Path to the TOML, JSON, or CSV manifest.
+    report : str
+        [optional, default is None]
+
+        If given, the CSV report of all plots is also written to this file.
+    workers : int
+        [optional, default is 1]
+
+        Number of worker processes to make the plots.  The default of 1 makes
+        all plots in this process.  If 0 uses the number of CPUs.
+
+    Returns
+    -------
+    list
+        One report dictionary for each plot in manifest order with keys
+        "index", "type", "ofilename", "status", "seconds", and "error".  The
+        "status" is "ok", "error", or "duplicate".
+    """
+    specs = read_manifest(manifest)
+
+    reports = sorted(
+        render_many(specs, workers=workers or None), key=lambda i: i["index"]
+    )
+
+    if report is not None and reports:
+        with open(report, "w", newline="", encoding="utf-8") as fpo:
+            writer = csv.DictWriter(fpo, fieldnames=list(reports[0]))
+            writer.writeheader()
+            writer.writerows(reports)
+    return reports
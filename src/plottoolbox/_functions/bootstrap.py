@@ -5,12 +5,11 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
-from pandas.plotting import bootstrap_plot
+import numpy as np
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -19,7 +18,100 @@ matplotlib.use("Agg")
 
 warnings.filterwarnings("ignore")
 
+# Largest number of resampled values held in memory at once.
+BLOCK_VALUES = 2**22
 
+_STATISTICS = ("mean", "median", "midrange", "std", "min", "max")
+
+
+def _check_statistics(statistics):
+    """Return the list of statistic names, raising ValueError if unknown.
+
+    Besides the names in _STATISTICS a statistic can be "p" followed by a
+    percentile from 0 to 100, for example "p5" or "p97.5".
+    """
+    statistics = tsutils.make_list(statistics) or ["mean", "median", "midrange"]
+    for statistic in statistics:
+        statistic = str(statistic)
+        if statistic in _STATISTICS:
+            continue
+        try:
+            percentile = float(statistic[1:]) if statistic[:1] == "p" else None
+        except ValueError:
+            percentile = None
+        if percentile is None or not 0 <= percentile <= 100:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    f"""
+                    The bootstrap statistics must be from {_STATISTICS} or "p"
+                    followed by a percentile from 0 to 100, for example "p95".
+                    You gave {statistic}.
+                    """
+                )
+            )
+    return [str(i) for i in statistics]
+
+
+def _label(statistic):
+    """Axis label of `statistic`."""
+    if statistic[0] == "p":
+        return f"{statistic[1:]}th percentile"
+    return statistic.capitalize()
+
+
+def _statistics(samples, statistics):
+    """Return a dict of each statistic of each row of the 2D `samples`."""
+    result = {}
+    percentiles = [i for i in statistics if i == "median" or i[0] == "p"]
+    if percentiles:
+        values = np.percentile(
+            samples,
+            [50.0 if i == "median" else float(i[1:]) for i in percentiles],
+            axis=1,
+        )
+        result.update(zip(percentiles, values))
+    if "mean" in statistics:
+        result["mean"] = samples.mean(axis=1)
+    if "std" in statistics:
+        result["std"] = samples.std(axis=1, ddof=1 if samples.shape[1] > 1 else 0)
+    if {"min", "max", "midrange"} & set(statistics):
+        result["min"] = samples.min(axis=1)
+        result["max"] = samples.max(axis=1)
+        result["midrange"] = (result["min"] + result["max"]) * 0.5
+    return {i: result[i] for i in statistics}
+
+
+def _bootstrap(values, size, samples, statistics, seed=None):
+    """Statistics of `samples` resamples of `size` of the `values`.
+
+    The resamples are drawn with replacement as rows of indices from one
+    numpy Generator seeded with `seed`, in blocks of at most BLOCK_VALUES
+    values.  The Generator draws the same indices whatever the block size, so
+    the same seed always gives the same statistics.
+    """
+    values = np.asarray(values, dtype="float64")
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                There are no values to bootstrap.
+                """
+            )
+        )
+    rng = np.random.default_rng(seed)
+    rows = max(1, BLOCK_VALUES // size)
+    result = {i: np.empty(samples) for i in statistics}
+    for start in range(0, samples, rows):
+        stop = min(start + rows, samples)
+        block = values[rng.integers(0, len(values), (stop - start, size))]
+        for statistic, value in _statistics(block, statistics).items():
+            result[statistic][start:stop] = value
+    return result
+
+
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def bootstrap(
     input_ts="-",
@@ -43,6 +135,8 @@ def bootstrap(
     style="auto",
     bootstrap_size=50,
     bootstrap_samples=500,
+    bootstrap_statistics="mean,median,midrange",
+    seed=None,
     grid=False,
     por=False,
     invert_xaxis=False,
@@ -62,6 +156,7 @@ def bootstrap(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    close=None,
     **kwds,
 ):
     r"""[1 column] Bootstrap plots a randomly selected subset of the input series.
@@ -122,6 +217,20 @@ def bootstrap(
 
         The number of samples in the bootstrap.
 
+    bootstrap_statistics : str or list
+        [optional, default is "mean,median,midrange"]
+
+        The statistics of each sample to plot, a column of two plots for
+        each.  Any of "mean", "median", "midrange", "std", "min", "max", or
+        "p" followed by a percentile, for example "p5" or "p97.5".
+
+    seed : int
+        [optional, default is None]
+
+        The seed of the random selections.  The same seed always draws the
+        same samples.  With the default the samples are different every
+        time.
+
     ${grid}
 
     ${por}
@@ -157,10 +266,11 @@ def bootstrap(
     ${vlines_colors}
 
     ${vlines_linestyles}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -196,13 +306,30 @@ def bootstrap(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+
+    statistics = _check_statistics(bootstrap_statistics)
+    results = _bootstrap(
+        tsd.iloc[:, 0].to_numpy(dtype="float64", na_value=np.nan),
+        int(bootstrap_size),
+        int(bootstrap_samples),
+        statistics,
+        seed=None if seed is None else int(seed),
+    )
 
-    bootstrap_plot(tsd, size=bootstrap_size, samples=bootstrap_samples, color="gray")
+    # Same layout as pandas.plotting.bootstrap_plot, a column per statistic.
+    nstatistics = len(statistics)
+    for column, statistic in enumerate(statistics):
+        ax = fig.add_subplot(2, nstatistics, column + 1)
+        ax.set_xlabel("Sample")
+        ax.plot(np.arange(len(results[statistic])), results[statistic], color="gray")
+        ax.tick_params(labelsize=8)
+    for column, statistic in enumerate(statistics):
+        ax = fig.add_subplot(2, nstatistics, nstatistics + column + 1)
+        ax.set_xlabel(_label(statistic))
+        ax.hist(results[statistic], color="gray")
+        ax.tick_params(labelsize=8)
 
     if hlines_y is not None:
         hlines_y = tsutils.make_list(hlines_y)
@@ -227,18 +354,16 @@ def bootstrap(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    if xtitle:
+        ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
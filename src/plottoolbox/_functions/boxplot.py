@@ -5,11 +5,11 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils, _sketch, _stream
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -19,6 +19,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def boxplot(
     input_ts="-",
@@ -63,6 +65,9 @@ def boxplot(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    boxplot_mode="exact",
+    chunksize=None,
+    close=None,
     **kwds,
 ):
     r"""[N columns] Box and whiskers plot.
@@ -117,11 +122,44 @@ def boxplot(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    boxplot_mode : str
+        [optional, default is "exact"]
+
+        With "exact" every value is kept and sorted.  With "sketch" the
+        quartiles are estimated from a quantile sketch of at most a few tens
+        of thousands of values for each column, and the 1000 smallest and
+        largest values are kept exactly for the whiskers and the fliers, so
+        the memory used does not grow with the length of the data.  Fliers
+        nearer the whiskers are thinned.  The statistics are exact for up to
+        4096 values.  Needed with chunksize.
+    ${chunksize}
+    ${close}
     """
 
-    # set up dataframe
-    tsd = tsutils.common_kwds(
+    if boxplot_mode not in ("exact", "sketch"):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "boxplot_mode" keyword must be "exact" or "sketch".  You
+                gave {boxplot_mode}.
+                """
+            )
+        )
+    if chunksize is not None and boxplot_mode != "sketch":
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                Reading the input in chunks needs boxplot_mode="sketch".
+                """
+            )
+        )
+
+    # set up dataframe, in sketch mode only its header, adding each block of
+    # the input to the sketch of each column
+    sketches = None
+    for block in _stream.read_chunks(
         input_ts,
+        chunksize=chunksize,
         skiprows=skiprows,
         names=names,
         index_type=index_type,
@@ -134,7 +172,15 @@ def boxplot(
         target_units=target_units,
         clean=clean,
         por=por,
-    )
+    ):
+        if boxplot_mode == "exact":
+            tsd = block
+            break
+        if sketches is None:
+            tsd = block.iloc[:0]
+            sketches = [_sketch.BoxSketch() for _ in block.columns]
+        for box, (_, values) in zip(sketches, block.items()):
+            box.update(values.to_numpy(dtype="float64", na_value=np.nan))
 
     # Need to work around some old option defaults with the implementation of
     # cltoolbox
@@ -160,13 +206,23 @@ def boxplot(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
-    tsd.boxplot(figsize=figsize)
+    if sketches is None:
+        tsd.boxplot(ax=ax)
+    else:
+        # Draw the sketched statistics like DataFrame.boxplot.
+        bp = ax.bxp(
+            [box.stats(label=label) for box, label in zip(sketches, tsd.columns)]
+        )
+        cycle = [i["color"] for i in matplotlib.rcParams["axes.prop_cycle"]]
+        matplotlib.artist.setp(bp["boxes"], color=cycle[0], alpha=1)
+        matplotlib.artist.setp(bp["whiskers"], color=cycle[0], alpha=1)
+        matplotlib.artist.setp(bp["medians"], color=cycle[2 % len(cycle)], alpha=1)
+        matplotlib.artist.setp(bp["caps"], color="k", alpha=1)
+        ax.set_xticks(range(1, len(sketches) + 1), tsd.columns, rotation=0)
 
     if hlines_y is not None:
         hlines_y = tsutils.make_list(hlines_y)
@@ -191,18 +247,15 @@ def boxplot(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
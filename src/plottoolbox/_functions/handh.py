@@ -1,18 +1,20 @@
 import sys
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from matplotlib import gridspec
+from matplotlib.artist import setp
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def handh(
     input_ts="-",
@@ -61,6 +63,7 @@ def handh(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles=None,
+    close=None,
 ):
     r"""[time index, Q, P] Hydrograph and hyetograph time-series plot.
 
@@ -123,10 +126,11 @@ def handh(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -178,17 +182,14 @@ def handh(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
 
-    plt.figure(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
 
     gs = gridspec.GridSpec(2, 1, height_ratios=[1, 2])
 
     # HYDROGRAM CHART
-    ax = plt.subplot(gs[1])
+    ax = fig.add_subplot(gs[1])
     tsd[0].plot(ax=ax, kind="time", logy=logy)
     ax.set_ylabel("Q", color="b")
     ax.set_xlabel("Time")
@@ -198,16 +199,17 @@ def handh(
     ax.set_ylim(0, max(tsd[0]) * 1.2)
 
     # PRECIPITATION/HYETOGRAPH CHART
-    ax2 = plt.subplot(gs[0])
+    ax2 = fig.add_subplot(gs[0])
     tsd[1].plot(ax=ax2, kind="bar", color="#b0c4de")
     ax2.xaxis.grid(b=True, which="major", color=".7", linestyle="-")
     ax2.yaxis.grid(b=True, which="major", color="0.7", linestyle="-")
     ax2.set_ylabel("P")
-    plt.setp(ax2.get_xticklabels(), visible=False)
+    setp(ax2.get_xticklabels(), visible=False)
 
-    plt.tight_layout()
     ax2.invert_yaxis()
-    plt.gcf().subplots_adjust(bottom=0.15)
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    with _plotutils.draw_lock:
+        fig.tight_layout()
+        fig.subplots_adjust(bottom=0.15)
+    return _plotutils.save_figure(
+        fig, ofilename=ofilename, close=close, tight_layout=False
+    )
@@ -5,13 +5,14 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
 import numpy as np
 import pandas as pd
+from matplotlib.colors import Normalize
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils, _stream
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -21,6 +22,58 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+def _cell_keys(index, cells):
+    """Integer key of the heatmap cell of each time in `index`.
+
+    A "daily" cell is the day of the year, so February 29 is column 59 of a
+    leap year and the last column of a 365 day year is missing, and an
+    "hourly" cell is the hour of the day of each day.
+    """
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                The "heatmap" plot type needs a time series with a datetime
+                index.
+                """
+            )
+        )
+    if cells == "daily":
+        return (
+            index.year.to_numpy(dtype=np.int64) * 366 + index.dayofyear.to_numpy() - 1
+        )
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return np.asarray(
+        (index - pd.Timestamp("1970-01-01")) // pd.Timedelta(hours=1), dtype=np.int64
+    )
+
+
+def _cell_image(keys, values, cells):
+    """Return the first row or column and the image of the cell `values`.
+
+    For "daily" cells the image is year by day of the year starting at the
+    returned year, and for "hourly" cells hour of the day by day starting at
+    the returned day from 1970-01-01.
+    """
+    if cells == "daily":
+        rows, columns = keys // 366, keys % 366
+        first = rows.min()
+        rows = rows - first
+        shape = (rows.max() + 1, 366)
+    else:
+        rows, columns = keys % 24, keys // 24
+        first = columns.min()
+        columns = columns - first
+        shape = (24, columns.max() + 1)
+    image = np.full(shape, np.nan)
+    valid = np.isfinite(values)
+    image[rows[valid], columns[valid]] = values[valid]
+    return first, image
+
+
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.transform_args(figsize=tsutils.make_list)
 @tsutils.doc(_plotutils.ldocstrings)
 def heatmap(
@@ -62,12 +115,20 @@ def heatmap(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    heatmap_cells="daily",
+    heatmap_reducer="mean",
+    heatmap_panels="stacked",
+    chunksize=None,
+    close=None,
     **kwds,
 ):
-    r"""[time index(day), 1 column] 2D heatmap of daily data.
+    r"""[time index, N columns] 2D heatmap of daily or hourly values.
 
     "heatmap" creates a 2D heatmap of daily data, day of year x-axis, and year
-    for y-axis.  Only available for a single, daily time-series.
+    for y-axis, or of hourly data, day x-axis, and hour of the day y-axis.
+    Data at a finer time step is reduced to the daily or hourly cells as it
+    is read.  Each column is drawn in its own panel with a shared color
+    scale.
 
     Parameters
     ----------
@@ -109,11 +170,52 @@ def heatmap(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    heatmap_cells : str
+        [optional, default is "daily"]
+
+        The cells of the heatmap, "daily" for year by day of the year or
+        "hourly" for hour of the day by day.
+
+    heatmap_reducer : str
+        [optional, default is "mean"]
+
+        How the values in each cell are combined, one of "mean", "sum",
+        "min", "max", "count", or "std".
+
+    heatmap_panels : str
+        [optional, default is "stacked"]
+
+        How the panels of more than one column are arranged, "stacked" in one
+        column or "grid" for a grid of about as many rows as columns.
+    ${chunksize}
+    ${close}
     """
 
-    # set up dataframe
-    tsd = tsutils.common_kwds(
+    if heatmap_cells not in ("daily", "hourly"):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "heatmap_cells" keyword must be "daily" or "hourly".  You
+                gave {heatmap_cells}.
+                """
+            )
+        )
+    if heatmap_panels not in ("stacked", "grid"):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "heatmap_panels" keyword must be "stacked" or "grid".  You
+                gave {heatmap_panels}.
+                """
+            )
+        )
+    _stream.check_reducer(heatmap_reducer, _stream.EXACT_REDUCERS)
+
+    # set up dataframe, reducing each block of the input to the cells
+    tsd = None
+    for chunk in _stream.read_chunks(
         input_ts,
+        chunksize=chunksize,
         skiprows=skiprows,
         names=names,
         index_type=index_type,
@@ -126,7 +228,23 @@ def heatmap(
         target_units=target_units,
         clean=clean,
         por=por,
-    )
+    ):
+        if tsd is None:
+            tsd = chunk.iloc[:0]
+            cells = _stream.BinnedReducer(len(chunk.columns), heatmap_reducer)
+        cells.add(
+            _cell_keys(chunk.index, heatmap_cells),
+            chunk.to_numpy(dtype="float64", na_value=np.nan),
+        )
+    keys, values = cells.result()
+    if len(keys) == 0:
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                The "heatmap" plot type needs at least one value to plot.
+                """
+            )
+        )
 
     # Need to work around some old option defaults with the implementation of
     # cltoolbox
@@ -148,55 +266,65 @@ def heatmap(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    npanels = len(tsd.columns)
+    fig = _plotutils.new_figure(
+        ofilename,
+        close,
+        figsize=figsize,
+        layout="constrained" if npanels > 1 else None,
+    )
+    if heatmap_panels == "grid":
+        ncols = int(np.ceil(np.sqrt(npanels)))
+        nrows = int(np.ceil(npanels / ncols))
+    else:
+        nrows, ncols = npanels, 1
+    grid_axes = fig.subplots(nrows, ncols, sharex=True, sharey=True, squeeze=False)
+    for ax in grid_axes.flat[npanels:]:
+        ax.set_visible(False)
+    axes = grid_axes.flat[:npanels]
 
-    # Find beginning and end years
-    byear = tsd.index[0].year
-    eyear = tsd.index[-1].year
-    tsd = tsutils.asbestfreq(tsd)
-    if tsd.index.freqstr != "D":
-        raise ValueError(
-            tsutils.error_wrapper(
-                """
-                The "heatmap" plot type can only work with daily time series.
-                """
+    finite = values[np.isfinite(values)]
+    norm = Normalize(vmin=finite.min(), vmax=finite.max())
+    for ax, column_values, lname in zip(axes, values, lnames):
+        first, cell_image = _cell_image(keys, column_values, heatmap_cells)
+        if heatmap_cells == "daily":
+            image = ax.imshow(cell_image, interpolation=None, aspect="auto", norm=norm)
+            yticks = list(range(first, first + len(cell_image)))
+            skip = len(yticks) // 20 + 1
+            ax.set_yticks(range(0, len(yticks), skip), yticks[::skip])
+            mnths = [0, 30, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+            mnths_labels = [
+                "Jan",
+                "Feb",
+                "Mar",
+                "Apr",
+                "May",
+                "Jun",
+                "Jul",
+                "Aug",
+                "Sep",
+                "Oct",
+                "Nov",
+                "Dec",
+            ]
+            ax.set_xticks(mnths, mnths_labels)
+        else:
+            start = mdates.date2num(
+                np.datetime64("1970-01-01") + np.timedelta64(int(first), "D")
             )
-        )
-    dr = pd.date_range(f"{byear}-01-01", f"{eyear}-12-31", freq="D")
-    ntsd = tsd.reindex(index=dr)
-    groups = ntsd.iloc[:, 0].groupby(pd.Grouper(freq="A"))
-    years = pd.DataFrame()
-    for name, group in groups:
-        ngroup = group.values
-        if len(group.values) == 365:
-            ngroup = np.append(group.values, [np.nan])
-        years[name.year] = ngroup
-    years = years.T
-    plt.imshow(years, interpolation=None, aspect="auto")
-    plt.colorbar()
-    yticks = list(range(byear, eyear + 1))
-    skip = len(yticks) // 20 + 1
-    plt.yticks(range(0, len(yticks), skip), yticks[::skip])
-    mnths = [0, 30, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
-    mnths_labels = [
-        "Jan",
-        "Feb",
-        "Mar",
-        "Apr",
-        "May",
-        "Jun",
-        "Jul",
-        "Aug",
-        "Sep",
-        "Oct",
-        "Nov",
-        "Dec",
-    ]
-    plt.xticks(mnths, mnths_labels)
+            image = ax.imshow(
+                cell_image,
+                interpolation=None,
+                aspect="auto",
+                norm=norm,
+                extent=(start, start + cell_image.shape[1], 24, 0),
+            )
+            ax.xaxis_date()
+            ax.set_yticks(range(0, 25, 6))
+        if npanels > 1:
+            ax.set_title(lname)
+    fig.colorbar(image, ax=grid_axes if npanels > 1 else ax)
     grid = False
 
     if hlines_y is not None:
@@ -222,18 +350,20 @@ def heatmap(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    for ax in axes:
+        ax.set_xlabel(xtitle)
+        ax.set_ylabel(ytitle)
+        ax.grid(grid)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
-
-    plt.grid(grid)
+        ax.invert_yaxis()
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    if npanels == 1:
+        ax.set_title(title)
+    else:
+        fig.suptitle(title)
+    return _plotutils.save_figure(
+        fig, ofilename=ofilename, close=close, tight_layout=npanels == 1
+    )
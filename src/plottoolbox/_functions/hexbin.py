@@ -1,16 +1,17 @@
 """Collection of functions for the manipulation of time series."""
 
+import itertools
 import sys
 import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils, _stream
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -19,6 +20,114 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+# Reducers computed by binning instead of calling reduce_C_function once for
+# each hexagon.
+_NAMED_REDUCERS = {
+    np.mean: "mean",
+    np.sum: "sum",
+    np.min: "min",
+    np.max: "max",
+    np.amin: "min",
+    np.amax: "max",
+    np.std: "std",
+    np.median: "median",
+    len: "count",
+}
+
+
+def _reducer_name(reduce_C_function):
+    """Name of the binned reducer for `reduce_C_function`, None if a callable."""
+    if isinstance(reduce_C_function, str):
+        name = reduce_C_function
+        for prefix in ("numpy.", "np."):
+            if name.startswith(prefix):
+                name = name[len(prefix) :]
+        return _stream.check_reducer({"amin": "min", "amax": "max"}.get(name, name))
+    return _NAMED_REDUCERS.get(reduce_C_function)
+
+
+def _hex_size(gridsize):
+    """Number of hexagons in x and y like matplotlib.axes.Axes.hexbin."""
+    gridsize = tsutils.make_list(gridsize)
+    if len(gridsize) > 1:
+        return int(gridsize[0]), int(gridsize[1])
+    return int(gridsize[0]), int(int(gridsize[0]) / np.sqrt(3))
+
+
+def _nonsingular(lo, hi, expander=0.1):
+    """Widen a range of one value like matplotlib.transforms.nonsingular."""
+    largest = max(abs(lo), abs(hi))
+    if largest < 1e6 / 1e-15 * np.finfo(float).tiny:
+        return -expander, expander
+    if hi - lo <= largest * 1e-15:
+        return lo - expander * abs(lo), hi + expander * abs(hi)
+    return lo, hi
+
+
+def _hex_extent(x, y):
+    """Extent of the hexagons for `x` and `y` like Axes.hexbin."""
+    if len(x) == 0:
+        return 0, 1, 0, 1
+    xmin, xmax = _nonsingular(np.min(x), np.max(x))
+    ymin, ymax = _nonsingular(np.min(y), np.max(y))
+    return xmin, xmax, ymin, ymax
+
+
+def _hex_lattice(extent, size):
+    """Lower left corner and spacing of the hexagons, padded like Axes.hexbin."""
+    xmin, xmax, ymin, ymax = extent
+    padding = 1.0e-9 * (xmax - xmin)
+    xmin, xmax = xmin - padding, xmax + padding
+    return xmin, ymin, (xmax - xmin) / size[0], (ymax - ymin) / size[1]
+
+
+def _hex_index(x, y, extent, size):
+    """Index of the hexagon of each point, -1 outside of `extent`.
+
+    The hexagons are numbered in the order of Axes.hexbin, the nx + 1 by
+    ny + 1 lattice of hexagons with centers on the corners of the grid and
+    then the nx by ny lattice with centers in the middle of the grid.
+    """
+    nx, ny = size
+    xmin, ymin, sx, sy = _hex_lattice(extent, size)
+    ix = (x - xmin) / sx
+    iy = (y - ymin) / sy
+    ix1 = np.round(ix).astype(np.int64)
+    iy1 = np.round(iy).astype(np.int64)
+    ix2 = np.floor(ix).astype(np.int64)
+    iy2 = np.floor(iy).astype(np.int64)
+    inside1 = (0 <= ix1) & (ix1 <= nx) & (0 <= iy1) & (iy1 <= ny)
+    inside2 = (0 <= ix2) & (ix2 < nx) & (0 <= iy2) & (iy2 < ny)
+    distance1 = (ix - ix1) ** 2 + 3.0 * (iy - iy1) ** 2
+    distance2 = (ix - ix2 - 0.5) ** 2 + 3.0 * (iy - iy2 - 0.5) ** 2
+    return np.where(
+        distance1 < distance2,
+        np.where(inside1, ix1 * (ny + 1) + iy1, -1),
+        np.where(inside2, (nx + 1) * (ny + 1) + ix2 * ny + iy2, -1),
+    )
+
+
+def _hex_centers(extent, size):
+    """Centers of all hexagons in the order of `_hex_index`."""
+    nx, ny = size
+    xmin, ymin, sx, sy = _hex_lattice(extent, size)
+    first = np.meshgrid(np.arange(nx + 1), np.arange(ny + 1), indexing="ij")
+    second = np.meshgrid(np.arange(nx) + 0.5, np.arange(ny) + 0.5, indexing="ij")
+    return (
+        xmin + sx * np.concatenate((first[0].ravel(), second[0].ravel())),
+        ymin + sy * np.concatenate((first[1].ravel(), second[1].ravel())),
+    )
+
+
+def _points(tsd):
+    """Arrays of x, y, and the optional C column, without missing values."""
+    data = tsd.iloc[:, :3].to_numpy(dtype="float64", na_value=np.nan)
+    data = data[np.isfinite(data).all(axis=1)]
+    return data[:, 0], data[:, 1], data[:, 2] if data.shape[1] == 3 else None
+
+
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def hexbin(
     input_ts="-",
@@ -51,6 +160,8 @@ def hexbin(
     source_units=None,
     target_units=None,
     plot_styles="bright",
+    chunksize=None,
+    close=None,
 ):
     r"""[x, y, optional third data column] Hexbin plot.
 
@@ -67,11 +178,14 @@ def hexbin(
     ----------
     ${input_ts}
 
-    reduce_C_function : callable, default np.mean
+    reduce_C_function : str or callable, default np.mean
         Function of one argument that reduces all the values in a bin to
-        a single number.  The available options at the command line are
-        "np.mean", "np.max", "np.sum", "np.std".  Using the Python API can use
-        any callable.
+        a single number.  The names "count", "sum", "mean", "min", "max",
+        "std", and "median", with or without a "np." prefix, and the matching
+        numpy functions are computed for all hexagons at once.  The "median"
+        is estimated from a histogram of 256 bins across the range of the
+        data column in each hexagon.  Any other callable from the Python API
+        is called once for each hexagon.
 
     gridsize: int or tuple of (int, int), default 100
         The number of hexagons in the x-direction. The corresponding number of
@@ -106,22 +220,54 @@ def hexbin(
     ${source_units}
     ${target_units}
     ${plot_styles}
+    ${chunksize}
+    ${close}
     """
-    # set up dataframe
-    tsd = tsutils.common_kwds(
-        input_ts,
-        skiprows=skiprows,
-        names=names,
-        index_type=index_type,
-        start_date=start_date,
-        end_date=end_date,
-        pick=columns,
-        dropna=dropna,
-        source_units=source_units,
-        target_units=target_units,
-        clean=clean,
-        por=por,
-    )
+    reducer = _reducer_name(reduce_C_function)
+    if reducer is None and chunksize is not None:
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                Reading the input in chunks needs one of the named
+                "reduce_C_function" reducers.
+                """
+            )
+        )
+    if chunksize is not None and input_ts == "-":
+        raise ValueError(
+            tsutils.error_wrapper(
+                """
+                The "hexbin" plot reads the input twice in chunks, so needs a
+                file instead of stdin.
+                """
+            )
+        )
+
+    def read():
+        return _stream.read_chunks(
+            input_ts,
+            chunksize=chunksize,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            dropna=dropna,
+            source_units=source_units,
+            target_units=target_units,
+            clean=clean,
+            por=por,
+        )
+
+    # set up dataframe, or only its header if reading in chunks
+    blocks = read()
+    tsd = next(blocks)
+    if chunksize is None:
+        blocks = [tsd]
+    else:
+        blocks = itertools.chain([tsd], blocks)
+        tsd = tsd.iloc[:0]
 
     # Need to work around some old option defaults with the implementation of
     # cltoolbox
@@ -137,46 +283,100 @@ def hexbin(
     xlim = _plotutils.know_your_limits(xlim, axis=xaxis)
     ylim = _plotutils.know_your_limits(ylim, axis=yaxis)
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
     data_col = 2 if len(tsd.columns) == 3 else None
-    ax = tsd.plot.hexbin(
-        0,
-        1,
-        C=data_col,
-        reduce_C_function=reduce_C_function,
-        gridsize=gridsize,
-        ax=ax,
-        loglog=loglog,
-        logx=logx,
-        logy=logy,
-        xlim=xlim,
-        ylim=ylim,
-        title=title,
-        xlabel=xtitle,
-        ylabel=ytitle,
-    )
+    kwds = {
+        "ax": ax,
+        "loglog": loglog,
+        "logx": logx,
+        "logy": logy,
+        "xlim": xlim,
+        "ylim": ylim,
+        "title": title,
+        "xlabel": xtitle,
+        "ylabel": ytitle,
+    }
+    if reducer is None:
+        ax = tsd.plot.hexbin(
+            0,
+            1,
+            C=data_col,
+            reduce_C_function=reduce_C_function,
+            gridsize=gridsize,
+            **kwds,
+        )
+    else:
+        # Bin the points of each block into the hexagons, then draw the
+        # reduced value of each hexagon as one point at its center.
+        size = _hex_size(gridsize)
+        if data_col is None:
+            reducer = "count"
+        value_range = None
+        if chunksize is None:
+            x, y, c = _points(tsd)
+            extent = _hex_extent(x, y)
+            if reducer == "median":
+                value_range = (c.min(), c.max()) if len(c) else (0, 1)
+        else:
+            # First pass for the range of the points.
+            ranges = []
+            for block in read():
+                points = [i for i in _points(block) if i is not None]
+                if len(points[0]):
+                    ranges.append([(i.min(), i.max()) for i in points])
+            ranges = np.array(ranges).reshape(-1, min(len(tsd.columns), 3), 2)
+            extent = _hex_extent(ranges[:, 0].ravel(), ranges[:, 1].ravel())
+            if reducer == "median":
+                value_range = (
+                    (ranges[:, 2, 0].min(), ranges[:, 2, 1].max())
+                    if len(ranges)
+                    else (0, 1)
+                )
+        cells = _stream.BinnedReducer(1, reducer, value_range=value_range)
+        for block in blocks:
+            x, y, c = _points(block)
+            index = _hex_index(x, y, extent, size)
+            inside = index >= 0
+            cells.add(index[inside], np.ones(inside.sum()) if c is None else c[inside])
+        keys, values = cells.result()
+        centers = _hex_centers(extent, size)
+        accum = np.full(len(centers[0]), np.nan)
+        accum[keys] = values[0]
+        if data_col is None:
+            # Like matplotlib all of the hexagons are drawn when counting.
+            accum = np.nan_to_num(accum, nan=0.0)
+        drawn = np.isfinite(accum)
+        # Draw each hexagon from its center with the vectorized counting of
+        # matplotlib, then replace the counts of one with the reduced values.
+        ax = pd.DataFrame({"x": centers[0][drawn], "y": centers[1][drawn]}).plot.hexbin(
+            "x",
+            "y",
+            mincnt=1,
+            gridsize=size,
+            extent=extent,
+            **kwds,
+        )
+        hexagons = ax.collections[-1]
+        hexagons.set_array(accum[drawn])
+        if drawn.any():
+            hexagons.set_clim(accum[drawn].min(), accum[drawn].max())
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
-    plt.xticks(rotation=xlabel_rotation)
-    plt.yticks(rotation=ylabel_rotation)
+    ax.tick_params(axis="x", labelrotation=xlabel_rotation)
+    ax.tick_params(axis="y", labelrotation=ylabel_rotation)
 
-    plt.xlim(xlim)
-    plt.ylim(ylim)
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
@@ -1,15 +1,16 @@
 """Collection of functions for the manipulation of time series."""
 
+import itertools
 import sys
 import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils, _stream
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -19,6 +20,45 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+def _layout(npanels):
+    """Rows and columns of the grid of panels, the same as DataFrame.hist."""
+    if npanels <= 4:
+        return {1: (1, 1), 2: (1, 2), 3: (2, 2), 4: (2, 2)}[max(npanels, 1)]
+    size = int(np.ceil(np.sqrt(npanels)))
+    return (size, size - 1) if (size - 1) * size >= npanels else (size, size)
+
+
+def _edges(bins, lo, hi):
+    """Bin edges from a number of `bins` across `lo` to `hi`, or the edges."""
+    bins = tsutils.make_list(bins)
+    if len(bins) > 1:
+        return np.asarray(bins, dtype="float64")
+    if not np.isfinite(lo) or lo == hi:
+        lo, hi = (0, 1) if not np.isfinite(lo) else (lo - 0.5, hi + 0.5)
+    return np.linspace(lo, hi, int(bins[0]) + 1)
+
+
+def _counts(values, edges):
+    """Counts of each column of 2D `values` in the bins of `edges`.
+
+    Bins are closed on the left except for the last that also includes the
+    right edge, like numpy.histogram, and values outside are not counted.
+    """
+    nbins = len(edges) - 1
+    ncolumns = values.shape[1]
+    columns = np.broadcast_to(np.arange(ncolumns), values.shape).ravel()
+    values = values.ravel()
+    keep = (values >= edges[0]) & (values <= edges[-1])
+    values, columns = values[keep], columns[keep]
+    index = np.searchsorted(edges, values, side="right") - 1
+    index[index == nbins] = nbins - 1
+    return np.bincount(columns * nbins + index, minlength=ncolumns * nbins).reshape(
+        ncolumns, nbins
+    )
+
+
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def histogram(
     input_ts="-",
@@ -61,12 +101,17 @@ def histogram(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    histogram_bins=10,
+    histogram_layout="panels",
+    chunksize=None,
+    close=None,
     **kwds,
 ):
     r"""[N columns] Histogram.
 
     "histogram" will calculate and create a histogram plot.  See 'kde' for
-    a smooth representation of a histogram.
+    a smooth representation of a histogram.  All columns are counted in the
+    same bins.
 
     Parameters
     ----------
@@ -110,24 +155,57 @@ def histogram(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    histogram_bins : int or list
+        [optional, default is 10]
+
+        The number of bins evenly spaced across the range of all columns, or
+        a list of the bin edges.
+
+    histogram_layout : str
+        [optional, default is "panels"]
+
+        Draw each column in its own panel with "panels", or all of the
+        columns as lines on one plot with "overlay".
+    ${chunksize}
+    ${close}
     """
 
-    # set up dataframe
-    tsd = tsutils.common_kwds(
-        input_ts,
-        skiprows=skiprows,
-        names=names,
-        index_type=index_type,
-        start_date=start_date,
-        end_date=end_date,
-        pick=columns,
-        round_index=round_index,
-        dropna=dropna,
-        source_units=source_units,
-        target_units=target_units,
-        clean=clean,
-        por=por,
-    )
+    if histogram_layout not in ("panels", "overlay"):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "histogram_layout" keyword must be "panels" or "overlay".
+                You gave {histogram_layout}.
+                """
+            )
+        )
+
+    def read():
+        return _stream.read_chunks(
+            input_ts,
+            chunksize=chunksize,
+            skiprows=skiprows,
+            names=names,
+            index_type=index_type,
+            start_date=start_date,
+            end_date=end_date,
+            pick=columns,
+            round_index=round_index,
+            dropna=dropna,
+            source_units=source_units,
+            target_units=target_units,
+            clean=clean,
+            por=por,
+        )
+
+    # set up dataframe, or only its header if reading in chunks
+    blocks = read()
+    tsd = next(blocks)
+    if chunksize is None:
+        blocks = [tsd]
+    else:
+        blocks = itertools.chain([tsd], blocks)
+        tsd = tsd.iloc[:0]
 
     # Need to work around some old option defaults with the implementation of
     # cltoolbox
@@ -149,11 +227,56 @@ def histogram(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
+    # One set of edges for all columns, from a first pass for the range of
+    # the values if reading in chunks and only given the number of bins.
+    lo, hi = np.inf, -np.inf
+    if len(tsutils.make_list(histogram_bins)) == 1:
+        if chunksize is not None and input_ts == "-":
+            raise ValueError(
+                tsutils.error_wrapper(
+                    """
+                    Reading stdin in chunks needs "histogram_bins" to be a
+                    list of the bin edges.
+                    """
+                )
+            )
+        for block in [tsd] if chunksize is None else read():
+            values = block.to_numpy(dtype="float64", na_value=np.nan)
+            values = values[np.isfinite(values)]
+            if len(values):
+                lo, hi = min(lo, values.min()), max(hi, values.max())
+    edges = _edges(histogram_bins, lo, hi)
+    counts = 0
+    for block in blocks:
+        counts = counts + _counts(
+            block.to_numpy(dtype="float64", na_value=np.nan), edges
+        )
+    counts = np.broadcast_to(counts, (len(tsd.columns), len(edges) - 1))
 
     figsize = tsutils.make_list(figsize)
-    ax = tsd.hist(figsize=figsize, sharey=sharey, sharex=sharex)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    if histogram_layout == "overlay":
+        ax = fig.subplots()
+        axes = [ax] * len(counts)
+    else:
+        nrows, ncols = _layout(len(counts))
+        grid_axes = fig.subplots(
+            nrows, ncols, sharex=sharex, sharey=sharey, squeeze=False
+        )
+        for ax in grid_axes.flat[len(counts) :]:
+            ax.set_visible(False)
+        axes = grid_axes.flat[: len(counts)]
+    for ax, count, lname in zip(axes, counts, lnames):
+        color = {} if icolors is None else {"color": next(icolors)}
+        if histogram_layout == "overlay":
+            ax.stairs(count, edges, linestyle=next(ilinestyles), label=lname, **color)
+        else:
+            ax.stairs(count, edges, fill=True, **color)
+            if len(counts) > 1:
+                ax.set_title(lname)
+        ax.grid(grid)
+    if histogram_layout == "overlay" and legend:
+        ax.legend(loc="best")
 
     if hlines_y is not None:
         hlines_y = tsutils.make_list(hlines_y)
@@ -178,7 +301,7 @@ def histogram(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
     if hlines_y is not None:
-        plt.hlines(
+        ax.hlines(
             hlines_y,
             hlines_xmin,
             hlines_xmax,
@@ -186,7 +309,7 @@ def histogram(
             linestyles=hlines_linestyles,
         )
     if vlines_x is not None:
-        plt.vlines(
+        ax.vlines(
             vlines_x,
             vlines_ymin,
             vlines_ymax,
@@ -194,18 +317,16 @@ def histogram(
             linestyles=vlines_linestyles,
         )
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
-
-    plt.grid(grid)
+        ax.invert_yaxis()
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    if len(axes) > 1 and histogram_layout == "panels":
+        fig.suptitle(title)
+    else:
+        ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
@@ -3,11 +3,12 @@
 import warnings
 
 import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.artist import setp
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _kde, _plotutils
 from ..SciencePlots import scienceplots  # noqa: F401
 
 matplotlib.use("Agg")
@@ -15,6 +16,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def kde(
     input_ts="-",
@@ -63,6 +66,10 @@ def kde(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    bw_method="scott",
+    kde_gridsize=1000,
+    kde_shared_grid=False,
+    close=None,
     **kwds,
 ):
     r"""[N columns] Kernel density estimation of probability density function.
@@ -121,10 +128,14 @@ def kde(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${bw_method}
+    ${kde_gridsize}
+    ${kde_shared_grid}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -166,13 +177,18 @@ def kde(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
-
-    ax = tsd.plot.kde(
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
+
+    density = _kde.kde_frame(
+        tsd,
+        bw_method=bw_method,
+        gridsize=kde_gridsize,
+        shared_grid=kde_shared_grid,
+    )
+    axes = density.plot(
+        ax=ax,
         legend=legend,
         subplots=subplots,
         sharex=sharex,
@@ -185,17 +201,20 @@ def kde(
         secondary_y=secondary_y,
         figsize=figsize,
     )
-    for line in ax.lines:
+    # With subplots pandas replaces `ax` with a grid of new axes.
+    axes = np.ravel(axes)
+    ax = axes[-1]
+    for line in [line for i in axes for line in i.lines]:
         c = next(icolors) if icolors is not None else None
         m = next(imarkerstyles) if imarkerstyles is not None else None
         l = next(ilinestyles) if ilinestyles is not None else None  # noqa: E741
         if c is not None:
-            plt.setp(line, color=c)
-        plt.setp(line, marker=m)
-        plt.setp(line, linestyle=l)
+            setp(line, color=c)
+        setp(line, marker=m)
+        setp(line, linestyle=l)
     ytitle = ytitle or "Density"
     if legend:
-        plt.legend(loc="best")
+        ax.legend(loc="best")
 
     if hlines_y is not None:
         hlines_y = tsutils.make_list(hlines_y)
@@ -220,18 +239,15 @@ def kde(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
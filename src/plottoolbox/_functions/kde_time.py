@@ -6,13 +6,12 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.stats import gaussian_kde
+from matplotlib.artist import setp
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _kde, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -22,6 +21,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def kde_time(
     input_ts="-",
@@ -72,6 +73,9 @@ def kde_time(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    bw_method="scott",
+    kde_gridsize=1000,
+    close=None,
     **kwds,
 ):
     r"""[time index, N columns] A time-series plot with a kernel density estimation (KDE) plot.
@@ -131,10 +135,13 @@ def kde_time(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${bw_method}
+    ${kde_gridsize}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -176,16 +183,13 @@ def kde_time(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
 
-    _, (ax0, ax1) = plt.subplots(
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax0, ax1 = fig.subplots(
         nrows=1,
         ncols=2,
         sharey=True,
-        figsize=figsize,
         gridspec_kw={"width_ratios": [1, 4]},
     )
     tsd.plot(
@@ -209,24 +213,30 @@ def kde_time(
         m = next(imarkerstyles) if imarkerstyles is not None else None
         l = next(ilinestyles) if ilinestyles is not None else None  # noqa: E741
         if c is not None:
-            plt.setp(line, color=c)
-        plt.setp(line, marker=m)
-        plt.setp(line, linestyle=l)
+            setp(line, color=c)
+        setp(line, marker=m)
+        setp(line, linestyle=l)
     xtitle = xtitle or "Time"
     ylimits = ax1.get_ylim()
-    ny = np.linspace(ylimits[0], ylimits[1], 1000)
+    ny = np.linspace(ylimits[0], ylimits[1], int(kde_gridsize))
+    pdfs = _kde.densities(
+        [
+            tsd.iloc[:, col].astype("float64").dropna().values
+            for col in range(len(tsd.columns))
+        ],
+        [ny] * len(tsd.columns),
+        bw_method=bw_method,
+    )
 
     # reset to beginning of iterator
     icolors = itertools.cycle(colors) if icolors is not None else None
     imarkerstyles = itertools.cycle(markerstyles)
     ilinestyles = itertools.cycle(linestyles)
     for col in range(len(tsd.columns)):
-        xvals = tsd.iloc[:, col].astype("float64").dropna().values
-        pdf = gaussian_kde(xvals)
         if icolors is not None:
             c = next(icolors)
         ax0.plot(
-            pdf(ny),
+            pdfs[col],
             ny,
             linestyle=next(ilinestyles),
             color=c,
@@ -259,18 +269,15 @@ def kde_time(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax1.set_xlabel(xtitle)
+    ax1.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax1.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax1.invert_yaxis()
 
-    plt.grid(grid)
+    ax1.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax1.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
@@ -5,12 +5,12 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
-from pandas.plotting import lag_plot as lagplot
+import numpy as np
+from matplotlib.colors import LogNorm
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -20,6 +20,31 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+def _lag_histograms(values, lags, bins):
+    """Two dimensional histograms of the (y(t), y(t+lag)) pairs of each lag.
+
+    The values are binned once and the pairs of each lag are views of the
+    bin numbers, so one pass over the data serves all of the lags.  Returns
+    the bin edges and a (bins, bins) array of counts for each lag.
+    """
+    finite = np.isfinite(values)
+    edges = np.histogram_bin_edges(values[finite], bins=bins)
+    index = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, bins - 1)
+    index = np.where(finite, index, -1)
+    counts = []
+    for lag in lags:
+        first, second = index[:-lag], index[lag:]
+        valid = (first >= 0) & (second >= 0)
+        counts.append(
+            np.bincount(
+                first[valid] * bins + second[valid], minlength=bins * bins
+            ).reshape(bins, bins)
+        )
+    return edges, counts
+
+
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def lag_plot(
     input_ts="-",
@@ -50,6 +75,8 @@ def lag_plot(
     source_units=None,
     target_units=None,
     lag_plot_lag=1,
+    lag_plot_mode="scatter",
+    lag_plot_bins=100,
     plot_styles="bright",
     hlines_y=None,
     hlines_xmin=None,
@@ -61,6 +88,7 @@ def lag_plot(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    close=None,
     **kwds,
 ):
     r"""[time index, 1 column] Lag plot.
@@ -123,10 +151,22 @@ def lag_plot(
     ${source_units}
 
     ${target_units}
-    lag_plot_lag : int
+    lag_plot_lag : int or list of int
         Defaults to 1.
 
-        The lag used in the plot.
+        The lag used in the plot.  If a list of lags, for example "1,2,7",
+        draws a grid with a plot for each lag.
+    lag_plot_mode : str
+        [optional, default is "scatter"]
+
+        If "scatter" draws a marker for each pair of values.  If "density"
+        draws a two dimensional histogram of the pairs, with the counts in
+        colors on a log scale, which is much faster and easier to read for
+        long time-series.
+    lag_plot_bins : int
+        [optional, default is 100]
+
+        Number of bins along each axis for `lag_plot_mode="density"`.
 
     ${plot_styles}
     ${hlines_y}
@@ -139,10 +179,11 @@ def lag_plot(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -178,13 +219,43 @@ def lag_plot(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
+    if lag_plot_mode not in ("scatter", "density"):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "lag_plot_mode" keyword must be "scatter" or "density".
+                You gave {lag_plot_mode}.
+                """
+            )
+        )
+    lags = [int(i) for i in tsutils.make_list(lag_plot_lag)]
 
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
-
-    lagplot(tsd, lag=lag_plot_lag, ax=ax)
+    density = lag_plot_mode == "density"
+    fig = _plotutils.new_figure(
+        ofilename, close, figsize=figsize, layout="constrained" if density else None
+    )
+    ncols = int(np.ceil(np.sqrt(len(lags))))
+    nrows = int(np.ceil(len(lags) / ncols))
+    grid_axes = fig.subplots(nrows, ncols, sharex=True, sharey=True, squeeze=False)
+    for ax in grid_axes.flat[len(lags) :]:
+        ax.set_visible(False)
+    axes = grid_axes.flat[: len(lags)]
+
+    values = tsd.iloc[:, 0].to_numpy(dtype="float64", na_value=np.nan)
+    if density:
+        edges, counts = _lag_histograms(values, lags, int(lag_plot_bins))
+        norm = LogNorm(vmin=1, vmax=max(max(i.max() for i in counts), 1))
+        for ax, count in zip(axes, counts):
+            mesh = ax.pcolormesh(
+                edges, edges, np.ma.masked_equal(count.T, 0), norm=norm
+            )
+        fig.colorbar(mesh, ax=grid_axes, label="Count")
+    else:
+        for ax, lag in zip(axes, lags):
+            ax.scatter(
+                values[:-lag], values[lag:], c=matplotlib.rcParams["patch.facecolor"]
+            )
     # This is to help pretty print the frequency
     try:
         try:
@@ -196,7 +267,10 @@ def lag_plot(
     except AttributeError:
         short_freq = ""
     xtitle = xtitle or "y(t)"
-    ytitle = ytitle or f"y(t+{short_freq or 1})"
+    if len(lags) == 1:
+        ytitles = [ytitle or f"y(t+{short_freq or 1})"]
+    else:
+        ytitles = [ytitle or f"y(t+{lag})" for lag in lags]
 
     if hlines_y is not None:
         hlines_y = tsutils.make_list(hlines_y)
@@ -221,18 +295,20 @@ def lag_plot(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    for ax, ytitle in zip(axes, ytitles):
+        ax.set_xlabel(xtitle)
+        ax.set_ylabel(ytitle)
+        ax.grid(grid)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
-
-    plt.grid(grid)
-
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+        ax.invert_yaxis()
+
+    if len(lags) == 1:
+        ax.set_title(title)
+    else:
+        fig.suptitle(title)
+    return _plotutils.save_figure(
+        fig, ofilename=ofilename, close=close, tight_layout=not density
+    )
@@ -5,13 +5,12 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.ticker import FixedLocator
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils, _probability
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -21,6 +20,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def lognorm_yaxis(
     input_ts="-",
@@ -55,6 +56,8 @@ def lognorm_yaxis(
     dropna="all",
     plotting_position="weibull",
     prob_plot_sort_values="descending",
+    prob_plot_max_points=None,
+    chunksize=None,
     source_units=None,
     target_units=None,
     plot_styles="bright",
@@ -68,6 +71,7 @@ def lognorm_yaxis(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    close=None,
     **kwds,
 ):
     r"""[N columns] Log-normal y-axis.
@@ -107,6 +111,8 @@ def lognorm_yaxis(
     ${invert_yaxis}
     ${plotting_position}
     ${prob_plot_sort_values}
+    ${prob_plot_max_points}
+    ${chunksize}
     ${round_index}
     ${dropna}
     ${source_units}
@@ -122,11 +128,13 @@ def lognorm_yaxis(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd, runs = _probability.read_input(
         input_ts,
+        chunksize=chunksize,
         skiprows=skiprows,
         names=names,
         index_type=index_type,
@@ -178,11 +186,9 @@ def lognorm_yaxis(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
     colcnt = tsd.shape[1]
 
@@ -197,15 +203,15 @@ def lognorm_yaxis(
     ys = tsd.iloc[:, :]
 
     for colindex in range(colcnt):
-        oydata = np.array(ys.iloc[:, colindex].dropna())
-        if prob_plot_sort_values == "ascending":
-            oydata = np.sort(oydata)
-        elif prob_plot_sort_values == "descending":
-            oydata = np.sort(oydata)[::-1]
-        n = len(oydata)
+        oxdata, oydata = _probability.probability_points(
+            ys.iloc[:, colindex].dropna() if runs is None else runs[colindex],
+            ppf,
+            plotting_position=plotting_position,
+            sort_values=prob_plot_sort_values,
+            max_points=prob_plot_max_points,
+        )
 
         norm_axis = ax.xaxis
-        oxdata = ppf(tsutils.set_plotting_position(n, plotting_position))
         oxdata, oydata = oydata, oxdata
         norm_axis = ax.yaxis
 
@@ -273,7 +279,7 @@ def lognorm_yaxis(
             vlines_ymax = nylim[1]
     if hlines_y is not None:
         hlines_y = ppf(tsutils.make_list(hlines_y))
-        plt.hlines(
+        ax.hlines(
             hlines_y,
             hlines_xmin,
             hlines_xmax,
@@ -281,7 +287,7 @@ def lognorm_yaxis(
             linestyles=hlines_linestyles,
         )
     if vlines_x is not None:
-        plt.vlines(
+        ax.vlines(
             vlines_x,
             vlines_ymin,
             vlines_ymax,
@@ -289,18 +295,15 @@ def lognorm_yaxis(
             linestyles=vlines_linestyles,
         )
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
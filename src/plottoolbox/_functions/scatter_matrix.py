@@ -1,16 +1,18 @@
 """Collection of functions for the manipulation of time series."""
 
+import os
 import sys
 import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import LogNorm
 from pandas.plotting import scatter_matrix as scatter_matrix_plot
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _kde, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -20,6 +22,98 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+def _pair_counts(index, bins, pairs):
+    """Two dimensional histograms of the columns of bin numbers in `pairs`.
+
+    Rows with a missing value, bin number -1, in either column are left out.
+    The histograms are computed in parallel threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def count(pair):
+        first, second = index[:, pair[0]], index[:, pair[1]]
+        valid = (first >= 0) & (second >= 0)
+        return np.bincount(
+            first[valid] * bins + second[valid], minlength=bins * bins
+        ).reshape(bins, bins)
+
+    with ThreadPoolExecutor(max_workers=min(len(pairs), os.cpu_count() or 1)) as pool:
+        return dict(zip(pairs, pool.map(count, pairs)))
+
+
+def _density_matrix(fig, tsd, diagonal, bins, range_padding=0.05):
+    """Draw a scatter matrix of `tsd` with 2D histograms off the diagonal.
+
+    Has the same layout as pandas.plotting.scatter_matrix.  Each column is
+    binned once into `bins` bins, and each off diagonal panel is an image of
+    the counts of a pair of columns.  The diagonal is a histogram or a binned
+    kernel density estimate.
+    """
+    values = tsd.to_numpy(dtype="float64", na_value=np.nan)
+    finite = np.isfinite(values)
+    ncols = values.shape[1]
+    boundaries = []
+    edges = []
+    index = np.full(values.shape, -1, dtype=np.int64)
+    for col in range(ncols):
+        column = values[finite[:, col], col]
+        rmin, rmax = column.min(), column.max()
+        extend = (rmax - rmin) * range_padding / 2
+        boundaries.append((rmin - extend, rmax + extend))
+        edges.append(np.histogram_bin_edges(column, bins=bins))
+        index[finite[:, col], col] = np.clip(
+            np.searchsorted(edges[col], column, side="right") - 1, 0, bins - 1
+        )
+    counts = _pair_counts(
+        index, bins, [(i, j) for i in range(ncols) for j in range(i + 1, ncols)]
+    )
+    norm = LogNorm(vmin=1, vmax=max([i.max() for i in counts.values()] + [1]))
+
+    axes = fig.subplots(ncols, ncols, squeeze=False)
+    fig.subplots_adjust(wspace=0, hspace=0)
+    for i, a in enumerate(tsd.columns):
+        for j, b in enumerate(tsd.columns):
+            ax = axes[i, j]
+            if i == j:
+                column = values[finite[:, i], i]
+                if diagonal == "hist":
+                    ax.hist(column)
+                else:
+                    ind = np.linspace(column.min(), column.max(), 1000)
+                    ax.plot(ind, _kde.densities([column], [ind])[0])
+                ax.set_xlim(boundaries[i])
+            else:
+                count = counts[(i, j)] if i < j else counts[(j, i)].T
+                ax.pcolormesh(
+                    edges[j], edges[i], np.ma.masked_equal(count, 0), norm=norm
+                )
+                ax.set_xlim(boundaries[j])
+                ax.set_ylim(boundaries[i])
+            ax.set_xlabel(b)
+            ax.set_ylabel(a)
+            if j != 0:
+                ax.yaxis.set_visible(False)
+            if i != ncols - 1:
+                ax.xaxis.set_visible(False)
+            ax.tick_params(axis="x", labelsize=8, labelrotation=90)
+            ax.tick_params(axis="y", labelsize=8, labelrotation=0)
+
+    if ncols > 1:
+        lim1 = boundaries[0]
+        locs = axes[0][1].yaxis.get_majorticklocs()
+        locs = locs[(lim1[0] <= locs) & (locs <= lim1[1])]
+        lim0 = axes[0][0].get_ylim()
+        axes[0][0].yaxis.set_ticks(
+            (locs - lim1[0]) / (lim1[1] - lim1[0]) * (lim0[1] - lim0[0]) + lim0[0]
+        )
+        if np.all(locs == locs.astype(int)):
+            locs = locs.astype(int)
+        axes[0][0].yaxis.set_ticklabels(locs)
+    return axes
+
+
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def scatter_matrix(
     input_ts="-",
@@ -42,6 +136,8 @@ def scatter_matrix(
     markerstyles=" ",
     style="auto",
     scatter_matrix_diagonal="kde",
+    scatter_matrix_mode="scatter",
+    scatter_matrix_bins=100,
     grid=False,
     por=False,
     invert_xaxis=False,
@@ -61,6 +157,7 @@ def scatter_matrix(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    close=None,
     **kwds,
 ):
     r"""[N columns] Plots all columns against each other in matrix of plots.
@@ -96,6 +193,18 @@ def scatter_matrix(
         [optional, defaults to "kde"]
 
         What to plot on the diagonal of the scatter matrix.
+    scatter_matrix_mode : str
+        [optional, defaults to "scatter"]
+
+        If "scatter" the plots off the diagonal draw a marker for each pair of
+        values.  If "density" they are two dimensional histograms of the
+        pairs, with the counts in colors on a log scale, and a "kde" diagonal
+        uses a binned kernel density estimate.  Use "density" for long
+        time-series, where it is much faster and uses far less memory.
+    scatter_matrix_bins : int
+        [optional, defaults to 100]
+
+        Number of bins along each axis for `scatter_matrix_mode="density"`.
     ${grid}
     ${por}
     ${invert_xaxis}
@@ -115,10 +224,20 @@ def scatter_matrix(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${close}
     """
+    if scatter_matrix_mode not in ("scatter", "density"):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "scatter_matrix_mode" keyword must be "scatter" or
+                "density".  You gave {scatter_matrix_mode}.
+                """
+            )
+        )
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -154,15 +273,20 @@ def scatter_matrix(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
     if scatter_matrix_diagonal == "probablity_density":
         scatter_matrix_diagonal = "kde"
-    scatter_matrix_plot(tsd, diagonal=scatter_matrix_diagonal, figsize=figsize)
+    if scatter_matrix_mode == "density":
+        fig.delaxes(ax)
+        _density_matrix(fig, tsd, scatter_matrix_diagonal, int(scatter_matrix_bins))
+    else:
+        scatter_matrix_plot(
+            tsd, ax=ax, diagonal=scatter_matrix_diagonal, figsize=figsize
+        )
+    ax = fig.gca()
 
     if hlines_y is not None:
         hlines_y = tsutils.make_list(hlines_y)
@@ -187,18 +311,15 @@ def scatter_matrix(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
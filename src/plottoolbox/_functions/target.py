@@ -10,7 +10,7 @@ import numpy as np
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils
 from ..SkillMetrics import skill_metrics as sm
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
@@ -22,6 +22,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def target(
     input_ts="-",
@@ -45,6 +47,7 @@ def target(
     source_units=None,
     target_units=None,
     plot_styles="bright",
+    close=None,
     **kwds,
 ):
     r"""[obs column, sim N columns] Creates a "target" diagram to plot goodness of fit.
@@ -88,13 +91,14 @@ def target(
     ${source_units}
     ${target_units}
     ${plot_styles}
+    ${close}
     """
 
     # set up dataframe
     # Use dropna='no' to get the lengths of both time-series.
     # set up dataframe
     tsd = (
-        tsutils.common_kwds(
+        _cache.common_kwds(
             input_ts,
             skiprows=skiprows,
             names=names,
@@ -140,11 +144,7 @@ def target(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
 
     # Calculate statistics for target diagram
     bias = []
@@ -160,10 +160,9 @@ def target(
         crmsd.append(target_stats["crmsd"])
         rmsd.append(target_stats["rmsd"])
 
-    sm.target_diagram(np.array(bias), np.array(crmsd), np.array(rmsd))
-
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    # target_diagram draws on the pyplot current axes.
+    with _plotutils.draw_lock:
+        fig = plt.figure(figsize=figsize)
+        sm.target_diagram(np.array(bias), np.array(crmsd), np.array(rmsd))
+        fig.gca().set_title(title)
+        return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
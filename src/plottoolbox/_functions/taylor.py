@@ -10,7 +10,7 @@ import numpy as np
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils
 from ..SkillMetrics.skill_metrics import centered_rms_dev, taylor_diagram
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
@@ -22,6 +22,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def taylor(
     input_ts="-",
@@ -47,6 +49,7 @@ def taylor(
     source_units=None,
     target_units=None,
     plot_styles="bright",
+    close=None,
     **kwds,
 ):
     r"""[obs columns, sim N columns] Taylor diagram to plot goodness of fit.
@@ -97,10 +100,11 @@ def taylor(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -136,11 +140,7 @@ def taylor(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
 
     ref = tsd.iloc[:, 0]
     std = [np.std(ref)]
@@ -151,10 +151,9 @@ def taylor(
         ccoef.append(np.corrcoef(tsd.iloc[:, col], ref)[0][1])
         crmsd.append(centered_rms_dev(tsd.iloc[:, col].values, ref.values))
 
-    taylor_diagram(np.array(std), np.array(crmsd), np.array(ccoef))
-
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    # taylor_diagram draws on the pyplot current axes.
+    with _plotutils.draw_lock:
+        fig = plt.figure(figsize=figsize)
+        taylor_diagram(np.array(std), np.array(crmsd), np.array(ccoef))
+        fig.gca().set_title(title)
+        return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
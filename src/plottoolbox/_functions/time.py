@@ -10,7 +10,7 @@ import pandas as pd
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _decimate, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -19,6 +19,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def time(
     input_ts="-",
@@ -69,6 +71,8 @@ def time(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    decimate="auto",
+    close=None,
     **kwds,
 ):
     r"""[time index, N columns] Time-series plot.
@@ -131,12 +135,12 @@ def time(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${decimate}
+    ${close}
     """
 
-    import matplotlib.pyplot as plt
-
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -189,24 +193,28 @@ def time(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
     if secondary_y is not None:
         secondary_y = np.array(
             tsd.columns[tsutils.make_iloc(tsd.columns, tsutils.make_list(secondary_y))]
         )
 
+    if decimate == "auto" and _plotutils.keep_open(ofilename, close):
+        # A figure kept open can be zoomed, so draw all of the points.
+        decimate = None
+    tsd = _decimate.decimate_frame(tsd, ax, decimate, logy=logy, xlim=xlim)
+
     for _ in range(len(tsd.columns)):
         c = next(icolors) if icolors is not None else None
         m = next(imarkerstyles) if imarkerstyles is not None else None  # noqa: F841
         l = next(ilinestyles) if ilinestyles is not None else None  # noqa: E741, F841
 
-    _ = (
+    axes = (
         tsd.plot(
+            ax=ax,
             kind="line",
             legend=legend,
             subplots=subplots,
@@ -223,6 +231,7 @@ def time(
         )
         if c is None
         else tsd.plot(
+            ax=ax,
             kind="line",
             legend=legend,
             subplots=subplots,
@@ -239,12 +248,15 @@ def time(
             color=c,
         )
     )
+    if subplots:
+        # pandas replaces `ax` with a grid of new axes on the same figure.
+        ax = np.ravel(axes)[-1]
     xtitle = xtitle or "Time"
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
-    plt = _plotutils.hv_lines(
-        plt,
+    _plotutils.hv_lines(
+        ax,
         hlines_y=hlines_y,
         hlines_xmin=hlines_xmin,
         hlines_xmax=hlines_xmax,
@@ -258,14 +270,11 @@ def time(
     )
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
@@ -9,7 +9,7 @@ import pandas as pd  # noqa: F401
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _plotutils
 from ..waterfall_ax import waterfall_ax
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
@@ -19,6 +19,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def waterfall(
     input_ts="-",
@@ -68,6 +70,7 @@ def waterfall(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    close=None,
     **kwds,
 ):
     r"""[time index, N columns] Watefall plot.
@@ -129,12 +132,11 @@ def waterfall(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${close}
     """
 
-    import matplotlib.pyplot as plt
-
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -172,11 +174,9 @@ def waterfall(
         len(tsd.columns), style, colors, linestyles, markerstyles
     )
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
     tsd = tsd.squeeze()
 
@@ -199,18 +199,19 @@ def waterfall(
         last_step_label=last_step_label,
     )
 
-    ax = wf.plot_waterfall(  # noqa: F841
+    ax = wf.plot_waterfall(
+        ax=ax,
         title="Change Styles and Labels",
         bar_labels=bar_labels,
         bar_kwargs=bar_kwargs,
         line_kwargs=line_kwargs,
     )
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
-    plt = _plotutils.hv_lines(
-        plt,
+    _plotutils.hv_lines(
+        ax,
         hlines_y=hlines_y,
         hlines_xmin=hlines_xmin,
         hlines_xmax=hlines_xmax,
@@ -223,10 +224,7 @@ def waterfall(
         vlines_linestyles=None,
     )
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
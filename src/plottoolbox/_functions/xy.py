@@ -5,12 +5,11 @@ import warnings
 from pathlib import Path
 
 import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 
 from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
 
-from .. import _plotutils
+from .. import _cache, _decimate, _plotutils
 
 sys.path.append(str(Path(__file__).parent / ".." / "SciencePlots"))
 import scienceplots  # noqa: F401
@@ -20,6 +19,8 @@ matplotlib.use("Agg")
 warnings.filterwarnings("ignore")
 
 
+@_cache.render_cache
+@_plotutils.styled
 @tsutils.doc(_plotutils.ldocstrings)
 def xy(
     input_ts="-",
@@ -66,6 +67,8 @@ def xy(
     vlines_ymax=None,
     vlines_colors=None,
     vlines_linestyles="-",
+    decimate="auto",
+    close=None,
     **kwds,
 ):
     r"""[x1, y1, x2, y2, x3, y3, ...] Creates an 'x,y' plot, also known as a scatter plot.
@@ -121,10 +124,12 @@ def xy(
     ${vlines_ymax}
     ${vlines_colors}
     ${vlines_linestyles}
+    ${decimate}
+    ${close}
     """
 
     # set up dataframe
-    tsd = tsutils.common_kwds(
+    tsd = _cache.common_kwds(
         input_ts,
         skiprows=skiprows,
         names=names,
@@ -176,11 +181,9 @@ def xy(
         imarkerstyles,
     ) = _plotutils.prepare_styles(colcnt, style, colors, linestyles, markerstyles)
 
-    plot_styles = tsutils.make_list(plot_styles) + ["no-latex"]
-    plt.style.use(plot_styles)
-
     figsize = tsutils.make_list(figsize, n=2)
-    _, ax = plt.subplots(figsize=figsize)
+    fig = _plotutils.new_figure(ofilename, close, figsize=figsize)
+    ax = fig.subplots()
 
     plotdict = {
         (False, True): ax.semilogy,
@@ -247,7 +250,7 @@ def xy(
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
     if hlines_y is not None:
-        plt.hlines(
+        ax.hlines(
             hlines_y,
             hlines_xmin,
             hlines_xmax,
@@ -255,7 +258,7 @@ def xy(
             linestyles=hlines_linestyles,
         )
     if vlines_x is not None:
-        plt.vlines(
+        ax.vlines(
             vlines_x,
             vlines_ymin,
             vlines_ymax,
@@ -273,18 +276,20 @@ def xy(
         ax.set_ylim(nylim)
         ax.set_xlim(nxlim)
 
-    plt.xlabel(xtitle)
-    plt.ylabel(ytitle)
+    if decimate == "auto" and _plotutils.keep_open(ofilename, close):
+        # A figure kept open can be zoomed, so draw all of the points.
+        decimate = None
+    _decimate.decimate_lines(ax, decimate)
+
+    ax.set_xlabel(xtitle)
+    ax.set_ylabel(ytitle)
 
     if invert_xaxis is True:
-        plt.gca().invert_xaxis()
+        ax.invert_xaxis()
     if invert_yaxis is True:
-        plt.gca().invert_yaxis()
+        ax.invert_yaxis()
 
-    plt.grid(grid)
+    ax.grid(grid)
 
-    plt.title(title)
-    plt.tight_layout()
-    if ofilename is not None:
-        plt.savefig(ofilename)
-    return plt
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
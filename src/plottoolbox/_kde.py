@@ -0,0 +1,207 @@
+"""Gaussian kernel density estimates by linear binning and FFT convolution."""
+
+import os
+
+import numpy as np
+
+BW_METHODS = ("scott", "silverman", "isj")
+
+# Largest number of bins used to estimate one density.
+MAX_BINS = 2**20
+
+
+def _check_bw_method(bw_method):
+    """Return the bandwidth rule name or factor."""
+    if bw_method is None:
+        return "scott"
+    if bw_method in BW_METHODS:
+        return bw_method
+    try:
+        return float(bw_method)
+    except (TypeError, ValueError):
+        from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The "bw_method" keyword must be one of {BW_METHODS} or a
+                number.  You gave {bw_method}.
+                """
+            )
+        ) from None
+
+
+def _isj_fixed_point(time, nvalues, squares, coefficients):
+    """Botev et al. (2010) fixed point equation, zero at the ISJ bandwidth."""
+    from math import factorial
+
+    order = 7
+    functional = (
+        2
+        * np.pi ** (2 * order)
+        * np.sum(squares**order * coefficients * np.exp(-squares * np.pi**2 * time))
+    )
+    for stage in range(order - 1, 1, -1):
+        k0 = factorial(2 * stage - 1) / (2 ** (stage - 1) * factorial(stage - 1))
+        k0 = k0 / np.sqrt(2 * np.pi)
+        const = (1 + (1 / 2) ** (stage + 1 / 2)) / 3
+        stage_time = (2 * const * k0 / nvalues / functional) ** (2 / (3 + 2 * stage))
+        functional = (
+            2
+            * np.pi ** (2 * stage)
+            * np.sum(
+                squares**stage * coefficients * np.exp(-squares * np.pi**2 * stage_time)
+            )
+        )
+    return time - (2 * nvalues * np.sqrt(np.pi) * functional) ** (-2 / 5)
+
+
+def _isj(values, nbins=2**10):
+    """Improved Sheather-Jones bandwidth of Botev et al. (2010).
+
+    Returns None if the fixed point equation has no solution, for example for
+    data with only a few distinct values.
+    """
+    from scipy.fft import dct
+    from scipy.optimize import brentq
+
+    lo, hi = values.min(), values.max()
+    lo, hi = lo - (hi - lo) / 2, hi + (hi - lo) / 2
+    counts = np.histogram(values, bins=nbins, range=(lo, hi))[0] / len(values)
+    coefficients = (dct(counts, type=2)[1:] / 2) ** 2
+    squares = np.arange(1, nbins, dtype="float64") ** 2
+    try:
+        with np.errstate(all="ignore"):
+            time = brentq(
+                _isj_fixed_point,
+                0,
+                0.1,
+                args=(len(values), squares, coefficients),
+            )
+    except ValueError:
+        return None
+    return np.sqrt(time) * (hi - lo)
+
+
+def bandwidth(values, bw_method="scott"):
+    """Standard deviation of the Gaussian kernel for `values`.
+
+    The `bw_method` is "scott", "silverman", or "isj", or a number that is
+    multiplied by the standard deviation of `values` like the bw_method of
+    scipy.stats.gaussian_kde.  If "isj" has no solution "silverman" is used.
+    """
+    bw_method = _check_bw_method(bw_method)
+    nvalues = len(values)
+    if bw_method == "isj":
+        isj = _isj(values)
+        if isj is not None:
+            return isj
+        bw_method = "silverman"
+    if bw_method == "scott":
+        factor = nvalues ** (-1 / 5)
+    elif bw_method == "silverman":
+        factor = (nvalues * 3 / 4) ** (-1 / 5)
+    else:
+        factor = bw_method
+    return factor * np.std(values, ddof=1)
+
+
+def grid_range(values):
+    """Range of the grid for `values`, half of the data range past each end."""
+    lo, hi = np.min(values), np.max(values)
+    return lo - (hi - lo) / 2, hi + (hi - lo) / 2
+
+
+def density(values, grid, bw):
+    """Gaussian kernel density of `values` at the evenly spaced `grid`.
+
+    The values are linearly binned with a spacing of at most a quarter of the
+    bandwidth `bw` on a grid that includes the points of `grid` and extends
+    past it to cover the values, and the bins are convolved with the kernel
+    using an FFT.
+    """
+    from scipy.signal import fftconvolve
+
+    nvalues = len(values)
+    if nvalues < 2 or not np.isfinite(bw) or bw <= 0:
+        return np.full(len(grid), np.nan)
+    refine = int(np.ceil(4 * (grid[1] - grid[0]) / bw))
+    refine = max(1, min(refine, MAX_BINS // len(grid)))
+    step = (grid[1] - grid[0]) / refine
+    below = np.ceil((grid[0] - values.min() + 5 * bw) / step)
+    above = np.ceil((values.max() + 5 * bw - grid[-1]) / step)
+    below = int(np.clip(below, 0, MAX_BINS))
+    above = int(np.clip(above, 0, MAX_BINS))
+    nbins = below + (len(grid) - 1) * refine + 1 + above
+
+    position = (values - grid[0]) / step + below
+    position = position[(position >= 0) & (position <= nbins - 1)]
+    index = np.floor(position).astype(np.int64)
+    weight = position - index
+    counts = np.bincount(index, 1 - weight, minlength=nbins + 1)
+    counts += np.bincount(index + 1, weight, minlength=nbins + 1)
+
+    half = min(nbins - 1, int(np.ceil(5 * bw / step)))
+    offsets = np.arange(-half, half + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bw) ** 2) / (bw * np.sqrt(2 * np.pi))
+    smoothed = fftconvolve(counts[:nbins], kernel, mode="same")
+    smoothed = smoothed[below : nbins - above : refine]
+    return np.clip(smoothed / nvalues, 0, None)
+
+
+def densities(columns, grids, bw_method="scott"):
+    """Kernel density of each array in `columns` at the matching grid.
+
+    The columns are estimated in parallel threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def estimate(values, grid):
+        if len(values) < 2:
+            return np.full(len(grid), np.nan)
+        return density(values, grid, bandwidth(values, bw_method))
+
+    _check_bw_method(bw_method)
+    if len(columns) < 2:
+        return [estimate(values, grid) for values, grid in zip(columns, grids)]
+    with ThreadPoolExecutor(max_workers=min(len(columns), os.cpu_count() or 1)) as pool:
+        return list(pool.map(estimate, columns, grids))
+
+
+def kde_frame(tsd, bw_method="scott", gridsize=1000, shared_grid=False):
+    """Return a DataFrame of the kernel density of each column of `tsd`.
+
+    Each column is estimated at `gridsize` points from half of its data
+    range below its minimum to half above its maximum.  The index is the
+    union of these grids, with each column linearly interpolated between its
+    own grid points and missing outside of them, so the lines plotted from
+    the DataFrame are the same as from each column's own grid.  If
+    `shared_grid` one grid over the range of all columns is used.
+    """
+    import pandas as pd
+
+    gridsize = int(gridsize)
+    columns = [
+        tsd.iloc[:, i].astype("float64").dropna().values for i in range(tsd.shape[1])
+    ]
+    if shared_grid:
+        ranges = [grid_range(values) for values in columns if len(values)]
+        lo = min((i[0] for i in ranges), default=0)
+        hi = max((i[1] for i in ranges), default=1)
+        grids = [np.linspace(lo, hi, gridsize)] * len(columns)
+    else:
+        grids = [
+            np.linspace(*grid_range(values), gridsize) if len(values) else np.zeros(0)
+            for values in columns
+        ]
+    estimates = densities(columns, grids, bw_method)
+    index = np.unique(np.concatenate(grids))
+    data = [
+        np.interp(index, grid, values, left=np.nan, right=np.nan)
+        if len(grid)
+        else np.full(len(index), np.nan)
+        for grid, values in zip(grids, estimates)
+    ]
+    return pd.DataFrame(
+        np.column_stack(data) if data else None, index=index, columns=tsd.columns
+    )
@@ -1,6 +1,11 @@
 """Collection of functions for the manipulation of time series."""
 
+import contextlib
+import contextvars
+import functools
+import inspect
 import itertools
+import threading
 import warnings
 
 try:
@@ -31,10 +36,10 @@ ldocstrings["ofilename"] = """ofilename : str
 
         Output filename for the plot.  Extension defines
         the type, for example 'filename.png' will create a PNG file.
+        Within Python can also be a binary file object.
 
-        If used within Python, and `ofilename` is None will return the
-        Matplotlib figure that can then be changed or added to as
-        needed."""
+        Within Python the Matplotlib figure is returned, and if `ofilename`
+        is None it can then be changed or added to as needed."""
 ldocstrings["xtitle"] = """xtitle : str
         [optional, default depends on type]
 
@@ -483,6 +488,114 @@ ldocstrings["prob_plot_sort_values"] = """prob_plot_sort_values : str
 
         Only used for norm_xaxis, norm_yaxis, lognorm_xaxis,
         lognorm_yaxis, weibull_xaxis, and weibull_yaxis."""
+ldocstrings["prob_plot_max_points"] = """prob_plot_max_points : int
+        [optional, default is None]
+
+        The most points to draw for each column of the probability plots.  If
+        a column has more values, the max_points/4 largest and smallest values
+        in the tails are all drawn and the values between them are thinned to
+        points evenly spaced along the probability axis.  The default of None
+        draws all values.
+
+        Only used for norm_xaxis, norm_yaxis, lognorm_xaxis,
+        lognorm_yaxis, weibull_xaxis, and weibull_yaxis."""
+ldocstrings["chunksize"] = """chunksize : int
+        [optional, default is None]
+
+        If given, read the input_ts CSV file or stdin in blocks of chunksize
+        rows, for data sets larger than memory.  The "clean" and "por"
+        keywords only apply within each block.
+
+        For the probability plots the values are sorted on disk and merged
+        to draw at most prob_plot_max_points for each column, which defaults
+        to 10000 with chunksize.  For heatmap each block is reduced to the
+        cells as it is read.  For hexbin the input is read twice, first for
+        the range of the values, and each block is binned into the hexagons.
+        For histogram the input is read twice unless histogram_bins is a list
+        of edges, and each block is counted in the bins.  For boxplot each
+        block is added to the quantile sketches of boxplot_mode="sketch".
+
+        Only used for boxplot, heatmap, hexbin, histogram, norm_xaxis,
+        norm_yaxis, lognorm_xaxis, lognorm_yaxis, weibull_xaxis, and
+        weibull_yaxis."""
+ldocstrings["bw_method"] = """bw_method : str or float
+        [optional, default is 'scott']
+
+        Rule for the bandwidth of the Gaussian kernel.
+
+        +-----------+-------------------------------------------------------+
+        | bw_method | Description                                           |
+        +===========+=======================================================+
+        | scott     | Scott's rule, the standard deviation times n**(-1/5)  |
+        +-----------+-------------------------------------------------------+
+        | silverman | Silverman's rule, the standard deviation times        |
+        |           | (n*3/4)**(-1/5)                                       |
+        +-----------+-------------------------------------------------------+
+        | isj       | Improved Sheather-Jones rule of Botev et al. (2010),  |
+        |           | better for multimodal data.  Uses 'silverman' if      |
+        |           | there is no solution.                                 |
+        +-----------+-------------------------------------------------------+
+        | number    | The standard deviation times the number               |
+        +-----------+-------------------------------------------------------+
+
+        Only used for kde, kde_time, and probability_density."""
+ldocstrings["kde_gridsize"] = """kde_gridsize : int
+        [optional, default is 1000]
+
+        Number of points the kernel density is estimated at.  The data is
+        binned and convolved with the kernel using an FFT, so millions of
+        values take a fraction of a second.  For kde_time the points span the
+        y axis of the time series plot and all columns share them.
+
+        Only used for kde, kde_time, and probability_density."""
+ldocstrings["kde_shared_grid"] = """kde_shared_grid
+        [optional, default is False]
+
+        If True estimate all columns on one grid over the range of all
+        columns, otherwise each column has a grid from half of its data range
+        below its minimum to half above its maximum.
+
+        Only used for kde and probability_density."""
+ldocstrings["decimate"] = """decimate
+        [optional, default is 'auto']
+
+        Reduce the points drawn for each line to what the plot in pixels can
+        show.  Makes plots of long data sets much faster with the same look.
+
+        +----------+--------------------------------------------------------+
+        | decimate | Description                                            |
+        +==========+========================================================+
+        | auto     | Same as 'minmax' if the figure is saved and closed,    |
+        |          | otherwise draw all points since a figure kept open     |
+        |          | can be zoomed.                                         |
+        +----------+--------------------------------------------------------+
+        | minmax   | Keep the first, last, minimum, and maximum point in    |
+        |          | each pixel column.  Peaks and gaps are kept.           |
+        +----------+--------------------------------------------------------+
+        | lttb     | Largest-Triangle-Three-Buckets, keeps about two points |
+        |          | per pixel column that best keep the shape of the line. |
+        +----------+--------------------------------------------------------+
+        | None     | Draw all points.                                       |
+        +----------+--------------------------------------------------------+
+
+        The methods apply to lines sorted along the x axis.  Other lines only
+        drop points that fall in the same pixel as the point before, and
+        markers without lines only draw one marker in each pixel.  Log axes
+        are decimated in log space and the first and last points are always
+        kept.  Lines with no more than four points per pixel column are
+        always drawn in full."""
+ldocstrings["close"] = """close
+        [optional, default is None, Python API only]
+
+        What to do with the figure after the plot is made.  The default of
+        None closes the figure after saving it if `ofilename` is given and
+        keeps it open if `ofilename` is None.  If True always closes the
+        figure, and if False always keeps it open.
+
+        An open figure is managed by pyplot so it can be shown or changed
+        with pyplot.  A closed figure is never given to pyplot, it is only
+        returned, so it frees its memory when no longer referenced and can be
+        made from many threads at once."""
 
 MARKER_LIST = [
     ".",
@@ -577,7 +690,7 @@ def check_column_legend(plottype, tsd, legend_names):
     # print("in ck_col_lg :", plottype, type(tsd), len(tsd.columns), type(legend_names), legend_names)
     # Check number of columns.
     if (
-        plottype in ("bootstrap", "heatmap", "autocorrelation", "lag_plot", "waterfall")
+        plottype in ("bootstrap", "autocorrelation", "lag_plot", "waterfall")
         and len(tsd.columns) != 1
     ):
         raise ValueError(
@@ -700,7 +813,7 @@ def prepare_styles(ntrace, style, colors, linestyles, markerstyles):
 
 
 def hv_lines(
-    plt,
+    ax,
     hlines_y=None,
     hlines_xmin=None,
     hlines_xmax=None,
@@ -718,7 +831,7 @@ def hv_lines(
         hlines_xmax = tsutils.make_list(hlines_xmax)
         hlines_colors = tsutils.make_list(hlines_colors)
         hlines_linestyles = tsutils.make_list(hlines_linestyles)
-        nxlim = plt.get_xlim()
+        nxlim = ax.get_xlim()
         if hlines_xmin is None:
             hlines_xmin = nxlim[0]
         if hlines_xmax is None:
@@ -729,13 +842,13 @@ def hv_lines(
         vlines_ymax = tsutils.make_list(vlines_ymax)
         vlines_colors = tsutils.make_list(vlines_colors)
         vlines_linestyles = tsutils.make_list(vlines_linestyles)
-        nylim = plt.get_ylim()
+        nylim = ax.get_ylim()
         if vlines_ymin is None:
             vlines_ymin = nylim[0]
         if vlines_ymax is None:
             vlines_ymax = nylim[1]
     if hlines_y is not None:
-        plt.hlines(
+        ax.hlines(
             hlines_y,
             hlines_xmin,
             hlines_xmax,
@@ -743,11 +856,137 @@ def hv_lines(
             linestyles=hlines_linestyles,
         )
     if vlines_x is not None:
-        plt.vlines(
+        ax.vlines(
             vlines_x,
             vlines_ymin,
             vlines_ymax,
             colors=vlines_colors,
             linestyles=vlines_linestyles,
         )
-    return plt
+    return ax
+
+
+# Only one set of rcParams and of pandas unit converters exists per process.
+# Renders that use the same styles share them, a render with different styles
+# waits for the others to finish.
+_style_condition = threading.Condition()
+_style_state = {"styles": None, "count": 0, "context": None}
+
+# Text layout and drawing use matplotlib caches shared by all threads, and a
+# few plots are drawn by third party code on the pyplot current axes.
+draw_lock = threading.RLock()
+
+# Extra keywords for savefig, for example metadata from the render cache.
+savefig_kwds = contextvars.ContextVar("savefig_kwds", default={})
+
+
+@contextlib.contextmanager
+def _pandas_converters():
+    """Keep the pandas date converters registered inside the context.
+
+    By default pandas registers and removes them around each of its plot
+    calls, which removes them from under other threads that are plotting.
+    """
+    import pandas as pd
+
+    option = "plotting.matplotlib.register_converters"
+    value = pd.get_option(option)
+    pd.plotting.register_matplotlib_converters()
+    try:
+        with pd.option_context(option, True):
+            yield
+    finally:
+        if value == "auto":
+            pd.plotting.deregister_matplotlib_converters()
+
+
+@contextlib.contextmanager
+def style_context(plot_styles):
+    """Apply the matplotlib `plot_styles` to rcParams inside the context.
+
+    The rcParams are restored when the last render using them leaves, so
+    concurrent renders from threads do not change each other's styles.
+    """
+    import matplotlib.style
+
+    key = repr(plot_styles)
+    with _style_condition:
+        _style_condition.wait_for(
+            lambda: _style_state["count"] == 0 or _style_state["styles"] == key
+        )
+        if _style_state["count"] == 0:
+            with contextlib.ExitStack() as stack:
+                stack.enter_context(matplotlib.style.context(plot_styles))
+                stack.enter_context(_pandas_converters())
+                _style_state.update(styles=key, context=stack.pop_all())
+        _style_state["count"] += 1
+    try:
+        yield
+    finally:
+        with _style_condition:
+            _style_state["count"] -= 1
+            if _style_state["count"] == 0:
+                _style_state["context"].close()
+                _style_state.update(styles=None, context=None)
+                _style_condition.notify_all()
+
+
+def styled(func):
+    """Decorator to make a plot function render inside its `style_context`.
+
+    The styles are the "plot_styles" keyword of the call with "no-latex"
+    appended.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwds):
+        bound = inspect.signature(func).bind(*args, **kwds)
+        bound.apply_defaults()
+        plot_styles = tsutils.make_list(bound.arguments.get("plot_styles")) or []
+        with style_context(plot_styles + ["no-latex"]):
+            return func(*args, **kwds)
+
+    return wrapper
+
+
+def keep_open(ofilename=None, close=None):
+    """Return True if the "close" policy keeps the figure open."""
+    return close is False or (close is None and ofilename is None)
+
+
+def new_figure(ofilename=None, close=None, **kwds):
+    """Return a new matplotlib Figure for a plot.
+
+    If the "close" policy keeps the figure open it is made with pyplot so it
+    can be shown or changed with pyplot.  Otherwise the Figure has its own Agg
+    canvas and is never known to pyplot, so it can be drawn and saved from
+    any thread.  The `kwds` are passed to the Figure.
+    """
+    if keep_open(ofilename, close):
+        import matplotlib.pyplot as plt
+
+        return plt.figure(**kwds)
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(**kwds)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def save_figure(fig, ofilename=None, close=None, tight_layout=True):
+    """Lay out `fig`, save it to `ofilename` and close it according to `close`.
+
+    See the "close" docstring for the policy.  Returns the Figure.
+    """
+    with draw_lock:
+        if tight_layout:
+            fig.tight_layout()
+        if ofilename is not None:
+            fig.savefig(ofilename, **savefig_kwds.get())
+    if not keep_open(ofilename, close) and fig.canvas.manager is not None:
+        import matplotlib.pyplot as plt
+
+        plt.close(fig)
+    return fig
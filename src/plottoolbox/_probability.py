@@ -0,0 +1,185 @@
+"""Plotting positions and values for the probability axis plots."""
+
+import tempfile
+
+import numpy as np
+
+from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+from . import _cache, _stream
+
+# Number of points drawn for each column when sorting out of core and
+# prob_plot_max_points is None.
+OUT_OF_CORE_MAX_POINTS = 10000
+
+# Number of values read from each sorted run at a time during the merge.
+MERGE_BLOCKSIZE = 2**16
+
+
+def thin_indices(positions, max_points=None):
+    """Indices of the points to draw from increasing probability `positions`.
+
+    Keeps all of the `max_points // 4` points at each end, the extreme tails,
+    and thins the points between them to about `max_points // 2` points evenly
+    spaced along the probability axis.
+    """
+    npoints = len(positions)
+    if max_points is None or npoints <= max_points:
+        return np.arange(npoints)
+    tail = max_points // 4
+    body = np.searchsorted(
+        positions,
+        np.linspace(positions[tail], positions[-tail - 1], max_points - 2 * tail),
+    )
+    return np.unique(
+        np.concatenate((np.arange(tail), body, np.arange(npoints - tail, npoints)))
+    )
+
+
+def read_input(input_ts, chunksize=None, skiprows=None, **kwds):
+    """Read `input_ts` for a probability plot.
+
+    Returns the DataFrame from common_kwds and None, or if `chunksize` is
+    given, an empty DataFrame with the selected columns and a list for each
+    column of sorted runs.  Each run is one block of `chunksize` rows of a CSV
+    file or stdin, put through tsutils.common_kwds, then sorted and memory
+    mapped from a temporary file, so the whole input is never in memory.
+    """
+    if chunksize is None:
+        return _cache.common_kwds(input_ts, skiprows=skiprows, **kwds), None
+
+    tsd = None
+    files = []
+    lengths = []
+    for chunk in _stream.read_chunks(
+        input_ts, chunksize=chunksize, skiprows=skiprows, **kwds
+    ):
+        if tsd is None:
+            tsd = chunk.iloc[:0]
+            files = [tempfile.TemporaryFile() for _ in chunk.columns]
+            lengths = [[] for _ in chunk.columns]
+        for fpo, clengths, (_, values) in zip(files, lengths, chunk.items()):
+            values = np.sort(values.dropna().to_numpy(dtype="float64"))
+            values.tofile(fpo)
+            clengths.append(len(values))
+
+    runs = []
+    for fpo, clengths in zip(files, lengths):
+        fpo.flush()
+        data = (
+            np.memmap(fpo, dtype="float64", mode="r") if sum(clengths) else np.empty(0)
+        )
+        fpo.close()
+        offsets = np.cumsum([0] + clengths)
+        runs.append([data[i:j] for i, j in zip(offsets[:-1], offsets[1:]) if j > i])
+    return tsd, runs
+
+
+def merge_select(runs, ranks, blocksize=MERGE_BLOCKSIZE):
+    """Values at the increasing `ranks` of the sorted merge of sorted `runs`.
+
+    A blockwise k-way merge that reads `blocksize` values from each run at a
+    time.  Only the blocks that hold one of `ranks` are sorted.
+    """
+    selected = np.empty(len(ranks))
+    starts = [0] * len(runs)
+    merged = 0
+    index = 0
+    while index < len(ranks):
+        blocks = [run[i : i + blocksize] for run, i in zip(runs, starts)]
+        cutoff = min(
+            (
+                block[-1]
+                for run, i, block in zip(runs, starts, blocks)
+                if i + len(block) < len(run)
+            ),
+            default=np.inf,
+        )
+        takes = [np.searchsorted(block, cutoff, side="right") for block in blocks]
+        count = sum(takes)
+        stop = np.searchsorted(ranks, merged + count, side="left")
+        if stop > index:
+            values = np.sort(
+                np.concatenate([block[:j] for block, j in zip(blocks, takes)])
+            )
+            selected[index:stop] = values[ranks[index:stop] - merged]
+            index = stop
+        starts = [i + j for i, j in zip(starts, takes)]
+        merged += count
+    return selected
+
+
+def plotting_positions(npoints, plotting_position, ranks):
+    """Plotting positions of the 0 based `ranks` out of `npoints` values.
+
+    All of the plotting positions in tsutils are (i - a) / (n + b) for rank i
+    from 1 to n, so a and b are found from the positions for two values
+    instead of making an array of all `npoints` positions.
+    """
+    first, second = tsutils.set_plotting_position(2, plotting_position)
+    denominator = 1 / (second - first)
+    return (np.asarray(ranks) + first * denominator) / (npoints - 2 + denominator)
+
+
+def probability_points(
+    values,
+    ppf,
+    plotting_position="weibull",
+    sort_values="descending",
+    max_points=None,
+):
+    """Return the probability axis positions and values to plot.
+
+    The `values` are sorted according to `sort_values` and the positions are
+    the `ppf` of the plotting positions.  If `max_points` is given sorted
+    values are thinned with `thin_indices`.  If `values` is a list of sorted
+    runs from `read_input` the values are merged out of core.
+    """
+    if isinstance(values, list):
+        return _merged_points(values, ppf, plotting_position, sort_values, max_points)
+    values = np.asarray(values)
+    if sort_values == "ascending":
+        values = np.sort(values)
+    elif sort_values == "descending":
+        values = np.sort(values)[::-1]
+    positions = ppf(tsutils.set_plotting_position(len(values), plotting_position))
+    if max_points is not None and sort_values in ("ascending", "descending"):
+        keep = thin_indices(np.asarray(positions), int(max_points))
+        positions, values = positions[keep], values[keep]
+    return positions, values
+
+
+def _merged_points(runs, ppf, plotting_position, sort_values, max_points):
+    """Probability axis positions and values of a column in sorted runs."""
+    if sort_values not in ("ascending", "descending"):
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                Reading the input in chunks needs "prob_plot_sort_values" to
+                be "ascending" or "descending".  You gave {sort_values}.
+                """
+            )
+        )
+    max_points = int(max_points or OUT_OF_CORE_MAX_POINTS)
+    npoints = sum(len(run) for run in runs)
+    if npoints <= max_points:
+        grid = np.arange(npoints)
+    else:
+        tail = max_points // 4
+        grid = np.unique(
+            np.concatenate(
+                (
+                    np.arange(tail),
+                    np.linspace(tail, npoints - tail - 1, 64 * max_points).astype(
+                        np.int64
+                    ),
+                    np.arange(npoints - tail, npoints),
+                )
+            )
+        )
+    positions = ppf(plotting_positions(npoints, plotting_position, grid))
+    keep = thin_indices(np.asarray(positions), max_points)
+    positions, ranks = positions[keep], grid[keep]
+    if sort_values == "descending":
+        return positions, merge_select(runs, npoints - 1 - ranks[::-1])[::-1]
+    return positions, merge_select(runs, ranks)
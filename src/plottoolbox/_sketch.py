@@ -0,0 +1,151 @@
+"""Quantile sketches for box plots of data larger than memory."""
+
+import numpy as np
+
+# Largest number of values kept in each level of a QuantileSketch.
+SKETCH_SIZE = 4096
+
+# Number of the smallest and of the largest values kept exactly for the
+# whiskers and fliers of a BoxSketch.
+MAX_FLIERS = 1000
+
+
+class QuantileSketch:
+    """Quantile sketch of a stream of values.
+
+    A KLL style sketch with levels of at most `size` values.  When a level
+    is full it is sorted and every other value, starting at a random first
+    or second value, moves up to the next level where each value stands for
+    twice as many.  Quantiles are exact until more than `size` values have
+    been added, and after that the rank error is a small fraction of a
+    percent.  The random choices come from `seed` so a sketch of the same
+    values is always the same.
+    """
+
+    def __init__(self, size=SKETCH_SIZE, seed=0):
+        self.size = int(size)
+        self.levels = [np.zeros(0)]
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Add the finite values of the array `values`."""
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[np.isfinite(values)]
+        self.count += len(values)
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        level = 0
+        while level < len(self.levels):
+            if len(self.levels[level]) > self.size:
+                ordered = np.sort(self.levels[level])
+                # An odd value out stays behind at this level.
+                self.levels[level] = ordered[len(ordered) - len(ordered) % 2 :]
+                ordered = ordered[: len(ordered) - len(ordered) % 2]
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.zeros(0))
+                self.levels[level + 1] = np.concatenate(
+                    (self.levels[level + 1], ordered[self.rng.integers(2) :: 2])
+                )
+            level += 1
+
+    def quantile(self, q):
+        """Values at the quantiles `q`, interpolated like numpy.percentile."""
+        values = np.concatenate(self.levels)
+        if len(values) == 0:
+            return np.full(np.shape(q), np.nan)
+        weights = np.concatenate(
+            [np.full(len(level), 2.0**i) for i, level in enumerate(self.levels)]
+        )
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        positions = np.cumsum(weights) - (weights + 1) / 2
+        return np.interp(np.asarray(q) * (weights.sum() - 1), positions, values)
+
+
+class BoxSketch:
+    """Box plot statistics of a stream of values in bounded memory.
+
+    The quartiles come from a QuantileSketch.  The `max_fliers` smallest and
+    largest values are kept exactly, so the whiskers are exact whenever they
+    end within these values.  Past the whiskers all of these values are
+    fliers, and between them and the whiskers the fliers are the thinned
+    values held by the sketch.
+    """
+
+    def __init__(self, size=SKETCH_SIZE, max_fliers=MAX_FLIERS, seed=0):
+        self.sketch = QuantileSketch(size, seed=seed)
+        self.max_fliers = int(max_fliers)
+        self.lowest = np.zeros(0)
+        self.highest = np.zeros(0)
+        self.total = 0.0
+
+    def update(self, values):
+        """Add the finite values of the array `values`."""
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[np.isfinite(values)]
+        self.sketch.update(values)
+        self.total += values.sum()
+        keep = self.max_fliers
+        lowest = np.concatenate((self.lowest, values))
+        if len(lowest) > keep:
+            lowest = np.partition(lowest, keep - 1)[:keep]
+        self.lowest = np.sort(lowest)
+        highest = np.concatenate((self.highest, values))
+        if len(highest) > keep:
+            highest = np.partition(highest, len(highest) - keep)[-keep:]
+        self.highest = np.sort(highest)
+
+    def stats(self, whis=1.5, label=None):
+        """Statistics of the values for matplotlib.axes.Axes.bxp.
+
+        The same statistics as matplotlib.cbook.boxplot_stats with the
+        whiskers at `whis` times the inter-quartile range past the quartiles.
+        """
+        count = self.sketch.count
+        if count == 0:
+            stats = dict.fromkeys(
+                ("mean", "iqr", "q1", "med", "q3", "whislo", "whishi", "cilo", "cihi"),
+                np.nan,
+            )
+            return {"label": label, "fliers": np.zeros(0), **stats}
+        q1, med, q3 = self.sketch.quantile([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        loval, hival = q1 - whis * iqr, q3 + whis * iqr
+        items = np.sort(np.concatenate(self.sketch.levels))
+
+        # The kept values hold every value past the smallest kept value.
+        inside = self.highest[self.highest <= hival]
+        if len(inside):
+            whishi = inside[-1]
+        else:
+            inside = items[items <= hival]
+            whishi = inside[-1] if len(inside) else q3
+        inside = self.lowest[self.lowest >= loval]
+        if len(inside):
+            whislo = inside[0]
+        else:
+            inside = items[items >= loval]
+            whislo = inside[0] if len(inside) else q1
+        whishi, whislo = max(whishi, q3), min(whislo, q1)
+
+        fliers = np.concatenate(
+            (
+                self.lowest[self.lowest < whislo],
+                items[(items < whislo) & (items > self.lowest[-1])],
+                items[(items > whishi) & (items < self.highest[0])],
+                self.highest[self.highest > whishi],
+            )
+        )
+        return {
+            "label": label,
+            "mean": self.total / count,
+            "iqr": iqr,
+            "q1": q1,
+            "med": med,
+            "q3": q3,
+            "whislo": whislo,
+            "whishi": whishi,
+            "fliers": fliers,
+            "cilo": med - 1.57 * iqr / np.sqrt(count),
+            "cihi": med + 1.57 * iqr / np.sqrt(count),
+        }
@@ -0,0 +1,238 @@
+"""Read the input in blocks and reduce the values into bins as they arrive."""
+
+import numpy as np
+
+from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+from . import _cache
+
+EXACT_REDUCERS = ("mean", "sum", "min", "max", "count", "std")
+REDUCERS = EXACT_REDUCERS + ("median",)
+
+# Number of bins of the value range used for each "median" estimate.
+MEDIAN_BINS = 256
+
+
+def read_chunks(input_ts, chunksize=None, skiprows=None, **kwds):
+    """Yield the DataFrames of `input_ts` put through common_kwds.
+
+    Without `chunksize` the whole input is one DataFrame from the cached
+    common_kwds.  Otherwise the input_ts CSV file or stdin is read in blocks
+    of `chunksize` rows, with the index parsed as dates if the `index_type`
+    is "datetime", and each block is put through tsutils.common_kwds.
+    """
+    if chunksize is None:
+        yield _cache.common_kwds(input_ts, skiprows=skiprows, **kwds)
+        return
+
+    import sys
+
+    import pandas as pd
+
+    reader = pd.read_csv(
+        sys.stdin if input_ts == "-" else input_ts,
+        index_col=0,
+        skiprows=skiprows,
+        parse_dates=kwds.get("index_type", "datetime") == "datetime",
+        chunksize=int(chunksize),
+    )
+    for chunk in reader:
+        yield tsutils.common_kwds(chunk, **kwds)
+
+
+def check_reducer(reducer, reducers=REDUCERS):
+    """Return the name of the reducer, raising ValueError if not in `reducers`."""
+    if reducer is None:
+        return "mean"
+    if reducer not in reducers:
+        raise ValueError(
+            tsutils.error_wrapper(
+                f"""
+                The reducer must be one of {reducers}.  You gave {reducer}.
+                """
+            )
+        )
+    return reducer
+
+
+class BinnedReducer:
+    """Reduce the values of several columns into bins with integer keys.
+
+    Values are added in any number of blocks with `add` and only the running
+    count, and the sum, extreme, or mean and sum of squared deviations needed
+    by `reducer`, of each bin is kept.  The "median" is estimated from a
+    histogram of MEDIAN_BINS bins across `value_range` in each bin, so it is
+    within one of these bins of the middle value, or of the lower of the two
+    middle values.  The bins cover
+    the range of the keys seen so far and grow as needed.
+    """
+
+    def __init__(self, ncolumns, reducer="mean", value_range=None):
+        self.reducer = check_reducer(reducer)
+        if self.reducer == "median" and value_range is None:
+            raise ValueError(
+                tsutils.error_wrapper(
+                    """
+                    The "median" reducer needs the range of the values.
+                    """
+                )
+            )
+        self.value_range = value_range
+        self.ncolumns = ncolumns
+        self.offset = 0
+        self.counts = np.zeros((ncolumns, 0), dtype=np.int64)
+        self.state = None
+        self.squares = None
+        self.histograms = None
+        if self.reducer in ("mean", "sum", "std"):
+            self.state = np.zeros((ncolumns, 0))
+        elif self.reducer in ("min", "max"):
+            self.state = np.full((ncolumns, 0), self._empty())
+        if self.reducer == "std":
+            self.squares = np.zeros((ncolumns, 0))
+        elif self.reducer == "median":
+            self.histograms = np.zeros((ncolumns, 0, MEDIAN_BINS), dtype=np.int64)
+
+    def _empty(self):
+        """Value of the state of a bin without values."""
+        if self.reducer == "min":
+            return np.inf
+        if self.reducer == "max":
+            return -np.inf
+        return 0.0
+
+    def _grow(self, lo, hi):
+        """Make the bins cover keys `lo` to `hi`, doubling to grow in blocks."""
+        nbins = self.counts.shape[1]
+        if nbins and lo >= self.offset and hi < self.offset + nbins:
+            return
+        if nbins == 0:
+            start, stop = lo, hi + 1
+        else:
+            start, stop = self.offset, self.offset + nbins
+            if lo < start:
+                start = min(lo, start - nbins)
+            if hi >= stop:
+                stop = max(hi + 1, stop + nbins)
+        shift = self.offset - start
+
+        def grown(array, fill):
+            new = np.full(
+                (self.ncolumns, stop - start) + array.shape[2:], fill, array.dtype
+            )
+            new[:, shift : shift + nbins] = array
+            return new
+
+        self.counts = grown(self.counts, 0)
+        if self.state is not None:
+            self.state = grown(self.state, self._empty())
+        if self.squares is not None:
+            self.squares = grown(self.squares, 0)
+        if self.histograms is not None:
+            self.histograms = grown(self.histograms, 0)
+        self.offset = start
+
+    def add(self, keys, values):
+        """Add the rows of 2D `values` to the bins of the matching `keys`.
+
+        Missing values are skipped.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        if len(keys) == 0:
+            return
+        values = np.asarray(values, dtype="float64").reshape(len(keys), -1)
+        lo, hi = int(keys.min()), int(keys.max())
+        self._grow(lo, hi)
+        span = hi - lo + 1
+        window = slice(lo - self.offset, hi - self.offset + 1)
+        shape = (self.ncolumns, span)
+
+        # Column major flat keys are sorted whenever the keys are sorted.
+        flat = (keys - lo) + span * np.arange(self.ncolumns)[:, None]
+        flat, flat_values = flat.ravel(), values.T.ravel()
+        valid = np.isfinite(flat_values)
+        flat, flat_values = flat[valid], flat_values[valid]
+        size = span * self.ncolumns
+        counts = np.bincount(flat, minlength=size)
+        if self.reducer in ("mean", "sum"):
+            self.state[:, window] += np.bincount(
+                flat, flat_values, minlength=size
+            ).reshape(shape)
+        elif self.reducer == "std":
+            # Chan et al. update of the mean and sum of squared deviations.
+            with np.errstate(invalid="ignore", divide="ignore"):
+                means = np.bincount(flat, flat_values, minlength=size) / counts
+            deviations = flat_values - means[flat]
+            squares = np.bincount(flat, deviations**2, minlength=size)
+            before = self.counts[:, window]
+            total = before + counts.reshape(shape)
+            occupied = counts.reshape(shape) > 0
+            delta = means.reshape(shape) - self.state[:, window]
+            ratio = np.divide(
+                counts.reshape(shape), total, out=np.zeros(shape), where=occupied
+            )
+            self.state[:, window] += np.where(occupied, delta * ratio, 0.0)
+            self.squares[:, window] += np.where(
+                occupied, squares.reshape(shape) + delta**2 * before * ratio, 0.0
+            )
+        elif self.reducer == "median":
+            vlo, vhi = self.value_range
+            width = (vhi - vlo) / MEDIAN_BINS if vhi > vlo else 1.0
+            sub = np.clip(
+                ((flat_values - vlo) / width).astype(np.int64), 0, MEDIAN_BINS - 1
+            )
+            self.histograms[:, window] += np.bincount(
+                flat * MEDIAN_BINS + sub, minlength=size * MEDIAN_BINS
+            ).reshape(shape + (MEDIAN_BINS,))
+        elif self.reducer in ("min", "max") and len(flat):
+            if np.any(flat[1:] < flat[:-1]):
+                order = np.argsort(flat, kind="stable")
+                flat, flat_values = flat[order], flat_values[order]
+            starts = np.flatnonzero(np.concatenate(([True], flat[1:] != flat[:-1])))
+            ufunc = np.minimum if self.reducer == "min" else np.maximum
+            extremes = np.full(size, self._empty())
+            extremes[flat[starts]] = ufunc.reduceat(flat_values, starts)
+            self.state[:, window] = ufunc(
+                self.state[:, window], extremes.reshape(shape)
+            )
+        self.counts[:, window] += counts.reshape(shape)
+
+    def _median(self, window, counts):
+        """Median of each bin interpolated within its histogram bin."""
+        histograms = self.histograms[:, window]
+        cumulative = np.cumsum(histograms, axis=-1)
+        half = counts / 2
+        index = np.minimum((cumulative < half[..., None]).sum(axis=-1), MEDIAN_BINS - 1)
+        below = np.take_along_axis(cumulative, index[..., None], -1)[..., 0]
+        inside = np.take_along_axis(histograms, index[..., None], -1)[..., 0]
+        below = below - inside
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = np.clip((half - below) / inside, 0, 1)
+        vlo, vhi = self.value_range
+        return vlo + (index + fraction) * (vhi - vlo) / MEDIAN_BINS
+
+    def result(self):
+        """Return the keys and a 2D array of the reduced value of each column.
+
+        The keys are every integer from the smallest to the largest key added
+        and bins without values are missing.
+        """
+        occupied = np.flatnonzero(self.counts.any(axis=0))
+        if len(occupied) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros((self.ncolumns, 0))
+        window = slice(occupied[0], occupied[-1] + 1)
+        counts = self.counts[:, window]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if self.reducer == "count":
+                values = counts.astype("float64")
+            elif self.reducer == "mean":
+                values = self.state[:, window] / counts
+            elif self.reducer == "std":
+                values = np.sqrt(self.squares[:, window] / counts)
+            elif self.reducer == "median":
+                values = self._median(window, counts)
+            else:
+                values = self.state[:, window].copy()
+        values[counts == 0] = np.nan
+        keys = self.offset + np.arange(window.start, window.stop)
+        return keys, values
@@ -3,69 +3,46 @@
 import os.path as _osp
 import sys as _sys
 
-from . import (
-    about,
-    autocorrelation,
-    bar,
-    bar_stacked,
-    barh,
-    barh_stacked,
-    bootstrap,
-    boxplot,
-    double_mass,
-    handh,
-    heatmap,
-    hexbin,
-    histogram,
-    kde,
-    kde_time,
-    lag_plot,
-    lognorm_xaxis,
-    lognorm_yaxis,
-    norm_xaxis,
-    norm_yaxis,
-    probability_density,
-    scatter_matrix,
-    target,
-    taylor,
-    time,
-    waterfall,
-    weibull_xaxis,
-    weibull_yaxis,
-    xy,
-)
+from . import _LAZY_FUNCTIONS, about
 
-__all__ = [
-    "about",
-    "autocorrelation",
-    "bar",
-    "bar_stacked",
-    "barh",
-    "barh_stacked",
-    "bootstrap",
-    "boxplot",
-    "double_mass",
-    "handh",
-    "heatmap",
-    "hexbin",
-    "histogram",
-    "kde",
-    "kde_time",
-    "lag_plot",
-    "lognorm_xaxis",
-    "lognorm_yaxis",
-    "norm_xaxis",
-    "norm_yaxis",
-    "probability_density",
-    "scatter_matrix",
-    "target",
-    "taylor",
-    "time",
-    "waterfall",
-    "weibull_xaxis",
-    "weibull_yaxis",
-    "xy",
-]
+# The plot functions are loaded from the package on first use.
+__all__ = ["about", *_LAZY_FUNCTIONS]
+
+
+def __getattr__(name):
+    """Get the plot functions from the package, loading them on first use."""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import plottoolbox
+
+    return getattr(plottoolbox, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def _summary(name):
+    """Return the first line of the docstring of `name` without importing it.
+
+    The plot modules import matplotlib, pandas, and scipy, which is too slow
+    just to list the subcommands, so the docstring is read from the source.
+    """
+    import ast
+    import importlib.util
+
+    import plottoolbox
+
+    if name == "about":
+        return plottoolbox.about.__doc__
+    module = plottoolbox._LAZY_FUNCTIONS[name]
+    spec = importlib.util.find_spec(module, "plottoolbox")
+    with open(spec.origin, encoding="utf-8") as fpi:
+        tree = ast.parse(fpi.read())
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == name:
+            return (ast.get_docstring(node) or "").split("\n\n")[0]
+    return ""
 
 
 def _main():
@@ -79,18 +56,37 @@ def _main():
         RSTHelpFormatter,
     )
 
-    from .toolbox_utils.src.toolbox_utils import tsutils
+    # Only the requested subcommand is registered, and only its plot module is
+    # imported.  Without a known subcommand all are registered, with just the
+    # summary line as docstring, to show the list of subcommands.
+    command = _sys.argv[1] if len(_sys.argv) > 1 else None
+    if command not in set(__all__) - {"render_many"}:
+        command = None
+
+    def _command(name):
+        def decorator(func):
+            if command is None:
+                func.__doc__ = _summary(name)
+            elif name == command:
+                from .toolbox_utils.src.toolbox_utils import tsutils
+
+                func = tsutils.copy_doc(__getattr__(name))(func)
+            else:
+                return func
+            return cltoolbox.command(name, formatter_class=RSTHelpFormatter)(func)
+
+        return decorator
 
-    @cltoolbox.command("about", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(about)
+    @_command("about")
     def about_cli():
         """docstring replaced by tsutils.copy_doc"""
         import pprint
 
+        from .toolbox_utils.src.toolbox_utils import tsutils
+
         pprint.pprint(tsutils.about(__name__))
 
-    @cltoolbox.command("autocorrelation", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(autocorrelation)
+    @_command("autocorrelation")
     def autocorrelation_cli(
         input_ts="-",
         columns=None,
@@ -118,9 +114,10 @@ def _main():
         source_units=None,
         target_units=None,
         plot_styles="bright",
+        max_lag=None,
     ):
         """docstring replaced by tsutils.copy_doc"""
-        autocorrelation(
+        __getattr__("autocorrelation")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -147,10 +144,10 @@ def _main():
             source_units=source_units,
             target_units=target_units,
             plot_styles=plot_styles,
+            max_lag=max_lag,
         )
 
-    @cltoolbox.command("bar", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(bar)
+    @_command("bar")
     def bar_cli(
         input_ts="-",
         columns=None,
@@ -200,7 +197,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        bar(
+        __getattr__("bar")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -249,8 +246,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("bar_stacked", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(bar_stacked)
+    @_command("bar_stacked")
     def bar_stacked_cli(
         input_ts="-",
         columns=None,
@@ -300,7 +296,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        bar_stacked(
+        __getattr__("bar_stacked")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -349,8 +345,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("barh", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(barh)
+    @_command("barh")
     def barh_cli(
         input_ts="-",
         columns=None,
@@ -400,7 +395,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        barh(
+        __getattr__("barh")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -449,8 +444,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("barh_stacked", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(barh_stacked)
+    @_command("barh_stacked")
     def barh_stacked_cli(
         input_ts="-",
         columns=None,
@@ -500,7 +494,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        barh_stacked(
+        __getattr__("barh_stacked")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -549,8 +543,20 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("bootstrap", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(bootstrap)
+    @_command("batch")
+    def batch_cli(manifest, report=None, workers=1):
+        """docstring replaced by tsutils.copy_doc"""
+        import csv
+
+        reports = __getattr__("batch")(manifest, report=report, workers=workers)
+        if reports:
+            writer = csv.DictWriter(_sys.stdout, fieldnames=list(reports[0]))
+            writer.writeheader()
+            writer.writerows(reports)
+        if any(i["status"] == "error" for i in reports):
+            _sys.exit(1)
+
+    @_command("bootstrap")
     def bootstrap_cli(
         input_ts="-",
         columns=None,
@@ -573,6 +579,8 @@ def _main():
         style="auto",
         bootstrap_size=50,
         bootstrap_samples=500,
+        bootstrap_statistics="mean,median,midrange",
+        seed=None,
         grid=False,
         por=False,
         invert_xaxis=False,
@@ -594,7 +602,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        bootstrap(
+        __getattr__("bootstrap")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -616,6 +624,8 @@ def _main():
             style=style,
             bootstrap_size=bootstrap_size,
             bootstrap_samples=bootstrap_samples,
+            bootstrap_statistics=bootstrap_statistics,
+            seed=seed,
             grid=grid,
             por=por,
             invert_xaxis=invert_xaxis,
@@ -637,8 +647,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("boxplot", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(boxplot)
+    @_command("boxplot")
     def boxplot_cli(
         input_ts="-",
         columns=None,
@@ -682,9 +691,11 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        boxplot_mode="exact",
+        chunksize=None,
     ):
         """docstring replaced by tsutils.copy_doc"""
-        boxplot(
+        __getattr__("boxplot")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -727,10 +738,11 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            boxplot_mode=boxplot_mode,
+            chunksize=chunksize,
         )
 
-    @cltoolbox.command("double_mass", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(double_mass)
+    @_command("double_mass")
     def double_mass_cli(
         input_ts="-",
         columns=None,
@@ -775,9 +787,10 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        decimate="auto",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        double_mass(
+        __getattr__("double_mass")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -821,10 +834,10 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            decimate=decimate,
         )
 
-    @cltoolbox.command("handh", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(handh)
+    @_command("handh")
     def handh_cli(
         input_ts="-",
         columns=None,
@@ -876,7 +889,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        handh(
+        __getattr__("handh")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -925,8 +938,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("heatmap", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(heatmap)
+    @_command("heatmap")
     def heatmap_cli(
         input_ts="-",
         columns=None,
@@ -966,9 +978,13 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        heatmap_cells="daily",
+        heatmap_reducer="mean",
+        heatmap_panels="stacked",
+        chunksize=None,
     ):
         """docstring replaced by tsutils.copy_doc"""
-        heatmap(
+        __getattr__("heatmap")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1007,10 +1023,13 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            heatmap_cells=heatmap_cells,
+            heatmap_reducer=heatmap_reducer,
+            heatmap_panels=heatmap_panels,
+            chunksize=chunksize,
         )
 
-    @cltoolbox.command("hexbin", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(hexbin)
+    @_command("hexbin")
     def hexbin_cli(
         input_ts="-",
         reduce_C_function=np.mean,
@@ -1035,9 +1054,10 @@ def _main():
         source_units=None,
         target_units=None,
         plot_styles="bright",
+        chunksize=None,
     ):
         """docstring replaced by tsutils.copy_doc"""
-        hexbin(
+        __getattr__("hexbin")(
             input_ts=input_ts,
             reduce_C_function=reduce_C_function,
             gridsize=gridsize,
@@ -1061,10 +1081,10 @@ def _main():
             source_units=source_units,
             target_units=target_units,
             plot_styles=plot_styles,
+            chunksize=chunksize,
         )
 
-    @cltoolbox.command("histogram", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(histogram)
+    @_command("histogram")
     def histogram_cli(
         input_ts="-",
         columns=None,
@@ -1106,9 +1126,12 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        histogram_bins=10,
+        histogram_layout="panels",
+        chunksize=None,
     ):
         """docstring replaced by tsutils.copy_doc"""
-        histogram(
+        __getattr__("histogram")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1149,10 +1172,12 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            histogram_bins=histogram_bins,
+            histogram_layout=histogram_layout,
+            chunksize=chunksize,
         )
 
-    @cltoolbox.command("kde", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(kde)
+    @_command("kde")
     def kde_cli(
         input_ts="-",
         columns=None,
@@ -1200,9 +1225,12 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        bw_method="scott",
+        kde_gridsize=1000,
+        kde_shared_grid=False,
     ):
         """docstring replaced by tsutils.copy_doc"""
-        kde(
+        __getattr__("kde")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1249,10 +1277,12 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            bw_method=bw_method,
+            kde_gridsize=kde_gridsize,
+            kde_shared_grid=kde_shared_grid,
         )
 
-    @cltoolbox.command("kde_time", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(kde_time)
+    @_command("kde_time")
     def kde_time_cli(
         input_ts="-",
         columns=None,
@@ -1302,9 +1332,11 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        bw_method="scott",
+        kde_gridsize=1000,
     ):
         """docstring replaced by tsutils.copy_doc"""
-        kde_time(
+        __getattr__("kde_time")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1353,10 +1385,11 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            bw_method=bw_method,
+            kde_gridsize=kde_gridsize,
         )
 
-    @cltoolbox.command("lag_plot", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(lag_plot)
+    @_command("lag_plot")
     def lag_plot_cli(
         input_ts="-",
         columns=None,
@@ -1386,6 +1419,8 @@ def _main():
         source_units=None,
         target_units=None,
         lag_plot_lag=1,
+        lag_plot_mode="scatter",
+        lag_plot_bins=100,
         plot_styles="bright",
         hlines_y=None,
         hlines_xmin=None,
@@ -1399,7 +1434,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        lag_plot(
+        __getattr__("lag_plot")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1428,6 +1463,8 @@ def _main():
             source_units=source_units,
             target_units=target_units,
             lag_plot_lag=lag_plot_lag,
+            lag_plot_mode=lag_plot_mode,
+            lag_plot_bins=lag_plot_bins,
             plot_styles=plot_styles,
             hlines_y=hlines_y,
             hlines_xmin=hlines_xmin,
@@ -1441,8 +1478,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("lognorm_xaxis", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(lognorm_xaxis)
+    @_command("lognorm_xaxis")
     def lognorm_xaxis_cli(
         input_ts="-",
         columns=None,
@@ -1476,6 +1512,8 @@ def _main():
         dropna="all",
         plotting_position="weibull",
         prob_plot_sort_values="descending",
+        prob_plot_max_points=None,
+        chunksize=None,
         source_units=None,
         target_units=None,
         plot_styles="bright",
@@ -1491,7 +1529,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        lognorm_xaxis(
+        __getattr__("lognorm_xaxis")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1524,6 +1562,8 @@ def _main():
             dropna=dropna,
             plotting_position=plotting_position,
             prob_plot_sort_values=prob_plot_sort_values,
+            prob_plot_max_points=prob_plot_max_points,
+            chunksize=chunksize,
             source_units=source_units,
             target_units=target_units,
             plot_styles=plot_styles,
@@ -1539,8 +1579,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("lognorm_yaxis", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(lognorm_yaxis)
+    @_command("lognorm_yaxis")
     def lognorm_yaxis_cli(
         input_ts="-",
         columns=None,
@@ -1574,6 +1613,8 @@ def _main():
         dropna="all",
         plotting_position="weibull",
         prob_plot_sort_values="descending",
+        prob_plot_max_points=None,
+        chunksize=None,
         source_units=None,
         target_units=None,
         plot_styles="bright",
@@ -1589,7 +1630,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        lognorm_yaxis(
+        __getattr__("lognorm_yaxis")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1622,6 +1663,8 @@ def _main():
             dropna=dropna,
             plotting_position=plotting_position,
             prob_plot_sort_values=prob_plot_sort_values,
+            prob_plot_max_points=prob_plot_max_points,
+            chunksize=chunksize,
             source_units=source_units,
             target_units=target_units,
             plot_styles=plot_styles,
@@ -1637,8 +1680,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("norm_xaxis", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(norm_xaxis)
+    @_command("norm_xaxis")
     def norm_xaxis_cli(
         input_ts="-",
         columns=None,
@@ -1672,6 +1714,8 @@ def _main():
         dropna="all",
         plotting_position="weibull",
         prob_plot_sort_values="descending",
+        prob_plot_max_points=None,
+        chunksize=None,
         source_units=None,
         target_units=None,
         plot_styles="bright",
@@ -1687,7 +1731,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        norm_xaxis(
+        __getattr__("norm_xaxis")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1720,6 +1764,8 @@ def _main():
             dropna=dropna,
             plotting_position=plotting_position,
             prob_plot_sort_values=prob_plot_sort_values,
+            prob_plot_max_points=prob_plot_max_points,
+            chunksize=chunksize,
             source_units=source_units,
             target_units=target_units,
             plot_styles=plot_styles,
@@ -1735,8 +1781,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("norm_yaxis", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(norm_yaxis)
+    @_command("norm_yaxis")
     def norm_yaxis_cli(
         input_ts="-",
         columns=None,
@@ -1770,6 +1815,8 @@ def _main():
         dropna="all",
         plotting_position="weibull",
         prob_plot_sort_values="descending",
+        prob_plot_max_points=None,
+        chunksize=None,
         source_units=None,
         target_units=None,
         plot_styles="bright",
@@ -1785,7 +1832,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        norm_yaxis(
+        __getattr__("norm_yaxis")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1818,6 +1865,8 @@ def _main():
             dropna=dropna,
             plotting_position=plotting_position,
             prob_plot_sort_values=prob_plot_sort_values,
+            prob_plot_max_points=prob_plot_max_points,
+            chunksize=chunksize,
             source_units=source_units,
             target_units=target_units,
             plot_styles=plot_styles,
@@ -1833,8 +1882,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("probability_density", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(probability_density)
+    @_command("probability_density")
     def probability_density_cli(
         input_ts="-",
         columns=None,
@@ -1882,9 +1930,12 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        bw_method="scott",
+        kde_gridsize=1000,
+        kde_shared_grid=False,
     ):
         """docstring replaced by tsutils.copy_doc"""
-        probability_density(
+        __getattr__("probability_density")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1931,10 +1982,12 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            bw_method=bw_method,
+            kde_gridsize=kde_gridsize,
+            kde_shared_grid=kde_shared_grid,
         )
 
-    @cltoolbox.command("scatter_matrix", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(scatter_matrix)
+    @_command("scatter_matrix")
     def scatter_matrix_cli(
         input_ts="-",
         columns=None,
@@ -1956,6 +2009,8 @@ def _main():
         markerstyles=" ",
         style="auto",
         scatter_matrix_diagonal="kde",
+        scatter_matrix_mode="scatter",
+        scatter_matrix_bins=100,
         grid=False,
         por=False,
         invert_xaxis=False,
@@ -1977,7 +2032,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        scatter_matrix(
+        __getattr__("scatter_matrix")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -1998,6 +2053,8 @@ def _main():
             markerstyles=markerstyles,
             style=style,
             scatter_matrix_diagonal=scatter_matrix_diagonal,
+            scatter_matrix_mode=scatter_matrix_mode,
+            scatter_matrix_bins=scatter_matrix_bins,
             grid=grid,
             por=por,
             invert_xaxis=invert_xaxis,
@@ -2019,8 +2076,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("target", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(target)
+    @_command("target")
     def target_cli(
         obs_col=None,
         sim_col=None,
@@ -2051,7 +2107,7 @@ def _main():
         """docstring replaced by tsutils.copy_doc"""
         obs_col = obs_col or 1
         sim_col = sim_col or 2
-        target(
+        __getattr__("target")(
             obs_col=None,
             sim_col=None,
             input_ts=input_ts,
@@ -2079,8 +2135,7 @@ def _main():
             plot_styles=plot_styles,
         )
 
-    @cltoolbox.command("taylor", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(taylor)
+    @_command("taylor")
     def taylor_cli(
         input_ts="-",
         columns=None,
@@ -2107,7 +2162,7 @@ def _main():
         plot_styles="bright",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        taylor(
+        __getattr__("taylor")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -2133,8 +2188,7 @@ def _main():
             plot_styles=plot_styles,
         )
 
-    @cltoolbox.command("time", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(time)
+    @_command("time")
     def _time_cli(
         input_ts="-",
         columns=None,
@@ -2184,9 +2238,10 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        decimate="auto",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        time(
+        __getattr__("time")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -2235,10 +2290,10 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            decimate=decimate,
         )
 
-    @cltoolbox.command("waterfall", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(waterfall)
+    @_command("waterfall")
     def waterfall_cli(
         input_ts="-",
         columns=None,
@@ -2287,7 +2342,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        waterfall(
+        __getattr__("waterfall")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -2335,8 +2390,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("weibull_xaxis", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(weibull_xaxis)
+    @_command("weibull_xaxis")
     def weibull_xaxis_cli(
         input_ts="-",
         columns=None,
@@ -2370,6 +2424,8 @@ def _main():
         dropna="all",
         plotting_position="weibull",
         prob_plot_sort_values="descending",
+        prob_plot_max_points=None,
+        chunksize=None,
         source_units=None,
         target_units=None,
         plot_styles="bright",
@@ -2385,7 +2441,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        weibull_xaxis(
+        __getattr__("weibull_xaxis")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -2418,6 +2474,8 @@ def _main():
             dropna=dropna,
             plotting_position=plotting_position,
             prob_plot_sort_values=prob_plot_sort_values,
+            prob_plot_max_points=prob_plot_max_points,
+            chunksize=chunksize,
             source_units=source_units,
             target_units=target_units,
             plot_styles=plot_styles,
@@ -2433,8 +2491,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("weibull_yaxis", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(weibull_yaxis)
+    @_command("weibull_yaxis")
     def weibull_yaxis_cli(
         input_ts="-",
         columns=None,
@@ -2468,6 +2525,8 @@ def _main():
         dropna="all",
         plotting_position="weibull",
         prob_plot_sort_values="descending",
+        prob_plot_max_points=None,
+        chunksize=None,
         source_units=None,
         target_units=None,
         plot_styles="bright",
@@ -2483,7 +2542,7 @@ def _main():
         vlines_linestyles="-",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        weibull_yaxis(
+        __getattr__("weibull_yaxis")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -2516,6 +2575,8 @@ def _main():
             dropna=dropna,
             plotting_position=plotting_position,
             prob_plot_sort_values=prob_plot_sort_values,
+            prob_plot_max_points=prob_plot_max_points,
+            chunksize=chunksize,
             source_units=source_units,
             target_units=target_units,
             plot_styles=plot_styles,
@@ -2531,8 +2592,7 @@ def _main():
             vlines_linestyles=vlines_linestyles,
         )
 
-    @cltoolbox.command("xy", formatter_class=RSTHelpFormatter)
-    @tsutils.copy_doc(xy)
+    @_command("xy")
     def xy_cli(
         input_ts="-",
         columns=None,
@@ -2578,9 +2638,10 @@ def _main():
         vlines_ymax=None,
         vlines_colors=None,
         vlines_linestyles="-",
+        decimate="auto",
     ):
         """docstring replaced by tsutils.copy_doc"""
-        xy(
+        __getattr__("xy")(
             input_ts=input_ts,
             columns=columns,
             start_date=start_date,
@@ -2625,6 +2686,7 @@ def _main():
             vlines_ymax=vlines_ymax,
             vlines_colors=vlines_colors,
             vlines_linestyles=vlines_linestyles,
+            decimate=decimate,
         )
 
     cltoolbox.main()
@@ -0,0 +1,26 @@
+import matplotlib
+
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+from pandas.plotting import autocorrelation_plot
+
+from plottoolbox import _acf
+
+
+def test_matches_pandas():
+    values = np.random.default_rng(0).normal(size=500).cumsum()
+    expected = autocorrelation_plot(pd.Series(values), ax=Figure().subplots())
+    result = _acf.autocorrelation_plot(values, Figure().subplots())
+    for line, expected_line in zip(result.get_lines(), expected.get_lines()):
+        np.testing.assert_allclose(line.get_xydata(), expected_line.get_xydata())
+
+
+def test_max_lag_and_missing():
+    values = np.random.default_rng(0).normal(size=1000).cumsum()
+    full = _acf.acf(values)
+    assert len(_acf.acf(values, max_lag=20)) == 20
+    np.testing.assert_allclose(_acf.acf(values, max_lag=20), full[:20])
+    values[::10] = np.nan
+    assert np.isfinite(_acf.acf(values, max_lag=20)).all()
@@ -0,0 +1,74 @@
+import json
+
+from plottoolbox import plottoolbox
+
+
+def test_batch(tmp_path):
+    specs = [
+        {
+            "type": "time",
+            "input_ts": "tests/data_simple.csv",
+            "ofilename": str(tmp_path / "a.png"),
+        },
+        {
+            "type": "time",
+            "input_ts": "tests/data_simple.csv",
+            "ofilename": str(tmp_path / "b.png"),
+        },
+        {"type": "not_a_plot", "ofilename": str(tmp_path / "c.png")},
+    ]
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps(specs))
+
+    reports = plottoolbox.batch(str(manifest), report=str(tmp_path / "report.csv"))
+
+    assert [i["status"] for i in reports] == ["ok", "duplicate", "error"]
+    assert (tmp_path / "a.png").read_bytes() == (tmp_path / "b.png").read_bytes()
+    assert (tmp_path / "report.csv").exists()
+
+
+def test_render_many(tmp_path):
+    specs = [
+        {
+            "type": plottype,
+            "input_ts": "tests/data_simple.csv",
+            "ofilename": str(tmp_path / f"{plottype}.png"),
+        }
+        for plottype in ["time", "kde", "boxplot", "histogram"]
+    ]
+    reports = list(plottoolbox.render_many(specs, workers=2))
+    assert sorted(i["index"] for i in reports) == [0, 1, 2, 3]
+    assert all(i["status"] == "ok" for i in reports)
+
+
+def test_render_many_leaves_other_figures_open(tmp_path):
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure()
+    specs = [
+        {
+            "type": "time",
+            "input_ts": "tests/data_simple.csv",
+            "ofilename": str(tmp_path / "a.png"),
+            "close": False,
+        }
+    ]
+    reports = list(plottoolbox.render_many(specs, workers=1))
+    assert reports[0]["status"] == "ok"
+    assert plt.get_fignums() == [fig.number]
+    plt.close(fig)
+
+
+def test_render_many_keeps_formats(tmp_path):
+    specs = [
+        {
+            "type": "time",
+            "input_ts": "tests/data_simple.csv",
+            "ofilename": str(tmp_path / f"plot.{ext}"),
+        }
+        for ext in ["png", "pdf"]
+    ]
+    reports = list(plottoolbox.render_many(specs, workers=1))
+    assert [i["status"] for i in reports] == ["ok", "ok"]
+    assert (tmp_path / "plot.png").read_bytes()[:4] == b"\x89PNG"
+    assert (tmp_path / "plot.pdf").read_bytes()[:4] == b"%PDF"
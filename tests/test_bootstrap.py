@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from plottoolbox import plottoolbox
+from plottoolbox._functions import bootstrap
+
+
+def test_statistics_match_numpy():
+    samples = np.random.default_rng(0).normal(size=(20, 30))
+    result = bootstrap._statistics(samples, ["mean", "median", "midrange", "p5"])
+    np.testing.assert_allclose(result["mean"], samples.mean(axis=1))
+    np.testing.assert_allclose(result["median"], np.median(samples, axis=1))
+    np.testing.assert_allclose(
+        result["midrange"], (samples.min(axis=1) + samples.max(axis=1)) / 2
+    )
+    np.testing.assert_allclose(result["p5"], np.percentile(samples, 5, axis=1))
+
+
+def test_seed_repeats_whatever_the_block(monkeypatch):
+    values = np.arange(1000.0)
+    first = bootstrap._bootstrap(values, 50, 300, ["mean", "p97.5"], seed=4)
+    monkeypatch.setattr(bootstrap, "BLOCK_VALUES", 77)
+    second = bootstrap._bootstrap(values, 50, 300, ["mean", "p97.5"], seed=4)
+    for statistic in first:
+        np.testing.assert_array_equal(first[statistic], second[statistic])
+
+
+def test_bad_statistic():
+    with pytest.raises(ValueError):
+        bootstrap._check_statistics("mean,p101")
+
+
+def test_plot_statistics():
+    fig = plottoolbox.bootstrap(
+        input_ts="tests/data_sunspot.csv",
+        ofilename=None,
+        bootstrap_statistics="mean,std,p95,max",
+        seed=1,
+        close=False,
+    )
+    assert len(fig.axes) == 8
+    assert fig.axes[-1].get_xlabel() == "Max"
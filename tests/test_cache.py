@@ -0,0 +1,92 @@
+import matplotlib
+
+matplotlib.use("Agg")
+import pandas as pd
+import pytest
+
+from plottoolbox import _cache, _plotutils
+
+calls = []
+
+
+@_cache.render_cache
+def _line(
+    input_ts="-", ofilename="plot.png", title="", plot_styles="bright", close=None
+):
+    calls.append(title)
+    fig = _plotutils.new_figure(ofilename, close)
+    ax = fig.subplots()
+    ax.plot(input_ts.iloc[:, 0])
+    ax.set_title(title)
+    return _plotutils.save_figure(fig, ofilename=ofilename, close=close)
+
+
+def test_render_cache(tmp_path):
+    calls.clear()
+    _cache.configure_render_cache(tmp_path / "cache", maxsize=10**8)
+    try:
+        df = pd.DataFrame({"a": [1.0, 3.0, 2.0]})
+        assert _line(input_ts=df, ofilename=str(tmp_path / "a.png")) is None
+        assert _line(input_ts=df, ofilename=str(tmp_path / "b.png")) is None
+        _line(input_ts=df, ofilename=str(tmp_path / "c.png"), title="other")
+        assert calls == ["", "other"]
+        _line(input_ts=df, ofilename=str(tmp_path / "d.png"), close=False)
+        assert calls == ["", "other", ""]
+        assert (tmp_path / "a.png").read_bytes() == (tmp_path / "b.png").read_bytes()
+        key = _cache.render_key(_line, (), {"input_ts": df, "ofilename": "x.png"})
+        assert _cache.read_png_key(tmp_path / "b.png") == key
+    finally:
+        _cache.configure_render_cache(None)
+
+
+def test_render_key_callables():
+    import numpy as np
+
+    df = pd.DataFrame({"a": [1.0, 3.0, 2.0]})
+
+    def key(reducer):
+        return _cache.render_key(_line, (), {"input_ts": df, "title": reducer})
+
+    assert key(np.mean) is not None
+    assert key(np.mean) == key(np.mean) != key(np.median)
+    assert key(lambda x: x) is None
+
+
+def test_render_cache_eviction(tmp_path):
+    _cache.configure_render_cache(tmp_path / "cache", maxsize=1)
+    try:
+        df = pd.DataFrame({"a": [1.0, 3.0, 2.0]})
+        _line(input_ts=df, ofilename=str(tmp_path / "a.png"))
+        assert (tmp_path / "a.png").exists()
+        assert not list((tmp_path / "cache").glob("*.png"))
+    finally:
+        _cache.configure_render_cache(None)
+
+
+def test_input_cache():
+    from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+    _cache.clear_input_cache()
+    first = _cache.common_kwds("tests/data_simple.csv", pick=[1], dropna="all")
+    second = _cache.common_kwds("tests/data_simple.csv", dropna="all")
+    assert len(_cache._input_cache) == 1
+    pd.testing.assert_frame_equal(
+        first, tsutils.common_kwds("tests/data_simple.csv", pick=[1], dropna="all")
+    )
+    pd.testing.assert_frame_equal(
+        second, tsutils.common_kwds("tests/data_simple.csv", dropna="all")
+    )
+
+
+def test_sidecar_cache(tmp_path):
+    pytest.importorskip("pyarrow")
+    _cache.configure_sidecar_cache(str(tmp_path))
+    _cache.configure_input_cache(0)
+    try:
+        first = _cache.common_kwds("tests/data_simple.csv")
+        assert len(list(tmp_path.glob("*.feather"))) == 1
+        second = _cache.common_kwds("tests/data_simple.csv")
+        pd.testing.assert_frame_equal(first, second)
+    finally:
+        _cache.configure_sidecar_cache(None)
+        _cache.configure_input_cache()
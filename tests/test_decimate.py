@@ -0,0 +1,108 @@
+import matplotlib
+
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+import pytest
+from matplotlib.figure import Figure
+
+from plottoolbox import _decimate
+
+
+def _trace(n=100000):
+    rng = np.random.default_rng(0)
+    x = np.arange(n, dtype="float64")
+    y = rng.standard_normal(n).cumsum()
+    y[1000:2000] = np.nan
+    y[54321] = 1e6
+    return x, y
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_keeps_peaks_and_gaps(method):
+    x, y = _trace()
+    keep = _decimate._indices(method, x, y, 500)
+    assert len(keep) < len(x) // 10
+    assert {0, len(x) - 1, 54321, 1000} <= set(keep)
+    assert np.isnan(y[keep]).sum() == 1
+
+
+def test_minmax_envelope():
+    x, y = _trace()
+    keep = _decimate.minmax_indices(x, y, 500)
+    bins = _decimate._bins(x, (np.nan, np.nan), 500)
+    full = pd.Series(y).groupby(bins).agg(["min", "max"]).dropna()
+    kept = pd.Series(y[keep]).groupby(bins[keep]).agg(["min", "max"]).dropna()
+    pd.testing.assert_frame_equal(full, kept)
+
+
+def test_decimate_frame_keeps_period_axis():
+    index = pd.date_range("2000-01-01", periods=100000, freq="min")
+    tsd = pd.DataFrame({"a": _trace()[1]}, index=index)
+    ax = Figure().subplots()
+    reduced = _decimate.decimate_frame(tsd, ax, "auto")
+    assert len(reduced) < len(tsd) // 10
+    assert isinstance(reduced.index, pd.PeriodIndex)
+    assert _decimate.decimate_frame(tsd, ax, None) is tsd
+    with pytest.raises(ValueError):
+        _decimate.decimate_frame(tsd, ax, "every_other")
+
+
+@pytest.mark.parametrize("method", ["minmax", "lttb"])
+def test_decimate_frame_keeps_xlim_window(method):
+    index = pd.date_range("2000-01-01", periods=100000, freq="min")
+    tsd = pd.DataFrame({"a": _trace()[1]}, index=index)
+    ax = Figure().subplots()
+    xlim = ["2000-01-10", "2000-01-10 06:00"]
+    reduced = _decimate.decimate_frame(tsd, ax, method, xlim=xlim)
+    window = reduced.index.to_timestamp()
+    inside = (window >= xlim[0]) & (window <= xlim[1])
+    assert inside.sum() > 300
+    if method == "minmax":
+        assert inside.sum() == 361
+
+
+def test_decimate_lines_log_axis_and_markers():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.exponential(size=200000))
+    ax = Figure().subplots()
+    line = ax.plot(x, x**2)[0]
+    dots = ax.plot(rng.random(200000), rng.random(200000), "o")[0]
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    _decimate.decimate_lines(ax, "auto")
+    kept = line.get_xdata()
+    assert len(kept) < 20000
+    assert kept[0] == x[0] and kept[-1] == x[-1]
+    assert len(dots.get_xdata()) <= np.prod(_decimate._pixel_size(ax)) + 2
+
+
+def test_time_keeps_all_points_when_open(tmp_path):
+    from plottoolbox import plottoolbox
+
+    index = pd.date_range("2000-01-01", periods=100000, freq="min")
+    pd.DataFrame({"a": _trace()[1]}, index=index).to_csv(tmp_path / "long.csv")
+    kwds = {"input_ts": str(tmp_path / "long.csv"), "ofilename": None}
+    fig = plottoolbox.time(close=False, **kwds)
+    # The missing values are dropped by the default dropna="all".
+    assert len(fig.axes[0].lines[0].get_xdata()) == np.isfinite(_trace()[1]).sum()
+    fig = plottoolbox.time(close=True, **kwds)
+    assert len(fig.axes[0].lines[0].get_xdata()) < 10000
+    import matplotlib.pyplot as plt
+
+    plt.close("all")
+
+
+def test_xy_keeps_all_points_when_open(tmp_path):
+    import matplotlib.pyplot as plt
+
+    from plottoolbox import plottoolbox
+
+    x, y = _trace()
+    pd.DataFrame({"x": x, "y": np.nan_to_num(y)}).to_csv(tmp_path / "xy.csv")
+    kwds = {"input_ts": str(tmp_path / "xy.csv"), "ofilename": None}
+    fig = plottoolbox.xy(index_type="number", close=False, **kwds)
+    assert len(fig.axes[0].lines[0].get_xdata()) == len(x)
+    fig = plottoolbox.xy(index_type="number", close=True, **kwds)
+    assert len(fig.axes[0].lines[0].get_xdata()) < len(x) // 10
+    plt.close("all")
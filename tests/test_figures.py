@@ -0,0 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.figure
+import matplotlib.pyplot as plt
+import pytest
+
+from plottoolbox import plottoolbox
+
+
+@pytest.mark.parametrize(
+    "plottype", ["time", "kde", "probability_density", "boxplot", "scatter_matrix"]
+)
+def test_one_figure(plottype):
+    plt.close("all")
+    getattr(plottoolbox, plottype)(
+        input_ts="tests/data_daily_sample.csv", columns=[2, 3], ofilename=None
+    )
+    assert len(plt.get_fignums()) == 1
+    plt.close("all")
+
+
+@pytest.mark.parametrize("plottype", ["time", "kde", "probability_density"])
+def test_subplots_titles(plottype):
+    fig = getattr(plottoolbox, plottype)(
+        input_ts="tests/data_daily_sample.csv",
+        columns=[2, 3],
+        subplots=True,
+        title="TITLE",
+        xtitle="XT",
+        ofilename=None,
+        close=True,
+    )
+    assert [ax.get_title() for ax in fig.axes] == ["", "TITLE"]
+    assert fig.axes[-1].get_xlabel() == "XT"
+
+
+def test_close_after_save(tmp_path):
+    plt.close("all")
+    plottoolbox.time(
+        input_ts="tests/data_daily_sample.csv", ofilename=str(tmp_path / "a.png")
+    )
+    assert plt.get_fignums() == []
+    plottoolbox.time(
+        input_ts="tests/data_daily_sample.csv",
+        ofilename=str(tmp_path / "b.png"),
+        close=False,
+    )
+    assert len(plt.get_fignums()) == 1
+    plt.close("all")
+
+
+def test_closed_figure_not_in_pyplot():
+    plt.close("all")
+    fig = plottoolbox.time(
+        input_ts="tests/data_daily_sample.csv", ofilename=None, close=True
+    )
+    assert isinstance(fig, matplotlib.figure.Figure)
+    assert fig.canvas.manager is None
+    assert plt.get_fignums() == []
+
+
+def test_threads(tmp_path):
+    def render(name, plot_styles):
+        ofilename = str(tmp_path / f"{name}.png")
+        plottoolbox.time(
+            input_ts="tests/data_daily_sample.csv",
+            ofilename=ofilename,
+            plot_styles=plot_styles,
+        )
+        return open(ofilename, "rb").read()
+
+    styles = ["classic", "ggplot"] * 4
+    serial = [render(f"s{i}", style) for i, style in enumerate(styles)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(render, [f"t{i}" for i in range(len(styles))], styles))
+    assert threaded == serial
+    assert plt.get_fignums() == []
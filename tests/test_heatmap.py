@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from plottoolbox._functions import heatmap
+
+
+def test_daily_cells_leap_days():
+    index = pd.date_range("1999-12-30", "2001-01-02", freq="D").delete(5)
+    series = pd.Series(np.arange(len(index), dtype="float64"), index=index)
+    keys = heatmap._cell_keys(index, "daily")
+    byear, years = heatmap._cell_image(keys, series.to_numpy(), "daily")
+    assert byear == 1999
+    assert years.shape == (3, 366)
+    assert years[0, 363] == 0
+    assert np.isnan(years[0, 365])
+    assert years[1, 59] == series["2000-02-29"]
+    assert years[1, 365] == series["2000-12-31"]
+    assert np.isnan(years[1, 3])
+    assert years[2, 1] == series.iloc[-1]
+    assert np.isfinite(years).sum() == len(series)
+
+
+def test_hourly_cells():
+    index = pd.date_range("1969-12-31 22:00", periods=5, freq="h")
+    keys = heatmap._cell_keys(index, "hourly")
+    first, image = heatmap._cell_image(keys, np.arange(5.0), "hourly")
+    assert first == -1
+    assert image.shape == (24, 2)
+    np.testing.assert_array_equal(image[22:, 0], [0, 1])
+    np.testing.assert_array_equal(image[:3, 1], [2, 3, 4])
+
+
+def test_chunked_date_window(tmp_path):
+    index = pd.date_range("2000-01-01", periods=3000, freq="D")
+    tsd = pd.DataFrame({"a": np.arange(3000.0)}, index=index)
+    tsd.index.name = "Datetime"
+    tsd.to_csv(tmp_path / "daily.csv")
+    kwds = {
+        "input_ts": str(tmp_path / "daily.csv"),
+        "start_date": "2005-01-01",
+        "end_date": "2006-12-31",
+        "ofilename": None,
+        "close": True,
+    }
+    whole = heatmap.heatmap(**kwds)
+    chunked = heatmap.heatmap(chunksize=100, **kwds)
+    np.testing.assert_array_equal(
+        whole.axes[0].images[0].get_array(), chunked.axes[0].images[0].get_array()
+    )
@@ -0,0 +1,67 @@
+import matplotlib
+import numpy as np
+import pytest
+
+from plottoolbox._functions import hexbin
+
+matplotlib.use("Agg")
+
+
+def test_hex_index_matches_matplotlib():
+    import matplotlib.pyplot as plt
+
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=(2, 20000))
+    size = hexbin._hex_size(30)
+    extent = hexbin._hex_extent(x, y)
+    index = hexbin._hex_index(x, y, extent, size)
+    counts = np.bincount(
+        index[index >= 0], minlength=len(hexbin._hex_centers(extent, size)[0])
+    )
+
+    fig, ax = plt.subplots()
+    expected = ax.hexbin(x, y, gridsize=30).get_array()
+    plt.close(fig)
+    np.testing.assert_array_equal(counts, expected)
+
+
+@pytest.mark.parametrize(
+    "reduce_C_function, name",
+    [
+        (np.mean, "mean"),
+        ("np.max", "max"),
+        ("amin", "min"),
+        (len, "count"),
+        (sum, None),
+    ],
+)
+def test_reducer_name(reduce_C_function, name):
+    assert hexbin._reducer_name(reduce_C_function) == name
+
+
+def test_extent_of_one_value():
+    assert hexbin._hex_extent([2.0, 2.0], [0.0]) == (1.8, 2.2, -0.1, 0.1)
+
+
+def test_chunked_date_window(tmp_path):
+    import pandas as pd
+
+    index = pd.date_range("2000-01-01", periods=3000, freq="D")
+    rng = np.random.default_rng(1)
+    tsd = pd.DataFrame(rng.normal(size=(3000, 3)), index=index, columns=list("xyc"))
+    tsd.index.name = "Datetime"
+    tsd.to_csv(tmp_path / "points.csv")
+    kwds = {
+        "input_ts": str(tmp_path / "points.csv"),
+        "start_date": "2005-01-01",
+        "end_date": "2006-12-31",
+        "gridsize": 10,
+        "ofilename": None,
+        "close": True,
+    }
+    whole = hexbin.hexbin(**kwds)
+    chunked = hexbin.hexbin(chunksize=100, **kwds)
+    np.testing.assert_allclose(
+        whole.axes[0].collections[0].get_array(),
+        chunked.axes[0].collections[0].get_array(),
+    )
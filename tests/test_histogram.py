@@ -0,0 +1,23 @@
+import numpy as np
+
+from plottoolbox._functions import histogram
+
+
+def test_counts_match_numpy_histogram():
+    values = np.random.default_rng(0).normal(size=(10000, 3))
+    values[::7, 1] = np.nan
+    for bins in (10, [-2, -0.5, 0, 0.25, 3]):
+        edges = histogram._edges(bins, np.nanmin(values), np.nanmax(values))
+        counts = histogram._counts(values, edges)
+        for column in range(3):
+            expected = np.histogram(values[:, column], bins=edges)[0]
+            np.testing.assert_array_equal(counts[column], expected)
+
+
+def test_counts_add_over_blocks():
+    values = np.random.default_rng(1).normal(size=(1000, 2))
+    edges = histogram._edges(20, values.min(), values.max())
+    blocks = sum(
+        histogram._counts(values[i : i + 300], edges) for i in (0, 300, 600, 900)
+    )
+    np.testing.assert_array_equal(blocks, histogram._counts(values, edges))
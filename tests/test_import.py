@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+
+def test_lazy_import():
+    code = (
+        "import sys, plottoolbox; "
+        "assert 'matplotlib' not in sys.modules; "
+        "assert 'plottoolbox._functions.taylor' not in sys.modules; "
+        "plottoolbox.time; "
+        "assert 'plottoolbox._functions.time' in sys.modules; "
+        "assert 'plottoolbox._functions.taylor' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_lazy_cli_help():
+    code = (
+        "import sys\n"
+        "from plottoolbox import plottoolbox\n"
+        "sys.argv = ['plottoolbox', '--help']\n"
+        "try:\n"
+        "    plottoolbox._main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'matplotlib' not in sys.modules\n"
+        "assert 'plottoolbox._functions.time' not in sys.modules\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    assert "Time-series plot." in out.stdout
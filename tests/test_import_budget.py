@@ -0,0 +1,187 @@
+"""
+Import time and command line start up budgets
+---------------------------------------------
+
+Measures `python -X importtime` for the package, each plot module, and the
+wall time of `plottoolbox --help` and `plottoolbox time --help`, and fails if
+any exceeds its budget in tests/import_budget.json.  Plot modules whose
+optional dependencies are not installed are skipped.
+
+Wall times depend on the machine, so the test only runs when the
+PLOTTOOLBOX_IMPORT_BUDGET environment variable is set::
+
+    PLOTTOOLBOX_IMPORT_BUDGET=1 pytest tests/test_import_budget.py
+
+Can also be run as a script to save the results::
+
+    python tests/test_import_budget.py --output import_times.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+BUDGET_FILE = Path(__file__).parent / "import_budget.json"
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("PLOTTOOLBOX_IMPORT_BUDGET"),
+    reason="set PLOTTOOLBOX_IMPORT_BUDGET to measure import times",
+)
+
+MODULES = [
+    "autocorrelation",
+    "bar",
+    "bar_stacked",
+    "barh",
+    "barh_stacked",
+    "batch",
+    "bootstrap",
+    "boxplot",
+    "double_mass",
+    "handh",
+    "heatmap",
+    "hexbin",
+    "histogram",
+    "kde",
+    "kde_time",
+    "lag_plot",
+    "lognorm_xaxis",
+    "lognorm_yaxis",
+    "norm_xaxis",
+    "norm_yaxis",
+    "probability_density",
+    "scatter_matrix",
+    "target",
+    "taylor",
+    "time",
+    "waterfall",
+    "weibull_xaxis",
+    "weibull_yaxis",
+    "xy",
+]
+
+CLI_HELP = (
+    "import sys\n"
+    "from plottoolbox import plottoolbox\n"
+    "sys.argv = {argv}\n"
+    "try:\n"
+    "    plottoolbox._main()\n"
+    "except SystemExit:\n"
+    "    pass\n"
+)
+
+
+def importtime(module, top=10):
+    """Return the cumulative import time of module and the slowest imports.
+
+    Times are in seconds from `python -X importtime` in a fresh interpreter.
+    Returns None if an optional dependency of the module is not installed.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode and "ModuleNotFoundError" in proc.stderr:
+        return None
+    proc.check_returncode()
+    imports = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        imports.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6))
+    total = [i[2] for i in imports if i[0] == module][-1]
+    slowest = sorted(imports, key=lambda i: i[1], reverse=True)[:top]
+    return {
+        "seconds": total,
+        "slowest": [{"module": i[0], "self_seconds": i[1]} for i in slowest],
+    }
+
+
+def cli_help(name):
+    """Return the wall time of `plottoolbox [subcommand] --help`.
+
+    The name is "cli --help" or "cli SUBCOMMAND --help" and the command line
+    is run in a fresh interpreter.
+    """
+    argv = ["plottoolbox"] + name.split()[1:]
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", CLI_HELP.format(argv=argv)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return {"seconds": time.perf_counter() - start}
+
+
+def measure(repeat=3):
+    """Measure all import times, keeping the fastest of `repeat` runs.
+
+    Modules that cannot be imported are left out.
+    """
+    measurements = {
+        "plottoolbox": importtime,
+        "cli --help": cli_help,
+        "cli time --help": cli_help,
+    }
+    measurements.update({f"plottoolbox._functions.{i}": importtime for i in MODULES})
+    results = {}
+    for name, func in measurements.items():
+        runs = [func(name) for _ in range(repeat)]
+        if None not in runs:
+            results[name] = min(runs, key=lambda i: i["seconds"])
+    return results
+
+
+def over_budget(results, budgets):
+    """Return a list of (name, seconds, budget) that exceed their budget."""
+    return [
+        (name, result["seconds"], budgets.get(name, budgets["default"]))
+        for name, result in results.items()
+        if result["seconds"] > budgets.get(name, budgets["default"])
+    ]
+
+
+def test_import_budget():
+    budgets = json.loads(BUDGET_FILE.read_text())
+    results = measure(repeat=1)
+    if over := over_budget(results, budgets):
+        pytest.fail(
+            "\n".join(
+                f"{name} took {seconds:.3f} s, budget is {budget:.3f} s"
+                for name, seconds, budget in over
+            )
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", help="JSON file to save the results.")
+    parser.add_argument(
+        "--budget", default=BUDGET_FILE, help="JSON file with budgets in seconds."
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    budgets = json.loads(Path(args.budget).read_text())
+    results = measure(repeat=args.repeat)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    for name, result in results.items():
+        print(f"{result['seconds']:8.3f}  {name}")
+    over = over_budget(results, budgets)
+    for name, seconds, budget in over:
+        print(f"OVER BUDGET: {name} took {seconds:.3f} s, budget is {budget:.3f} s")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
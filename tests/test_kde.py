@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import gaussian_kde
+
+from plottoolbox import _kde
+
+
+@pytest.mark.parametrize("bw_method", ["scott", "silverman", 0.3])
+def test_matches_gaussian_kde(bw_method):
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.normal(size=3000), rng.normal(5, 0.5, size=1000)])
+    grid = np.linspace(*_kde.grid_range(values), 1000)
+    expected = gaussian_kde(values, bw_method=bw_method)(grid)
+    result = _kde.density(values, grid, _kde.bandwidth(values, bw_method))
+    np.testing.assert_allclose(result, expected, atol=1e-4 * expected.max())
+
+
+def test_isj_narrower_for_bimodal():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.normal(size=3000), rng.normal(8, 1, size=3000)])
+    assert _kde.bandwidth(values, "isj") < _kde.bandwidth(values, "silverman") / 2
+    with pytest.raises(ValueError):
+        _kde.bandwidth(values, "wide")
+
+
+def test_kde_frame_grids():
+    rng = np.random.default_rng(0)
+    tsd = pd.DataFrame({"a": rng.normal(size=1000), "b": rng.normal(10, size=1000)})
+    density = _kde.kde_frame(tsd, gridsize=200)
+    assert density["a"].notna().sum() >= 200
+    assert density["a"].isna().any()
+    shared = _kde.kde_frame(tsd, gridsize=200, shared_grid=True)
+    assert shared.shape == (200, 2)
+    assert shared.notna().all().all()
+
+
+def test_density_on_part_of_range():
+    values = np.random.default_rng(0).normal(size=5000)
+    grid = np.linspace(0.5, 1.5, 300)
+    expected = gaussian_kde(values)(grid)
+    (result,) = _kde.densities([values], [grid])
+    np.testing.assert_allclose(result, expected, atol=1e-4 * expected.max())
@@ -0,0 +1,14 @@
+import numpy as np
+
+from plottoolbox._functions import lag_plot
+
+
+def test_lag_histograms_match_histogram2d():
+    values = np.random.default_rng(0).normal(size=10000).cumsum()
+    values[::100] = np.nan
+    edges, counts = lag_plot._lag_histograms(values, [1, 7], 50)
+    for lag, count in zip([1, 7], counts):
+        first, second = values[:-lag], values[lag:]
+        valid = np.isfinite(first) & np.isfinite(second)
+        expected = np.histogram2d(first[valid], second[valid], bins=[edges, edges])[0]
+        np.testing.assert_array_equal(count, expected)
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import norm
+
+from plottoolbox import _probability
+from plottoolbox.toolbox_utils.src.toolbox_utils import tsutils
+
+
+def test_thin_keeps_tails():
+    values = np.random.default_rng(0).lognormal(size=100000)
+    full_x, full_y = _probability.probability_points(values, norm.ppf)
+    x, y = _probability.probability_points(values, norm.ppf, max_points=2000)
+    assert len(x) <= 2000
+    np.testing.assert_array_equal(y[:500], full_y[:500])
+    np.testing.assert_array_equal(y[-500:], full_y[-500:])
+    assert np.all(np.diff(y) <= 0)
+    assert np.all(np.isin(x, full_x))
+
+
+def test_no_thin():
+    values = np.arange(10.0)
+    x, y = _probability.probability_points(
+        values, norm.ppf, sort_values="ascending", max_points=100
+    )
+    np.testing.assert_array_equal(y, values)
+    assert len(x) == 10
+
+
+@pytest.mark.parametrize("plotting_position", ["weibull", "hazen", "california", 0.2])
+def test_plotting_positions(plotting_position):
+    ranks = np.array([0, 5, 999])
+    np.testing.assert_allclose(
+        _probability.plotting_positions(1000, plotting_position, ranks),
+        tsutils.set_plotting_position(1000, plotting_position)[ranks],
+    )
+
+
+def test_merge_select():
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 1000, size=100000).astype("float64")
+    runs = [np.sort(i) for i in np.array_split(values, 7)]
+    ranks = np.unique(rng.integers(0, len(values), size=500))
+    np.testing.assert_array_equal(
+        _probability.merge_select(runs, ranks, blocksize=1000),
+        np.sort(values)[ranks],
+    )
+
+
+def test_chunked_matches_in_memory(tmp_path):
+    index = pd.date_range("2000-01-01", periods=50000, freq="15min")
+    rng = np.random.default_rng(0)
+    tsd = pd.DataFrame(
+        {"a": rng.lognormal(size=50000), "b": rng.normal(size=50000)}, index=index
+    )
+    tsd.iloc[::7, 1] = np.nan
+    tsd.to_csv(tmp_path / "input.csv")
+    _, runs = _probability.read_input(str(tmp_path / "input.csv"), chunksize=4096)
+    for column, column_runs in zip(tsd.columns, runs):
+        expected = _probability.probability_points(
+            tsd[column].dropna(), norm.ppf, max_points=2000
+        )
+        result = _probability.probability_points(column_runs, norm.ppf, max_points=2000)
+        np.testing.assert_allclose(result, expected)
@@ -0,0 +1,37 @@
+import matplotlib
+
+matplotlib.use("Agg")
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+from plottoolbox._functions import scatter_matrix
+
+
+def test_density_matrix():
+    rng = np.random.default_rng(0)
+    tsd = pd.DataFrame(rng.normal(size=(5000, 3)), columns=["a", "b", "c"])
+    tsd.iloc[::7, 1] = np.nan
+    axes = scatter_matrix._density_matrix(Figure(), tsd, "kde", 20)
+    assert axes.shape == (3, 3)
+    mesh = axes[1, 0].collections[0]
+    valid = tsd[["a", "b"]].dropna()
+    edges = [np.histogram_bin_edges(tsd[i].dropna(), bins=20) for i in "ab"]
+    expected = np.histogram2d(valid["b"], valid["a"], bins=[edges[1], edges[0]])[0]
+    np.testing.assert_array_equal(mesh.get_array().filled(0).reshape(20, 20), expected)
+    assert axes[0, 1].get_xlim() == axes[1, 1].get_xlim()
+
+
+def test_bad_mode_leaves_no_figure():
+    import matplotlib.pyplot as plt
+    import pytest
+
+    plt.close("all")
+    with pytest.raises(ValueError):
+        scatter_matrix.scatter_matrix(
+            input_ts="tests/data_daily_sample.csv",
+            scatter_matrix_mode="hexagons",
+            ofilename=None,
+            close=False,
+        )
+    assert plt.get_fignums() == []
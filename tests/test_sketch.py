@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from matplotlib import cbook
+
+from plottoolbox import _sketch
+
+
+def test_quantiles_exact_until_full():
+    values = np.random.default_rng(0).normal(size=_sketch.SKETCH_SIZE)
+    sketch = _sketch.QuantileSketch()
+    sketch.update(values)
+    q = [0, 0.1, 0.25, 0.5, 0.9, 1]
+    np.testing.assert_allclose(sketch.quantile(q), np.quantile(values, q))
+
+
+def test_quantiles_in_bounded_memory():
+    values = np.random.default_rng(1).lognormal(size=1_000_000)
+    sketch = _sketch.QuantileSketch()
+    for block in np.array_split(values, 7):
+        sketch.update(block)
+    assert sum(len(level) for level in sketch.levels) < 10 * _sketch.SKETCH_SIZE
+    q = np.linspace(0.01, 0.99, 99)
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(q)) / len(values)
+    np.testing.assert_allclose(ranks, q, atol=0.005)
+
+
+@pytest.mark.parametrize("nvalues", [1, 500, 3000])
+def test_box_stats_match_matplotlib(nvalues):
+    values = np.random.default_rng(2).standard_t(3, size=nvalues)
+    box = _sketch.BoxSketch()
+    box.update(np.append(values, np.nan))
+    stats = box.stats()
+    expected = cbook.boxplot_stats(values)[0]
+    for key in ("mean", "q1", "med", "q3", "whislo", "whishi"):
+        assert stats[key] == pytest.approx(expected[key])
+    np.testing.assert_allclose(np.sort(stats["fliers"]), np.sort(expected["fliers"]))
+
+
+def test_box_stats_keep_the_extremes():
+    values = np.random.default_rng(3).standard_t(3, size=200_000)
+    box = _sketch.BoxSketch()
+    for block in np.array_split(values, 4):
+        box.update(block)
+    stats = box.stats()
+    expected = cbook.boxplot_stats(values)[0]
+    assert stats["med"] == pytest.approx(expected["med"], abs=0.01)
+    assert stats["fliers"].max() == values.max()
+    assert stats["fliers"].min() == values.min()
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from plottoolbox import _stream
+
+
+@pytest.mark.parametrize("reducer", _stream.REDUCERS)
+def test_binned_reducer_matches_resample(reducer):
+    index = pd.date_range("2000-01-01", periods=5000, freq="37min")
+    rng = np.random.default_rng(0)
+    tsd = pd.DataFrame(rng.normal(size=(5000, 3)), index=index)
+    tsd.iloc[100:2000, 1] = np.nan
+    keys = (index - index[0]) // pd.Timedelta(days=1)
+    cells = _stream.BinnedReducer(3, reducer, value_range=(-5, 5))
+    # Blocks out of order make the bins grow in both directions.
+    for start in (3000, 0, 1000, 4000, 2000):
+        block = slice(start, start + 1000)
+        cells.add(keys[block], tsd.iloc[block].to_numpy())
+    found_keys, found = cells.result()
+    resampled = tsd.resample("D")
+    if reducer == "std":
+        expected = resampled.std(ddof=0)
+    elif reducer == "median":
+        expected = resampled.agg(
+            lambda v: np.sort(v.dropna())[(v.count() - 1) // 2] if v.count() else np.nan
+        )
+    else:
+        expected = getattr(resampled, reducer)()
+    expected = expected.where(resampled.count() > 0)
+    np.testing.assert_array_equal(found_keys, np.arange(len(expected)))
+    if reducer == "median":
+        # Within one of the MEDIAN_BINS bins of the lower middle value.
+        tolerance = 10 / _stream.MEDIAN_BINS
+        np.testing.assert_allclose(found.T, expected.to_numpy(), atol=tolerance)
+    else:
+        np.testing.assert_allclose(found.T, expected.to_numpy())